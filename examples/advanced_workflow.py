@@ -16,16 +16,18 @@ Requirements:
     - VNC server running on localhost:5900
 """
 
-from vnc_agent_bridge import VNCAgentBridge
+import random
 import time
 
 
 def example_1_form_filling():
     """Example: Fill out an online form."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("Example 1: Form Filling Workflow")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Wait for page to load
         time.sleep(1)
 
@@ -62,10 +64,12 @@ def example_1_form_filling():
 
 def example_2_file_operations():
     """Example: Open, edit, and save a file."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 2: File Operations")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Open File menu (Ctrl+O)
         vnc.keyboard.hotkey("ctrl", "o", delay=0.5)
         print("✓ Opened File dialog")
@@ -73,7 +77,7 @@ def example_2_file_operations():
         time.sleep(0.5)
 
         # Type filename
-        vnc.keyboard.type_text("document.txt", delay=0.05)
+        vnc.keyboard.type_text("document.txt")
         print("✓ Typed filename")
 
         # Press Enter to open
@@ -84,7 +88,7 @@ def example_2_file_operations():
 
         # Click in text area and type content
         vnc.mouse.left_click(400, 300, delay=0.3)
-        vnc.keyboard.type_text("This is the content of the document.", delay=0.05)
+        vnc.keyboard.type_text("This is the content of the document.")
         print("✓ Typed content")
 
         time.sleep(0.5)
@@ -96,10 +100,12 @@ def example_2_file_operations():
 
 def example_3_web_navigation():
     """Example: Navigate a website."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 3: Web Navigation")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Click on address bar (Ctrl+L)
         vnc.keyboard.hotkey("ctrl", "l", delay=0.3)
         print("✓ Selected address bar")
@@ -129,14 +135,17 @@ def example_3_web_navigation():
 
 def example_4_realistic_timing():
     """Example: Operations with realistic human-like timing."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 4: Realistic Timing")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Slow deliberate movements (like careful typing)
         print("Typing slowly and deliberately...")
-        for char in "Careful input":
-            vnc.keyboard.press_key(char, delay=0.1)
+        text = "Careful input"
+        pauses = [min(max(random.gauss(0.1, 0.02), 0.03), 0.3) for _ in text]
+        vnc.keyboard.type_text(text, interval=pauses)
         print("✓ Slow deliberate typing")
 
         time.sleep(0.5)
@@ -155,39 +164,39 @@ def example_4_realistic_timing():
 
 def example_5_complex_sequence():
     """Example: Complex multi-step sequence."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 5: Complex Sequence")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
-        # Step 1: Select all text
-        vnc.keyboard.hotkey("ctrl", "a", delay=0.2)
-        print("✓ Step 1: Selected all")
-
-        # Step 2: Copy selected text
-        vnc.keyboard.hotkey("ctrl", "c", delay=0.2)
-        print("✓ Step 2: Copied")
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
+        # Steps 1-2: Select all text and copy it in one write
+        with vnc.keyboard.sequence():
+            vnc.keyboard.hotkey("ctrl", "a")
+            vnc.keyboard.hotkey("ctrl", "c")
+        print("✓ Steps 1-2: Selected all and copied")
 
         # Step 3: Open new window or field
         vnc.keyboard.hotkey("ctrl", "n", delay=0.5)
         print("✓ Step 3: Opened new")
 
-        time.sleep(0.5)
-
-        # Step 4: Paste text
-        vnc.keyboard.hotkey("ctrl", "v", delay=0.2)
-        print("✓ Step 4: Pasted")
+        time.sleep(0.5)  # Let the new window appear before pasting
 
-        # Step 5: Save
-        vnc.keyboard.hotkey("ctrl", "s", delay=0.3)
-        print("✓ Step 5: Saved")
+        # Steps 4-5: Paste text and save in one write
+        with vnc.keyboard.sequence():
+            vnc.keyboard.hotkey("ctrl", "v")
+            vnc.keyboard.hotkey("ctrl", "s")
+        print("✓ Steps 4-5: Pasted and saved")
 
 
 def example_6_drag_and_drop():
     """Example: Drag and drop operations."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 6: Drag and Drop")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Move to source
         vnc.mouse.move_to(100, 100, delay=0.3)
         print("✓ Positioned at source")
@@ -206,46 +215,58 @@ def example_6_drag_and_drop():
 
 def example_7_keyboard_shortcuts():
     """Example: Common keyboard shortcuts."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 7: Keyboard Shortcuts")
     print("-" * 50)
 
-    shortcuts = [
-        ("Ctrl+Z", "ctrl", "z", "Undo"),
-        ("Ctrl+Y", "ctrl", "y", "Redo"),
-        ("Ctrl+X", "ctrl", "x", "Cut"),
-        ("Ctrl+C", "ctrl", "c", "Copy"),
-        ("Ctrl+V", "ctrl", "v", "Paste"),
-        ("Ctrl+S", "ctrl", "s", "Save"),
-        ("Ctrl+P", "ctrl", "p", "Print"),
-        ("Ctrl+F", "ctrl", "f", "Find"),
-        ("Alt+Tab", "alt", "tab", "Switch window"),
-    ]
-
-    with VNCAgentBridge("localhost", port=5900) as vnc:
-        for shortcut_name, *keys in shortcuts:
-            vnc.keyboard.hotkey(*keys, delay=0.2)
-            print(f"✓ {shortcut_name}")
+    # Parallel tuples: one entry per shortcut
+    names = (
+        "Ctrl+Z",
+        "Ctrl+Y",
+        "Ctrl+X",
+        "Ctrl+C",
+        "Ctrl+V",
+        "Ctrl+S",
+        "Ctrl+P",
+        "Ctrl+F",
+        "Alt+Tab",
+    )
+    modifiers = ("ctrl",) * 8 + ("alt",)
+    keys = ("z", "y", "x", "c", "v", "s", "p", "f", "tab")
+    descriptions = (
+        "Undo",
+        "Redo",
+        "Cut",
+        "Copy",
+        "Paste",
+        "Save",
+        "Print",
+        "Find",
+        "Switch window",
+    )
+
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
+        vnc.keyboard.hotkey_batch(list(zip(modifiers, keys)))
+        for name, description in zip(names, descriptions):
+            print(f"✓ {name} ({description})")
 
 
 def example_8_scroll_operations():
     """Example: Scrolling with positioning."""
+    from vnc_agent_bridge import VNCAgentBridge
+
     print("\nExample 8: Scroll Operations")
     print("-" * 50)
 
-    with VNCAgentBridge("localhost", port=5900) as vnc:
+    with VNCAgentBridge.shared("localhost", port=5900) as vnc:
         # Scroll at center of screen
         vnc.scroll.scroll_to(400, 300)
         print("✓ Scrolled at center (400, 300)")
 
-        # Scroll up progressively
-        for i in range(3):
-            vnc.scroll.scroll_up(amount=2, delay=0.2)
-            print(f"✓ Scroll up iteration {i+1}")
-
-        # Scroll down progressively
-        for i in range(3):
-            vnc.scroll.scroll_down(amount=2, delay=0.2)
-            print(f"✓ Scroll down iteration {i+1}")
+        # Scroll up then back down in a single write
+        vnc.scroll.batch([("up", 2)] * 3 + [("down", 2)] * 3)
+        print("✓ Scrolled up 6 ticks and back down 6 ticks")
 
 
 if __name__ == "__main__":
@@ -256,15 +277,19 @@ if __name__ == "__main__":
     # Note: These examples require a real VNC server running
     # and visible applications to interact with
 
-    # Uncomment to run examples:
-    # example_1_form_filling()
-    # example_2_file_operations()
-    # example_3_web_navigation()
-    # example_4_realistic_timing()
-    # example_5_complex_sequence()
-    # example_6_drag_and_drop()
-    # example_7_keyboard_shortcuts()
-    # example_8_scroll_operations()
+    # Uncomment to run examples. The outer shared() block keeps one
+    # connection open, so the examples reuse it instead of reconnecting:
+    # from vnc_agent_bridge import VNCAgentBridge
+    #
+    # with VNCAgentBridge.shared("localhost", port=5900):
+    #     example_1_form_filling()
+    #     example_2_file_operations()
+    #     example_3_web_navigation()
+    #     example_4_realistic_timing()
+    #     example_5_complex_sequence()
+    #     example_6_drag_and_drop()
+    #     example_7_keyboard_shortcuts()
+    #     example_8_scroll_operations()
 
     print("\n" + "=" * 50)
     print("Advanced examples are ready but commented out.")
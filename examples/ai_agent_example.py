@@ -16,17 +16,69 @@ Requirements:
     - VNC server running
 """
 
-from vnc_agent_bridge import VNCAgentBridge, VNCException
+from collections import deque
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping, Sequence
+import logging
+import sys
 import time
 
+# The bridge is imported where it is used, so the offline examples (5) start fast
+if TYPE_CHECKING:
+    from vnc_agent_bridge import VNCAgentBridge
+
+logger = logging.getLogger(__name__)
+
+
+# Simplified goal -> action plans - in reality this would use AI
+PLANS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "click_button": ("move_to_button", "click"),
+        "type_text": ("click_input_field", "clear_field", "type"),
+        "submit_form": ("move_to_submit", "click", "wait"),
+        "scroll_page": ("scroll_down",),
+    }
+)
+
+
+class Perception:
+    """Snapshot of the observed screen state.
+
+    timestamp_ns comes from time.monotonic_ns(), so it is only meaningful
+    relative to other perceptions (e.g. elapsed = b.timestamp_ns - a.timestamp_ns).
+    """
+
+    __slots__ = ("mouse_x", "mouse_y", "timestamp_ns")
+
+    def __init__(self, mouse_x: int, mouse_y: int, timestamp_ns: int) -> None:
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.timestamp_ns = timestamp_ns
+
 
 class SimpleAIAgent:
     """Conceptual AI Agent for VNC interaction."""
 
     def __init__(self, host: str = "localhost", port: int = 5900):
         """Initialize the AI agent."""
-        self.vnc = VNCAgentBridge(host, port=port)
-        self.action_log: list[str] = []
+        import vnc_agent_bridge
+
+        self.vnc: "VNCAgentBridge" = vnc_agent_bridge.VNCAgentBridge(host, port=port)
+        # Bounded log of (message, args); formatted only when read
+        self.action_log: deque[tuple[str, tuple]] = deque(maxlen=1024)
+        # Map action names to handlers once instead of comparing per call
+        self._actions: dict[str, Callable[[dict], None]] = {
+            "move_to_button": self._move_to_button,
+            "click": self._click,
+            "click_input_field": self._click_input_field,
+            "clear_field": self._clear_field,
+            "type": self._type,
+            "press_return": self._press_return,
+            "move_to_submit": self._move_to_submit,
+            "wait": self._wait,
+            "scroll_down": self._scroll_down,
+        }
 
     def __enter__(self) -> "SimpleAIAgent":
         """Context manager entry."""
@@ -36,87 +88,115 @@ class SimpleAIAgent:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         self.vnc.disconnect()
-
-    def log_action(self, action: str) -> None:
-        """Log an action taken."""
-        self.action_log.append(action)
-        print(f"  [Action] {action}")
-
-    def perceive(self) -> dict:
+        self.print_action_log()
+
+    def log_action(self, message: str, *args: object) -> None:
+        """Log an action taken (message uses %-style placeholders)."""
+        self.action_log.append((message, args))
+        logger.info("[Action] " + message, *args)
+
+    def print_action_log(self) -> None:
+        """Print all logged actions with a single write."""
+        if not self.action_log:
+            return
+        lines = [f"  {i}. {action}\n" for i, action in enumerate(self.actions(), 1)]
+        sys.stdout.write("\n[Action Log]\n" + "".join(lines))
+        sys.stdout.flush()
+
+    def actions(self) -> Iterator[str]:
+        """Iterate over the logged actions as formatted strings."""
+        for message, args in self.action_log:
+            yield message % args if args else message
+
+    def perceive(self) -> "Perception":
         """Perceive the current screen state."""
         # In a real agent, this would analyze screen capture
-        # For now, just track mouse position
+        # For now, just track mouse position (tracked locally, no server query)
         x, y = self.vnc.mouse.get_position()
-        state = {
-            "mouse_x": x,
-            "mouse_y": y,
-            "timestamp": time.time(),
-        }
+        state = Perception(x, y, time.monotonic_ns())
         print(f"[Perception] Mouse at ({x}, {y})")
         return state
 
-    def plan(self, goal: str) -> list[str]:
+    def plan(self, goal: str) -> tuple[str, ...]:
         """Plan actions to achieve goal."""
-        # Simplified planning - in reality this would use AI
-        plan = {
-            "click_button": ["move_to_button", "click"],
-            "type_text": ["click_input_field", "clear_field", "type"],
-            "submit_form": ["move_to_submit", "click", "wait"],
-            "scroll_page": ["scroll_down"],
-        }
-        actions = plan.get(goal, [])
+        actions = PLANS.get(goal, ())
         print(f"[Planning] Goal: {goal}")
         print(f"  Plan: {' -> '.join(actions)}")
         return actions
 
     def execute_action(self, action: str, params: dict = None) -> None:
         """Execute a single action."""
-        params = params or {}
-
-        if action == "move_to_button":
-            # Example: move to approximate button location
-            self.vnc.mouse.move_to(300, 400, delay=0.2)
-            self.log_action(f"Moved to button at (300, 400)")
-
-        elif action == "click":
-            self.vnc.mouse.left_click(delay=0.2)
-            self.log_action("Clicked")
-
-        elif action == "click_input_field":
-            x, y = params.get("coords", (100, 100))
-            self.vnc.mouse.left_click(x, y, delay=0.2)
-            self.log_action(f"Clicked input field at ({x}, {y})")
-
-        elif action == "clear_field":
-            # Select all and delete
-            self.vnc.keyboard.hotkey("ctrl", "a", delay=0.1)
-            self.vnc.keyboard.press_key("delete", delay=0.1)
-            self.log_action("Cleared field")
-
-        elif action == "type":
-            text = params.get("text", "")
-            self.vnc.keyboard.type_text(text, delay=0.05)
-            self.log_action(f"Typed: {text}")
-
-        elif action == "move_to_submit":
-            self.vnc.mouse.move_to(400, 500, delay=0.2)
-            self.log_action("Moved to submit button")
-
-        elif action == "wait":
-            delay = params.get("delay", 1.0)
-            time.sleep(delay)
-            self.log_action(f"Waited {delay}s")
-
-        elif action == "scroll_down":
-            amount = params.get("amount", 5)
-            self.vnc.scroll.scroll_down(amount=amount, delay=0.3)
-            self.log_action(f"Scrolled down {amount} ticks")
-
-    def execute_plan(self, plan: list[str], params: dict = None) -> None:
+        handler = self._actions.get(action)
+        if handler is None:
+            print(f"  [Skipped] Unknown action: {action}")
+            return
+        handler(params or {})
+
+    def _move_to_button(self, params: dict) -> None:
+        # Example: move to approximate button location
+        self.vnc.mouse.move_to(300, 400, delay=0.2)
+        self.log_action("Moved to button at (300, 400)")
+
+    def _click(self, params: dict) -> None:
+        self.vnc.mouse.left_click(delay=0.2)
+        self.log_action("Clicked")
+
+    def _click_input_field(self, params: dict) -> None:
+        x, y = params.get("coords", (100, 100))
+        self.vnc.mouse.left_click(x, y, delay=0.2)
+        self.log_action("Clicked input field at (%d, %d)", x, y)
+
+    def _clear_field(self, params: dict) -> None:
+        # Select all and delete
+        self.vnc.keyboard.hotkey("ctrl", "a", delay=0.1)
+        self.vnc.keyboard.press_key("delete", delay=0.1)
+        self.log_action("Cleared field")
+
+    def _type(self, params: dict) -> None:
+        text = params.get("text", "")
+        self.vnc.keyboard.type_text(text, delay=0.05)
+        self.log_action("Typed: %s", text)
+
+    def _press_return(self, params: dict) -> None:
+        self.vnc.keyboard.press_key("return", delay=0.1)
+        self.log_action("Pressed Return")
+
+    def _move_to_submit(self, params: dict) -> None:
+        self.vnc.mouse.move_to(400, 500, delay=0.2)
+        self.log_action("Moved to submit button")
+
+    def _wait(self, params: dict) -> None:
+        delay = params.get("delay", 1.0)
+        time.sleep(delay)
+        self.log_action("Waited %ss", delay)
+
+    def _scroll_down(self, params: dict) -> None:
+        amount = params.get("amount", 5)
+        self.vnc.scroll.scroll_down(amount=amount, delay=0.3)
+        self.log_action("Scrolled down %d ticks", amount)
+
+    def compile_plan(
+        self, steps: Sequence[tuple[str, dict]]
+    ) -> list[Callable[[], None]]:
+        """Resolve (action, params) steps to ready-to-call handlers."""
+        compiled = []
+        for action, params in steps:
+            handler = self._actions.get(action)
+            if handler is None:
+                print(f"  [Skipped] Unknown action: {action}")
+                continue
+            compiled.append(partial(handler, params or {}))
+        return compiled
+
+    def run_compiled(self, compiled: Sequence[Callable[[], None]]) -> None:
+        """Execute a plan returned by compile_plan()."""
+        for step in compiled:
+            step()
+
+    def execute_plan(self, plan: Sequence[str], params: dict = None) -> None:
         """Execute a sequence of actions."""
         params = params or {}
-        for action in plan:
-            self.execute_action(action, params)
+        self.run_compiled(self.compile_plan([(action, params) for action in plan]))
 
     def verify_result(self, expected_state: str) -> bool:
         """Verify that the action succeeded."""
@@ -132,6 +212,8 @@ class SimpleAIAgent:
 
 def example_1_simple_click_task():
     """Example: Agent performs a simple click task."""
+    from vnc_agent_bridge import VNCException
+
     print("\n" + "=" * 50)
     print("Example 1: Simple Click Task")
     print("=" * 50)
@@ -159,6 +241,8 @@ def example_1_simple_click_task():
 
 def example_2_form_filling_task():
     """Example: Agent fills out a form."""
+    from vnc_agent_bridge import VNCException
+
     print("\n" + "=" * 50)
     print("Example 2: Form Filling Task")
     print("=" * 50)
@@ -197,6 +281,8 @@ def example_2_form_filling_task():
 
 def example_3_scroll_and_click_task():
     """Example: Agent scrolls and clicks."""
+    from vnc_agent_bridge import VNCException
+
     print("\n" + "=" * 50)
     print("Example 3: Scroll and Click Task")
     print("=" * 50)
@@ -230,6 +316,8 @@ def example_3_scroll_and_click_task():
 
 def example_4_multi_step_workflow():
     """Example: Agent executes complex multi-step workflow."""
+    from vnc_agent_bridge import VNCException
+
     print("\n" + "=" * 50)
     print("Example 4: Multi-Step Workflow")
     print("=" * 50)
@@ -253,23 +341,22 @@ def example_4_multi_step_workflow():
                 ("clear_field", {}),
                 ("type", {"text": "AI agent VNC control"}),
                 ("wait", {"delay": 0.3}),
-                ("press_return", {}),  # Would need custom impl
+                ("press_return", {}),
                 ("wait", {"delay": 1.0}),  # Wait for results
                 ("move_to_button", {}),
                 ("click", {}),  # Click first result
             ]
 
+            # Resolve handlers once; the compiled plan can be rerun as-is
+            compiled = agent.compile_plan(workflow)
+
             print("\n[Executing workflow]")
-            for action, params in workflow[:-2]:  # Skip custom actions
-                agent.execute_action(action, params)
+            agent.run_compiled(compiled)
 
             # Step 3: Final verification
             agent.verify_result("workflow_complete")
 
-            # Print action log
-            print("\n[Action Log]")
-            for i, action in enumerate(agent.action_log, 1):
-                print(f"  {i}. {action}")
+            # The action log is printed once when the agent exits
 
     except VNCException as e:
         print(f"✗ Agent error: {e}")
@@ -281,15 +368,8 @@ def example_5_agent_reasoning():
     print("Example 5: Agent Reasoning")
     print("=" * 50)
 
-    goals_and_plans = [
-        ("click_button", ["move_to_button", "click"]),
-        ("type_text", ["click_input_field", "clear_field", "type"]),
-        ("submit_form", ["move_to_submit", "click", "wait"]),
-        ("scroll_page", ["scroll_down"]),
-    ]
-
     print("\n[Goal-to-Plan Mapping]")
-    for goal, plan in goals_and_plans:
+    for goal, plan in PLANS.items():
         print(f"\nGoal: {goal}")
         print(f"  Plan: {' -> '.join(plan)}")
 
@@ -298,6 +378,8 @@ def example_5_agent_reasoning():
 
 def example_6_error_recovery():
     """Example: Agent handles errors gracefully."""
+    from vnc_agent_bridge import VNCException
+
     print("\n" + "=" * 50)
     print("Example 6: Error Recovery")
     print("=" * 50)
@@ -324,6 +406,9 @@ def example_6_error_recovery():
 
 
 if __name__ == "__main__":
+    # Show each action live as the agent takes it
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
+
     print("\n" + "=" * 50)
     print("VNC Agent Bridge - AI Agent Examples")
     print("=" * 50)
@@ -23,6 +23,10 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+# Set to True for servers that support the ContinuousUpdates extension; the
+# recorder falls back to requesting each frame if the server does not confirm it
+CONTINUOUS_UPDATES = False
+
 
 def create_output_directory():
     """Create output directory for results."""
@@ -31,6 +35,15 @@ def create_output_directory():
     return output_dir
 
 
+def save_screen(vnc, filepath):
+    """Save the screen as kept current by the recorder.
+
+    While recording, the recorder thread reads every server message, so a
+    new screenshot request from here would interleave with its reads.
+    """
+    vnc.screenshot.save_arrays([(filepath, vnc.framebuffer.get_buffer())])
+
+
 def run_complete_workflow():
     """Run a complete workflow combining all v0.2.0 features."""
 
@@ -55,7 +68,14 @@ def run_complete_workflow():
             # Phase 1: Start Recording
             # ============================================================
             print("\nPhase 1: Starting video recording...")
-            vnc.video.start_recording(fps=30.0)
+            # Write frames to disk as they are captured
+            vnc.video.start_recording(
+                fps=30.0,
+                continuous=CONTINUOUS_UPDATES,
+                output_dir=output_dir / "recording",
+            )
+            # Screenshots come from the recorder's framebuffer from now on
+            vnc.video.wait_for_frames(1, timeout=5.0)
             results["video_recorded"] = True
 
             step_num = 1
@@ -76,7 +96,7 @@ def run_complete_workflow():
             step_num += 1
 
             # Take screenshot of initial state
-            vnc.screenshot.save(str(output_dir / "01_initial_state.png"))
+            save_screen(vnc, output_dir / "01_initial_state.png")
             results["screenshots"].append("01_initial_state.png")
             print("  ✓ Captured initial state")
 
@@ -138,7 +158,7 @@ def run_complete_workflow():
             time.sleep(2.0)
 
             # Take screenshot of result
-            vnc.screenshot.save(str(output_dir / "02_after_login.png"))
+            save_screen(vnc, output_dir / "02_after_login.png")
             results["screenshots"].append("02_after_login.png")
             print("  ✓ Captured post-login state")
 
@@ -157,18 +177,13 @@ def run_complete_workflow():
             print("\nPhase 5: Data extraction...")
             step_num += 1
 
-            # Clear clipboard to ensure fresh data
-            vnc.clipboard.clear()
-            time.sleep(0.3)
-
-            # Copy result (simulated)
+            # Copy result (simulated) and wait for the server to send it
+            prev = vnc.clipboard.serial
             vnc.keyboard.hotkey("ctrl", "a")
             vnc.keyboard.hotkey("ctrl", "c")
 
-            time.sleep(0.5)
-
             # Get extracted data
-            extracted_data = vnc.clipboard.get_text(timeout=2.0)
+            extracted_data = vnc.clipboard.wait_for_change(prev, timeout=2.0)
 
             if extracted_data:
                 print(f"  ✓ Extracted data ({len(extracted_data)} bytes)")
@@ -198,12 +213,19 @@ def run_complete_workflow():
                 "footer": (0, 980, 1920, 100),
             }
 
-            for region_name, (x, y, w, h) in regions.items():
-                filename = f"03_region_{region_name}.png"
-                vnc.screenshot.save_region(
-                    str(output_dir / filename), x=x, y=y, width=w, height=h
-                )
-                results["screenshots"].append(filename)
+            # Cut the regions from the recorder's framebuffer and encode
+            # them in parallel
+            filenames = {
+                f"03_region_{region_name}.png": region
+                for region_name, region in regions.items()
+            }
+            vnc.screenshot.save_arrays(
+                [
+                    (output_dir / name, vnc.framebuffer.get_region(*region))
+                    for name, region in filenames.items()
+                ]
+            )
+            results["screenshots"].extend(filenames)
 
             print(f"  ✓ Captured {len(regions)} region screenshots")
 
@@ -222,15 +244,13 @@ def run_complete_workflow():
             print("\nPhase 7: Stopping video recording...")
             step_num += 1
 
+            # Returns once every frame is written to the recording directory
             frames = vnc.video.stop_recording()
 
             print(f"  ✓ Recorded {len(frames)} frames")
             print(f"  ✓ Duration: {vnc.video.get_duration(frames):.2f} seconds")
             print(f"  ✓ FPS: {vnc.video.get_frame_rate(frames):.2f}")
 
-            # Save frames
-            vnc.video.save_frames(frames, str(output_dir / "recording"))
-
             results["steps"].append(
                 {
                     "number": step_num,
@@ -258,8 +278,7 @@ def run_complete_workflow():
 
             # Make sure to stop recording
             if vnc.video.is_recording():
-                frames = vnc.video.stop_recording()
-                vnc.video.save_frames(frames, str(output_dir / "recording"))
+                vnc.video.stop_recording()
 
         finally:
             # Save results to JSON
@@ -7,63 +7,244 @@ in v0.2.0. Shows how to record screen sessions and save frame sequences.
 
 Requirements:
     pip install vnc-agent-bridge[video]
+    ffmpeg on PATH (optional, to save recordings as MP4 instead of animated WebP)
 """
 
 from vnc_agent_bridge import VNCAgentBridge
+from vnc_agent_bridge.types.common import VideoFrame
+import shutil
+import subprocess
 import time
 
 
-def example_record_for_duration():
+def downscale(frame, size):
+    """Return a copy of frame resized to size (width, height).
+
+    Box (area-averaging) resampling keeps text and thin lines legible when
+    shrinking. Halving both dimensions quarters the bytes every later step
+    (encoding, disk) has to handle.
+    """
+    import numpy as np
+    from PIL import Image
+
+    data = np.asarray(Image.fromarray(frame.data).resize(size, Image.BOX))
+    return VideoFrame(frame.timestamp, data, frame.frame_number)
+
+
+class FFmpegWriter:
+    """Encode frames to an H.264 MP4 by piping raw pixels to ffmpeg.
+
+    ffmpeg is started on the first frame, once the frame size is known. The
+    writer is callable, so it can be passed as start_recording(on_frame=...)
+    to encode frames while they are recorded. With scale=(width, height) the
+    frames are downscaled before encoding.
+    """
+
+    def __init__(self, output, fps=30.0, scale=None):
+        self.output = output
+        self.fps = fps
+        self.scale = scale
+        self.process = None
+
+    def __call__(self, frame):
+        if self.scale is not None:
+            frame = downscale(frame, self.scale)
+        if self.process is None:
+            self.process = self._start(*frame.data.shape[:2])
+        # The numpy array is written without an intermediate bytes copy
+        self.process.stdin.write(frame.data)
+
+    def close(self):
+        """Finish the video; does nothing if no frame was written."""
+        if self.process is None:
+            return
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg failed with exit code {self.process.returncode}"
+            )
+
+    def _start(self, height, width):
+        # Frames are raw RGBA pixels; yuv420p needs even dimensions
+        command = [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            f"{self.fps:.3f}",
+            "-i",
+            "-",
+            "-vf",
+            "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-pix_fmt",
+            "yuv420p",
+            self.output,
+        ]
+        return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
+def save_webp(frames, path, fps=30.0):
+    """Save frames as a single animated WebP file.
+
+    Each frame is shown until the next one was captured, so playback keeps
+    the recording's timing.
+    """
+    from PIL import Image
+
+    images = [Image.fromarray(frame.data, "RGBA") for frame in frames]
+    durations = [
+        max(1, round((later.timestamp - frame.timestamp) * 1000))
+        for frame, later in zip(frames, frames[1:])
+    ]
+    durations.append(round(1000 / fps))
+    images[0].save(
+        path,
+        save_all=True,
+        append_images=images[1:],
+        duration=durations,
+        loop=0,
+        quality=75,
+        method=4,
+    )
+
+
+def save_video(vnc, frames, name, fps=30.0, scale=None):
+    """Save frames as an H.264 MP4 if ffmpeg is available, else as animated WebP.
+
+    Consecutive desktop frames are nearly identical, so a video codec stores
+    a recording in a small fraction of the space of one PNG per frame.
+    Without ffmpeg they go into one animated WebP file instead (or one PNG
+    per frame if Pillow was built without WebP support).
+    Pass scale=(width, height) to downscale the frames first.
+
+    Returns:
+        Path of the video file or the frame directory
+    """
+    if not frames:
+        return None
+
+    if shutil.which("ffmpeg") is None:
+        from PIL import features
+
+        if scale is not None:
+            frames = [downscale(frame, scale) for frame in frames]
+        if features.check("webp"):
+            save_webp(frames, f"{name}.webp", fps)
+            return f"{name}.webp"
+        vnc.video.save_frames(frames, f"{name}/")
+        return f"{name}/"
+
+    # Play back at the rate the frames were actually captured
+    rate = vnc.video.get_frame_rate(frames) or fps
+    writer = FFmpegWriter(f"{name}.mp4", rate, scale)
+    for frame in frames:
+        writer(frame)
+    writer.close()
+    return writer.output
+
+
+def example_record_for_duration(vnc):
     """Record screen for a fixed duration."""
-    with VNCAgentBridge("localhost", port=5900) as vnc:
-        print("Recording 10 seconds at 30 FPS...")
+    print("Recording 10 seconds at 30 FPS...")
+
+    frames = vnc.video.record(duration=10.0, fps=30.0)
+
+    print(f"Recorded {len(frames)} frames")
+    print(f"Duration: {vnc.video.get_duration(frames):.2f} seconds")
+    print(f"FPS: {vnc.video.get_frame_rate(frames):.2f}")
+
+    # Save as a video (or frames if ffmpeg is not installed)
+    saved_to = save_video(vnc, frames, "recording_duration", fps=30.0)
+    print(f"Recording saved to: {saved_to}")
+
+
+def example_background_recording(vnc):
+    """Record in background while performing actions.
+
+    Frames are encoded while recording (to MP4 with ffmpeg, else to PNG
+    files), so memory use does not grow with the recording length.
+    """
+    print("Starting background recording...")
+    writer = None
+    if shutil.which("ffmpeg") is not None:
+        writer = FFmpegWriter("recording_background.mp4", fps=30.0)
+        vnc.video.start_recording(fps=30.0, on_frame=writer)
+        saved_to = writer.output
+    else:
+        vnc.video.start_recording(fps=30.0, output_dir="recording_background/")
+        saved_to = "recording_background/"
+
+    try:
+        # Perform actions
+        print("Performing actions...")
+        vnc.mouse.left_click(100, 100)
+        time.sleep(1.0)
 
-        frames = vnc.video.record(duration=10.0, fps=30.0)
+        vnc.keyboard.type_text("Background Recording Test")
+        time.sleep(1.0)
+
+        vnc.keyboard.press_key("return")
+        time.sleep(1.0)
+
+    finally:
+        # Stop recording; returns once every frame has been encoded
+        print("Stopping recording...")
+        frames = vnc.video.stop_recording()
+        if writer is not None:
+            writer.close()
 
         print(f"Recorded {len(frames)} frames")
         print(f"Duration: {vnc.video.get_duration(frames):.2f} seconds")
-        print(f"FPS: {vnc.video.get_frame_rate(frames):.2f}")
-
-        # Save frames
-        vnc.video.save_frames(frames, "recording_duration/")
-        print("Frames saved to: recording_duration/")
+        print(f"Recording saved to: {saved_to}")
 
 
-def example_background_recording():
-    """Record in background while performing actions."""
-    with VNCAgentBridge("localhost", port=5900) as vnc:
-        print("Starting background recording...")
-        vnc.video.start_recording(fps=30.0)
+def record_changes(
+    vnc, condition, max_duration, idle_fps=5.0, active_fps=30.0, burst=1.0
+):
+    """Record until condition() returns True, keeping only changed frames.
 
-        try:
-            # Perform actions
-            print("Performing actions...")
-            vnc.mouse.left_click(100, 100)
-            time.sleep(1.0)
+    The screen is sampled at idle_fps, and at active_fps for `burst` seconds
+    after each change. Frames identical to the previous one are dropped, so
+    an idle desktop costs a few cheap comparisons per second instead of a
+    stored (and later encoded) frame every 1/30 s. Timestamps are kept, so
+    save_webp() still plays the recording back in real time.
+    """
+    import numpy as np
 
-            vnc.keyboard.type_text("Background Recording Test")
-            time.sleep(1.0)
+    frames = []
+    previous = None
+    start_time = time.time()
+    active_until = 0.0
 
-            vnc.keyboard.press_key("return")
-            time.sleep(1.0)
+    while time.time() - start_time < max_duration and not condition():
+        now = time.time()
+        data = vnc.screenshot.capture(incremental=True)
 
-        finally:
-            # Stop recording
-            print("Stopping recording...")
-            frames = vnc.video.stop_recording()
+        if previous is None or not np.array_equal(data, previous):
+            frames.append(VideoFrame(now - start_time, data, len(frames)))
+            previous = data
+            active_until = now + burst
 
-            print(f"Recorded {len(frames)} frames")
-            print(f"Duration: {vnc.video.get_duration(frames):.2f} seconds")
+        fps = active_fps if now < active_until else idle_fps
+        time.sleep(max(0.0, now + 1.0 / fps - time.time()))
 
-            # Save frames
-            vnc.video.save_frames(frames, "recording_background/")
-            print("Frames saved to: recording_background/")
+    return frames
 
 
-def example_record_until_completion():
+def example_record_until_completion(vnc):
     """Record until a condition is met."""
     try:
-        import numpy as np
 
         def condition_met():
             """Check if operation completed."""
@@ -71,111 +252,103 @@ def example_record_until_completion():
             # For now, always return False to demonstrate the pattern
             return False
 
-        with VNCAgentBridge("localhost", port=5900) as vnc:
-            print("Recording until condition met (max 20 seconds)...")
+        print("Recording changes until condition met (max 20 seconds)...")
 
-            frames = vnc.video.record_until(
-                condition=condition_met, max_duration=20.0, fps=30.0
-            )
+        frames = record_changes(vnc, condition_met, max_duration=20.0)
 
-            print(f"Recorded {len(frames)} frames")
-            print(f"Duration: {vnc.video.get_duration(frames):.2f} seconds")
+        print(f"Recorded {len(frames)} frames")
+        print(f"Duration: {vnc.video.get_duration(frames):.2f} seconds")
 
-            # Save frames
-            vnc.video.save_frames(frames, "recording_conditional/")
-            print("Frames saved to: recording_conditional/")
+        # Save as a video (or frames if ffmpeg is not installed)
+        saved_to = save_video(vnc, frames, "recording_conditional", fps=30.0)
+        print(f"Recording saved to: {saved_to}")
 
     except ImportError:
         print("numpy not available, skipping conditional recording")
 
 
-def example_frame_statistics():
+def example_frame_statistics(vnc):
     """Record and analyze frame statistics."""
-    with VNCAgentBridge("localhost", port=5900) as vnc:
-        print("Recording 5 seconds for statistics...")
+    print("Recording 5 seconds for statistics...")
 
-        frames = vnc.video.record(duration=5.0, fps=30.0)
+    frames = vnc.video.record(duration=5.0, fps=30.0)
 
-        # Get statistics
-        num_frames = len(frames)
-        duration = vnc.video.get_duration(frames)
-        actual_fps = vnc.video.get_frame_rate(frames)
+    # Get statistics
+    num_frames = len(frames)
+    duration = vnc.video.get_duration(frames)
+    actual_fps = vnc.video.get_frame_rate(frames)
 
-        print(f"Statistics:")
-        print(f"  Total frames: {num_frames}")
-        print(f"  Total duration: {duration:.2f} seconds")
-        print(f"  Target FPS: 30")
-        print(f"  Actual FPS: {actual_fps:.2f}")
-        print(f"  FPS accuracy: {(actual_fps / 30.0) * 100:.1f}%")
+    print(f"Statistics:")
+    print(f"  Total frames: {num_frames}")
+    print(f"  Total duration: {duration:.2f} seconds")
+    print(f"  Target FPS: 30")
+    print(f"  Actual FPS: {actual_fps:.2f}")
+    print(f"  FPS accuracy: {(actual_fps / 30.0) * 100:.1f}%")
+
+    # Time per frame
+    if num_frames > 1:
+        time_per_frame = duration / (num_frames - 1)
+        print(f"  Time per frame: {time_per_frame * 1000:.2f} ms")
 
-        # Time per frame
-        if num_frames > 1:
-            time_per_frame = duration / (num_frames - 1)
-            print(f"  Time per frame: {time_per_frame * 1000:.2f} ms")
 
+def example_multiple_fps_rates(vnc):
+    """Record at different FPS rates.
 
-def example_multiple_fps_rates():
-    """Record at different FPS rates."""
+    The recordings are saved at half resolution: at higher frame rates the
+    amount of pixel data, not the frame rate, is what costs the most.
+    """
     fps_rates = [15.0, 30.0, 60.0]
 
     for fps in fps_rates:
         print(f"Recording 5 seconds at {fps} FPS...")
 
-        with VNCAgentBridge("localhost", port=5900) as vnc:
-            frames = vnc.video.record(duration=5.0, fps=fps)
+        frames = vnc.video.record(duration=5.0, fps=fps)
 
-            actual_fps = vnc.video.get_frame_rate(frames)
-            duration = vnc.video.get_duration(frames)
+        actual_fps = vnc.video.get_frame_rate(frames)
+        duration = vnc.video.get_duration(frames)
 
-            print(f"  Frames: {len(frames)}")
-            print(f"  Actual FPS: {actual_fps:.2f}")
-            print(f"  Duration: {duration:.2f}s")
+        print(f"  Frames: {len(frames)}")
+        print(f"  Actual FPS: {actual_fps:.2f}")
+        print(f"  Duration: {duration:.2f}s")
 
-            # Save frames
-            vnc.video.save_frames(frames, f"recording_fps_{fps}/", prefix="frame")
-            print(f"  Saved to: recording_fps_{fps}/")
+        # Save as a video (or frames if ffmpeg is not installed)
+        height, width = frames[0].data.shape[:2]
+        saved_to = save_video(
+            vnc,
+            frames,
+            f"recording_fps_{fps}",
+            fps=fps,
+            scale=(width // 2, height // 2),
+        )
+        print(f"  Saved to: {saved_to}")
 
 
 def main():
-    """Run all video recording examples."""
+    """Run all video recording examples over a single connection."""
     print("=" * 60)
     print("v0.2.0 Video Recording Examples")
     print("=" * 60)
 
-    try:
-        print("\nExample 1: Record for Duration")
-        print("-" * 60)
-        example_record_for_duration()
-    except Exception as e:
-        print(f"Example 1 failed: {e}")
-
-    try:
-        print("\nExample 2: Background Recording")
-        print("-" * 60)
-        example_background_recording()
-    except Exception as e:
-        print(f"Example 2 failed: {e}")
-
-    try:
-        print("\nExample 3: Record Until Condition")
-        print("-" * 60)
-        example_record_until_completion()
-    except Exception as e:
-        print(f"Example 3 failed: {e}")
+    examples = [
+        ("Record for Duration", example_record_for_duration),
+        ("Background Recording", example_background_recording),
+        ("Record Until Condition", example_record_until_completion),
+        ("Frame Statistics", example_frame_statistics),
+        ("Multiple FPS Rates", example_multiple_fps_rates),
+    ]
 
     try:
-        print("\nExample 4: Frame Statistics")
-        print("-" * 60)
-        example_frame_statistics()
-    except Exception as e:
-        print(f"Example 4 failed: {e}")
-
-    try:
-        print("\nExample 5: Multiple FPS Rates")
-        print("-" * 60)
-        example_multiple_fps_rates()
+        # One connection (and RFB handshake) is shared by all examples
+        with VNCAgentBridge("localhost", port=5900) as vnc:
+            for number, (title, example) in enumerate(examples, 1):
+                try:
+                    print(f"\nExample {number}: {title}")
+                    print("-" * 60)
+                    example(vnc)
+                except Exception as e:
+                    print(f"Example {number} failed: {e}")
     except Exception as e:
-        print(f"Example 5 failed: {e}")
+        print(f"Connection failed: {e}")
 
     print("\n" + "=" * 60)
     print("Examples completed")
@@ -11,9 +11,13 @@ import requests
 import json
 from pathlib import Path
 import dotenv
+import urllib3
 
 dotenv.load_dotenv()
 
+# The Proxmox API uses a self-signed certificate (verify=False below)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
 # Configuration
 WEBSOCKET_VNC_HOST = os.getenv("WEBSOCKET_VNC_HOST", "192.168.1.224")
 WEBSOCKET_VNC_HOST_PORT = int(os.getenv("WEBSOCKET_VNC_HOST_PORT", "8006"))
@@ -60,23 +64,13 @@ try:
             print(f"  Port: {port}")
             print(f"  Expires in: ~30 seconds")
 
-            # Also update .env file automatically
+            # Also update .env file automatically (replaces or adds the
+            # ticket and writes the file through a temporary copy)
             env_file = Path(".env")
             if env_file.exists():
-                content = env_file.read_text()
-                # Replace or add the ticket
-                if "WEBSOCKET_VNC_TICKET=" in content:
-                    import re
-
-                    content = re.sub(
-                        r"WEBSOCKET_VNC_TICKET=.*",
-                        f"WEBSOCKET_VNC_TICKET={ticket}",
-                        content,
-                    )
-                else:
-                    content += f"\nWEBSOCKET_VNC_TICKET={ticket}\n"
-
-                env_file.write_text(content)
+                dotenv.set_key(
+                    env_file, "WEBSOCKET_VNC_TICKET", ticket, quote_mode="never"
+                )
                 print(f"\n✓ Updated .env file automatically")
 
         else:
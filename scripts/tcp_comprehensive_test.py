@@ -22,12 +22,12 @@ Usage:
     python comprehensive_test.py
 """
 
-import time
 import json
 import os
 from pathlib import Path
 from datetime import datetime
 from vnc_agent_bridge import VNCAgentBridge, VNCException
+from vnc_agent_bridge.types.common import ImageFormat
 import dotenv
 
 dotenv.load_dotenv()
@@ -36,10 +36,11 @@ dotenv.load_dotenv()
 def create_test_output_directory():
     """Create directory for test outputs."""
     output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep runs started in the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     test_dir = output_dir / f"test_run_{timestamp}"
-    test_dir.mkdir(exist_ok=True)
+    # Creates test_output on first use; fails rather than reuse a run
+    test_dir.mkdir(parents=True)
     return test_dir
 
 
@@ -52,18 +53,18 @@ def test_mouse_operations(vnc, output_dir):
     try:
         # Test 1: Basic clicks
         print("\n1. Testing basic mouse clicks...")
-        vnc.mouse.left_click(100, 100, delay=0.5)
+        # Sent to the server in one write
+        with vnc.mouse.sequence():
+            vnc.mouse.left_click(100, 100)
+            vnc.mouse.right_click(200, 200)
+            vnc.mouse.double_click(150, 150)
         print("   ✓ Left click at (100, 100)")
-
-        vnc.mouse.right_click(200, 200, delay=0.5)
         print("   ✓ Right click at (200, 200)")
-
-        vnc.mouse.double_click(150, 150, delay=0.5)
         print("   ✓ Double click at (150, 150)")
 
         # Test 2: Mouse movement
         print("\n2. Testing mouse movement...")
-        vnc.mouse.move_to(300, 300, delay=0.5)
+        vnc.mouse.move_to(300, 300)
         print("   ✓ Moved to (300, 300)")
 
         position = vnc.mouse.get_position()
@@ -71,8 +72,8 @@ def test_mouse_operations(vnc, output_dir):
 
         # Test 3: Drag operation
         print("\n3. Testing drag operation...")
-        vnc.mouse.move_to(100, 100, delay=0.3)
-        vnc.mouse.drag_to(400, 400, duration=1.0, delay=0.5)
+        vnc.mouse.move_to(100, 100)
+        vnc.mouse.drag_to(400, 400, duration=1.0)
         print("   ✓ Dragged from (100, 100) to (400, 400)")
 
         print("\n✓ All mouse operations completed successfully")
@@ -92,41 +93,41 @@ def test_keyboard_operations(vnc, output_dir):
     try:
         # Test 1: Type text
         print("\n1. Testing text typing...")
-        vnc.keyboard.type_text("Hello from VNC Agent Bridge!", delay=0.1)
+        with vnc.keyboard.sequence():
+            vnc.keyboard.type_text("Hello from VNC Agent Bridge!")
+            vnc.keyboard.press_key("return")
         print("   ✓ Typed: 'Hello from VNC Agent Bridge!'")
-
-        vnc.keyboard.press_key("return", delay=0.3)
         print("   ✓ Pressed Enter")
 
         # Test 2: Individual key presses
         print("\n2. Testing individual key presses...")
-        vnc.keyboard.press_key("tab", delay=0.2)
+        with vnc.keyboard.sequence():
+            vnc.keyboard.press_key("tab")
+            vnc.keyboard.press_key("space")
         print("   ✓ Pressed Tab")
-
-        vnc.keyboard.press_key("space", delay=0.2)
         print("   ✓ Pressed Space")
 
         # Test 3: Hotkeys
         print("\n3. Testing hotkey combinations...")
-        vnc.keyboard.hotkey("ctrl", "a", delay=0.3)  # Select all
+        with vnc.keyboard.sequence():
+            vnc.keyboard.hotkey("ctrl", "a")  # Select all
+            vnc.keyboard.hotkey("ctrl", "c")  # Copy
         print("   ✓ Pressed Ctrl+A (Select All)")
-
-        vnc.keyboard.hotkey("ctrl", "c", delay=0.3)  # Copy
         print("   ✓ Pressed Ctrl+C (Copy)")
 
         # Test 4: Key hold/release
         print("\n4. Testing key hold/release...")
-        vnc.keyboard.keydown("shift", delay=0.2)
+        vnc.keyboard.keydown("shift")
         vnc.keyboard.type_text("uppercase text")
-        vnc.keyboard.keyup("shift", delay=0.2)
+        vnc.keyboard.keyup("shift")
         print("   ✓ Typed uppercase text with Shift held")
 
         # Test 5: Special keys
         print("\n5. Testing special keys...")
-        vnc.keyboard.press_key("backspace", delay=0.2)
+        vnc.keyboard.press_key("backspace")
         print("   ✓ Pressed Backspace")
 
-        vnc.keyboard.press_key("escape", delay=0.2)
+        vnc.keyboard.press_key("escape")
         print("   ✓ Pressed Escape")
 
         print("\n✓ All keyboard operations completed successfully")
@@ -145,14 +146,14 @@ def test_scroll_operations(vnc, output_dir):
 
     try:
         print("\n1. Testing scroll up/down...")
-        vnc.scroll.scroll_up(amount=3, delay=0.3)
+        vnc.scroll.scroll_up(amount=3)
         print("   ✓ Scrolled up 3 units")
 
-        vnc.scroll.scroll_down(amount=5, delay=0.3)
+        vnc.scroll.scroll_down(amount=5)
         print("   ✓ Scrolled down 5 units")
 
         print("\n2. Testing scroll at position...")
-        vnc.scroll.scroll_to(200, 200, delay=0.3)
+        vnc.scroll.scroll_to(200, 200)
         print("   ✓ Scrolled at position (200, 200)")
 
         print("\n✓ All scroll operations completed successfully")
@@ -178,22 +179,22 @@ def test_screenshot_operations(vnc, output_dir):
         # Test 2: Save screenshot
         print("\n2. Testing screenshot saving...")
         screenshot_path = output_dir / "full_screenshot.png"
-        vnc.screenshot.save_image(str(screenshot_path), delay=0.3)
+        vnc.screenshot.save(str(screenshot_path), delay=0.3)
         print(f"   ✓ Saved screenshot to: {screenshot_path}")
 
         # Test 3: Region capture
         print("\n3. Testing region capture...")
         region_path = output_dir / "region_screenshot.png"
-        vnc.screenshot.capture_region(100, 100, 300, 200, delay=0.3)
-        vnc.screenshot.save_image(str(region_path))
+        vnc.screenshot.save_region(str(region_path), 100, 100, 300, 200, delay=0.3)
         print(f"   ✓ Captured and saved region (100,100,300x200) to: {region_path}")
 
         # Test 4: Different formats
         print("\n4. Testing different image formats...")
-        for fmt in ["PNG", "JPEG", "BMP"]:
-            fmt_path = output_dir / f"screenshot.{fmt.lower()}"
-            vnc.screenshot.save_image(str(fmt_path), format=fmt, delay=0.2)
-            print(f"   ✓ Saved {fmt} format to: {fmt_path}")
+        # Encode the capture from test 1 in each format (no new capture)
+        for fmt in ImageFormat:
+            fmt_path = output_dir / f"screenshot.{fmt.value}"
+            fmt_path.write_bytes(vnc.screenshot.to_bytes(screenshot, fmt))
+            print(f"   ✓ Saved {fmt.name} format to: {fmt_path}")
 
         print("\n✓ All screenshot operations completed successfully")
         return True
@@ -213,36 +214,31 @@ def test_video_operations(vnc, output_dir):
         # Test 1: Timed recording
         print("\n1. Testing timed video recording...")
         print("   Recording 5 seconds at 10 FPS...")
-        frames = vnc.video.record(duration=5.0, fps=10.0)
-        print(f"   ✓ Recorded {len(frames)} frames")
-
-        # Save the recording
+        # Frames are written while recording instead of kept in memory
         video_dir = output_dir / "timed_recording"
-        vnc.video.save_frames(frames, str(video_dir))
+        frames = vnc.video.record(duration=5.0, fps=10.0, output_dir=video_dir)
+        print(f"   ✓ Recorded {len(frames)} frames")
         print(f"   ✓ Saved frames to: {video_dir}")
 
         # Test 2: Background recording
         print("\n2. Testing background recording...")
         print("   Starting background recording...")
-        vnc.video.start_recording(fps=15.0)
+        bg_video_dir = output_dir / "background_recording"
+        vnc.video.start_recording(fps=15.0, output_dir=bg_video_dir)
 
         # Perform some actions while recording
         print("   Performing actions during recording...")
-        time.sleep(1)
+        vnc.video.wait_for_frames(1, timeout=2.0)
         vnc.mouse.move_to(100, 100, delay=0.3)
         vnc.mouse.left_click(delay=0.3)
-        time.sleep(1)
+        vnc.video.wait_for_frames(vnc.video.frame_count + 5, timeout=2.0)
         vnc.keyboard.type_text("Recording in progress...", delay=0.1)
-        time.sleep(1)
+        vnc.video.wait_for_frames(vnc.video.frame_count + 5, timeout=2.0)
 
         # Stop recording
         print("   Stopping background recording...")
         frames_bg = vnc.video.stop_recording()
         print(f"   ✓ Recorded {len(frames_bg)} frames in background")
-
-        # Save background recording
-        bg_video_dir = output_dir / "background_recording"
-        vnc.video.save_frames(frames_bg, str(bg_video_dir))
         print(f"   ✓ Saved background frames to: {bg_video_dir}")
 
         print("\n✓ All video operations completed successfully")
@@ -303,7 +299,7 @@ def test_clipboard_operations(vnc, output_dir):
             ],
             "server": "192.168.1.5",
         }
-        json_data = json.dumps(test_data, indent=2)
+        json_data = json.dumps(test_data, separators=(",", ":"))
         vnc.clipboard.send_text(json_data, delay=0.3)
         print("   ✓ Sent JSON data to clipboard")
 
@@ -362,9 +358,8 @@ def test_server(server_config, vnc_password):
     print(f"Target VNC Server: {host}:{port}")
     print(f"Test Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Create output directory
-    output_dir = create_test_output_directory()
-    print(f"Test outputs will be saved to: {output_dir}")
+    # Created once connected, so failed connections leave no directory
+    output_dir = None
 
     # Test results
     results = {
@@ -372,7 +367,6 @@ def test_server(server_config, vnc_password):
         "server": f"{host}:{port}",
         "server_name": server_name,
         "tests": {},
-        "output_directory": str(output_dir),
     }
 
     try:
@@ -386,6 +380,11 @@ def test_server(server_config, vnc_password):
         ) as vnc:
             print("✓ Connected successfully")
 
+            # Create output directory
+            output_dir = create_test_output_directory()
+            print(f"Test outputs will be saved to: {output_dir}")
+            results["output_directory"] = str(output_dir)
+
             # Run all tests
             test_functions = [
                 ("mouse_operations", test_mouse_operations),
@@ -422,13 +421,6 @@ def test_server(server_config, vnc_password):
                 print(f"  {status} {test_name.replace('_', ' ').title()}: {result}")
 
             results["overall_result"] = "PASSED" if all_passed else "FAILED"
-            results["end_time"] = datetime.now().isoformat()
-
-            # Save results
-            results_file = output_dir / "test_results.json"
-            with open(results_file, "w") as f:
-                json.dump(results, f, indent=2)
-            print(f"\n📄 Detailed results saved to: {results_file}")
 
     except VNCException as e:
         print(f"\n❌ VNC Error: {e}")
@@ -437,13 +429,19 @@ def test_server(server_config, vnc_password):
         print(f"\n💥 Unexpected error: {e}")
         results["overall_result"] = f"CRASHED: {str(e)}"
 
-    # Save final results even if connection failed
+    # Save results once, whether the tests ran or the connection failed
     results["end_time"] = datetime.now().isoformat()
     try:
-        results_file = output_dir / "test_results.json"
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
-        print(f"📄 Error results saved to: {results_file}")
+        if output_dir is not None:
+            results_file = output_dir / "test_results.json"
+            results_file.write_text(json.dumps(results, indent=2))
+        else:
+            # One line per failed run instead of an empty run directory
+            results_file = Path("test_output") / "errors.jsonl"
+            results_file.parent.mkdir(exist_ok=True)
+            with open(results_file, "a") as f:
+                f.write(json.dumps(results) + "\n")
+        print(f"\n📄 Results saved to: {results_file}")
     except:
         print("Could not save results file")
 
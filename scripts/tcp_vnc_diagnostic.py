@@ -8,9 +8,14 @@ connection parameters and providing detailed error information.
 """
 
 import os
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 from vnc_agent_bridge import VNCAgentBridge, VNCException
 
+# TCP connect timeout for the reachability probe (allows one SYN retransmit)
+PROBE_TIMEOUT = 2.0
+
 
 def test_connection(host, port, password=None, timeout=10.0):
     """Test VNC connection with detailed error reporting."""
@@ -37,6 +42,24 @@ def test_connection(host, port, password=None, timeout=10.0):
         return False
 
 
+def probe_endpoints(endpoints, timeout):
+    """Check which (host, port) endpoints accept TCP connections.
+
+    All endpoints are probed at the same time, so unreachable hosts cost
+    one timeout in total instead of one per configuration.
+    """
+
+    def probe(endpoint):
+        try:
+            with socket.create_connection(endpoint, timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+        return dict(zip(endpoints, pool.map(probe, endpoints)))
+
+
 def run_diagnostics():
     """Run comprehensive connection diagnostics."""
     print("VNC Connection Diagnostics")
@@ -75,9 +98,22 @@ def run_diagnostics():
         {"host": "localhost", "port": 5900, "password": None, "timeout": 10.0},
     ]
 
+    # Find open ports first; the VNC handshakes below then run one at a
+    # time (servers may drop a client when another one connects)
+    endpoints = list(dict.fromkeys((c["host"], c["port"]) for c in configs))
+    print(f"\n🔍 Probing {len(endpoints)} endpoint(s) in parallel...")
+    reachable = probe_endpoints(endpoints, PROBE_TIMEOUT)
+    for (host, port), is_open in reachable.items():
+        if is_open:
+            print(f"   ✓ {host}:{port} open")
+        else:
+            print(f"   ❌ {host}:{port} closed or unreachable (skipped)")
+
     successful_configs = []
 
     for config in configs:
+        if not reachable[(config["host"], config["port"])]:
+            continue
         success = test_connection(**config)
         if success:
             successful_configs.append(config)
@@ -32,10 +32,11 @@ dotenv.load_dotenv()
 def create_test_output_directory():
     """Create directory for test outputs."""
     output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep runs started in the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     test_dir = output_dir / f"clipboard_test_{timestamp}"
-    test_dir.mkdir(exist_ok=True)
+    # Creates test_output on first use; fails rather than reuse a run
+    test_dir.mkdir(parents=True)
     return test_dir
 
 
@@ -54,7 +55,7 @@ def test_clipboard_operations(vnc, output_dir):
         # Test 1: Send text to clipboard
         print("\n1. Testing clipboard text sending...")
         test_text = "Hello from VNC Agent Bridge clipboard test!"
-        vnc.clipboard.send_text(test_text, delay=0.3)
+        vnc.clipboard.send_text(test_text)
         print(f"   ✓ Sent text to clipboard: '{test_text}'")
         results["tests"]["send_text"] = "PASSED"
 
@@ -92,8 +93,8 @@ def test_clipboard_operations(vnc, output_dir):
             "feature": "clipboard",
             "server": os.getenv("TCP_VNC_HOST", "unknown"),
         }
-        json_data = json.dumps(test_data, indent=2)
-        vnc.clipboard.send_text(json_data, delay=0.3)
+        json_data = json.dumps(test_data, separators=(",", ":"))
+        vnc.clipboard.send_text(json_data)
         print("   ✓ Sent JSON data to clipboard")
 
         # Verify JSON data
@@ -121,8 +122,7 @@ def test_clipboard_operations(vnc, output_dir):
     # Save results
     results["end_time"] = datetime.now().isoformat()
     results_file = output_dir / "clipboard_test_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    results_file.write_text(json.dumps(results, indent=2))
     print(f"\n📄 Test results saved to: {results_file}")
 
     return results
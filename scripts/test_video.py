@@ -18,7 +18,7 @@ Usage:
     python test_video.py
 """
 
-import time
+import json
 import os
 from pathlib import Path
 from datetime import datetime
@@ -31,10 +31,11 @@ dotenv.load_dotenv()
 def create_test_output_directory():
     """Create directory for test outputs."""
     output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep runs started in the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     test_dir = output_dir / f"video_test_{timestamp}"
-    test_dir.mkdir(exist_ok=True)
+    # Creates test_output on first use; fails rather than reuse a run
+    test_dir.mkdir(parents=True)
     return test_dir
 
 
@@ -53,37 +54,32 @@ def test_video_operations(vnc, output_dir):
         # Test 1: Timed recording
         print("\n1. Testing timed video recording...")
         print("   Recording 3 seconds at 5 FPS...")
-        frames = vnc.video.record(duration=3.0, fps=5.0)
-        print(f"   ✓ Recorded {len(frames)} frames")
-
-        # Save the recording
+        # Frames are written while recording instead of kept in memory
         video_dir = output_dir / "timed_recording"
-        vnc.video.save_frames(frames, str(video_dir))
+        frames = vnc.video.record(duration=3.0, fps=5.0, output_dir=video_dir)
+        print(f"   ✓ Recorded {len(frames)} frames")
         print(f"   ✓ Saved frames to: {video_dir}")
         results["tests"]["timed_recording"] = "PASSED"
 
         # Test 2: Background recording
         print("\n2. Testing background recording...")
         print("   Starting background recording at 10 FPS...")
-        vnc.video.start_recording(fps=10.0)
+        bg_video_dir = output_dir / "background_recording"
+        vnc.video.start_recording(fps=10.0, output_dir=bg_video_dir)
 
         # Perform some actions while recording
         print("   Performing actions during recording...")
-        time.sleep(0.5)
+        vnc.video.wait_for_frames(1, timeout=2.0)
         vnc.mouse.move_to(100, 100, delay=0.2)
         vnc.mouse.left_click(delay=0.2)
-        time.sleep(0.5)
+        vnc.video.wait_for_frames(vnc.video.frame_count + 5, timeout=2.0)
         vnc.keyboard.type_text("Video recording test", delay=0.1)
-        time.sleep(0.5)
+        vnc.video.wait_for_frames(vnc.video.frame_count + 5, timeout=2.0)
 
         # Stop recording
         print("   Stopping background recording...")
         frames_bg = vnc.video.stop_recording()
         print(f"   ✓ Recorded {len(frames_bg)} frames in background")
-
-        # Save background recording
-        bg_video_dir = output_dir / "background_recording"
-        vnc.video.save_frames(frames_bg, str(bg_video_dir))
         print(f"   ✓ Saved background frames to: {bg_video_dir}")
         results["tests"]["background_recording"] = "PASSED"
 
@@ -115,10 +111,7 @@ def test_video_operations(vnc, output_dir):
     # Save results
     results["end_time"] = datetime.now().isoformat()
     results_file = output_dir / "video_test_results.json"
-    with open(results_file, "w") as f:
-        import json
-
-        json.dump(results, f, indent=2)
+    results_file.write_text(json.dumps(results, indent=2))
     print(f"\n📄 Test results saved to: {results_file}")
 
     return results
@@ -32,10 +32,11 @@ dotenv.load_dotenv()
 def create_test_output_directory():
     """Create directory for test outputs."""
     output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep runs started in the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     test_dir = output_dir / f"websocket_clipboard_test_{timestamp}"
-    test_dir.mkdir(exist_ok=True)
+    # Creates test_output on first use; fails rather than reuse a run
+    test_dir.mkdir(parents=True)
     return test_dir
 
 
@@ -98,7 +99,7 @@ def test_clipboard_operations(vnc, output_dir):
                 "vmid": os.getenv("WEBSOCKET_VNC_VMID", "100"),
             },
         }
-        json_data = json.dumps(test_data, indent=2)
+        json_data = json.dumps(test_data, separators=(",", ":"))
         vnc.clipboard.send_text(json_data, delay=0.3)
         print("   ✓ Sent JSON data to clipboard")
 
@@ -123,8 +124,7 @@ def test_clipboard_operations(vnc, output_dir):
     # Save results
     results["end_time"] = datetime.now().isoformat()
     results_file = output_dir / "websocket_clipboard_test_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    results_file.write_text(json.dumps(results, indent=2))
     print(f"\n📄 Test results saved to: {results_file}")
 
     return results
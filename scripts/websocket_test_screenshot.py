@@ -18,6 +18,7 @@ Usage:
     python websocket_test_screenshot.py
 """
 
+import json
 import time
 import os
 from pathlib import Path
@@ -32,10 +33,11 @@ dotenv.load_dotenv()
 def create_test_output_directory():
     """Create directory for test outputs."""
     output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep runs started in the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     test_dir = output_dir / f"websocket_screenshot_test_{timestamp}"
-    test_dir.mkdir(exist_ok=True)
+    # Creates test_output on first use; fails rather than reuse a run
+    test_dir.mkdir(parents=True)
     return test_dir
 
 
@@ -78,9 +80,10 @@ def test_screenshot_operations(vnc, output_dir):
             (ImageFormat.JPEG, "jpeg"),
             (ImageFormat.BMP, "bmp"),
         ]
+        # Encode the capture from test 1 in each format (no new capture)
         for fmt_enum, fmt_name in format_tests:
             fmt_path = output_dir / f"websocket_screenshot.{fmt_name}"
-            vnc.screenshot.save(str(fmt_path), format=fmt_enum, delay=0.2)
+            fmt_path.write_bytes(vnc.screenshot.to_bytes(screenshot, fmt_enum))
             print(f"   ✓ Saved {fmt_name.upper()} format to: {fmt_path}")
         results["tests"]["format_save"] = "PASSED"
 
@@ -100,10 +103,7 @@ def test_screenshot_operations(vnc, output_dir):
     # Save results
     results["end_time"] = datetime.now().isoformat()
     results_file = output_dir / "websocket_screenshot_test_results.json"
-    with open(results_file, "w") as f:
-        import json
-
-        json.dump(results, f, indent=2)
+    results_file.write_text(json.dumps(results, indent=2))
     print(f"\n📄 Test results saved to: {results_file}")
 
     return results
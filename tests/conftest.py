@@ -27,6 +27,11 @@ def mock_vnc_connection() -> Mock:
     connection.is_connected = True
     connection.send_pointer_event = Mock()
     connection.send_key_event = Mock()
+    connection.send_key_events = Mock()
+    connection.send_pointer_events = Mock()
+    connection.extended_clipboard = False
+    connection.pixel_format = b""
+    connection.is_reading = False
     connection.connect = Mock()
     connection.disconnect = Mock()
     return connection
@@ -1,5 +1,10 @@
 """Tests for ClipboardController."""
 
+import socket
+import struct
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -18,6 +23,8 @@ class TestClipboardController:
         conn.is_connected = True
         conn.send_clipboard_text = Mock()
         conn.receive_clipboard_text = Mock(return_value=None)
+        conn.extended_clipboard = False
+        conn.is_reading = False
         return conn
 
     @pytest.fixture
@@ -210,3 +217,215 @@ class TestClipboardController:
             clipboard_controller.send_text("Test", delay=-1.0)
 
         mock_sleep.assert_not_called()
+
+    def test_large_text_compressed_when_extended(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that large text uses the extended clipboard when available."""
+        mock_connection.extended_clipboard = True
+        text = "x" * 300
+
+        clipboard_controller.send_text(text)
+
+        mock_connection.send_extended_clipboard_text.assert_called_once_with(text)
+        mock_connection.send_clipboard_text.assert_not_called()
+        assert clipboard_controller._cached_content == text
+
+    def test_small_text_not_compressed(self, clipboard_controller, mock_connection):
+        """Test that small text is sent as plain ClientCutText."""
+        mock_connection.extended_clipboard = True
+
+        clipboard_controller.send_text("short")
+
+        mock_connection.send_clipboard_text.assert_called_once_with("short")
+        mock_connection.send_extended_clipboard_text.assert_not_called()
+
+    def test_large_text_plain_without_extended(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that large text is sent plainly if not negotiated."""
+        text = "x" * 300
+
+        clipboard_controller.send_text(text)
+
+        mock_connection.send_clipboard_text.assert_called_once_with(text)
+        mock_connection.send_extended_clipboard_text.assert_not_called()
+
+    def test_large_unicode_text_with_extended(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that the extended format is not limited to latin-1."""
+        mock_connection.extended_clipboard = True
+        text = "日本語" * 100
+
+        clipboard_controller.send_text(text)
+
+        mock_connection.send_extended_clipboard_text.assert_called_once_with(text)
+
+    def test_enable_extended(self, clipboard_controller, mock_connection):
+        """Test that enable_extended advertises the pseudo-encoding."""
+
+        def receive_caps():
+            mock_connection.extended_clipboard = True
+
+        mock_connection.receive_clipboard_text.side_effect = receive_caps
+
+        assert clipboard_controller.enable_extended() is True
+        mock_connection.set_encodings.assert_called_once_with(
+            [
+                TCPVNCConnection.ENCODING_RAW,
+                TCPVNCConnection.ENCODING_EXTENDED_CLIPBOARD,
+            ]
+        )
+
+    def test_enable_extended_unsupported(self, clipboard_controller, mock_connection):
+        """Test that enable_extended reports servers without support."""
+        assert clipboard_controller.enable_extended() is False
+
+    def test_init_registers_listener(self, clipboard_controller, mock_connection):
+        """Test that the controller receives dispatched clipboard text."""
+        assert (
+            mock_connection.on_clipboard_text
+            == clipboard_controller._on_server_cut_text
+        )
+
+    def test_get_text_returns_dispatched_text(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that text delivered by another reader is returned at once."""
+        mock_connection.on_clipboard_text("copied")
+
+        assert clipboard_controller.get_text() == "copied"
+        mock_connection.receive_clipboard_text.assert_not_called()
+        assert clipboard_controller.content == "copied"
+
+        # The text is consumed
+        assert clipboard_controller.get_text() is None
+
+    def test_get_text_waits_for_active_reader(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that get_text waits on the reader instead of reading itself."""
+        mock_connection.is_reading = True
+        timer = threading.Timer(0.05, mock_connection.on_clipboard_text, ["late"])
+        timer.start()
+
+        start = time.monotonic()
+        result = clipboard_controller.get_text(timeout=2.0)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        assert result == "late"
+        assert elapsed < 1.0
+        mock_connection.receive_clipboard_text.assert_not_called()
+
+    def test_get_text_reader_timeout(self, clipboard_controller, mock_connection):
+        """Test that get_text gives up after timeout while a reader is active."""
+        mock_connection.is_reading = True
+
+        assert clipboard_controller.get_text(timeout=0.01) is None
+
+    def test_serial_counts_arrivals(self, clipboard_controller, mock_connection):
+        """Test that serial increases with each received clipboard text."""
+        assert clipboard_controller.serial == 0
+
+        mock_connection.on_clipboard_text("one")
+        mock_connection.on_clipboard_text("two")
+
+        assert clipboard_controller.serial == 2
+
+    def test_wait_for_change_with_active_reader(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that wait_for_change returns when new text is dispatched."""
+        mock_connection.is_reading = True
+        mock_connection.on_clipboard_text("old")
+        prev = clipboard_controller.serial
+        timer = threading.Timer(0.05, mock_connection.on_clipboard_text, ["new"])
+        timer.start()
+
+        start = time.monotonic()
+        result = clipboard_controller.wait_for_change(prev, timeout=2.0)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        assert result == "new"
+        assert elapsed < 1.0
+        assert clipboard_controller.content == "new"
+
+    def test_wait_for_change_timeout(self, clipboard_controller, mock_connection):
+        """Test that wait_for_change returns None without new text."""
+        mock_connection.is_reading = True
+
+        assert clipboard_controller.wait_for_change(0, timeout=0.01) is None
+
+    def test_wait_for_change_reads_directly(
+        self, clipboard_controller, mock_connection
+    ):
+        """Test that messages are read until clipboard text arrives."""
+
+        def read_server_message(timeout):
+            if mock_connection.read_server_message.call_count == 2:
+                mock_connection.on_clipboard_text("copied")
+            return None
+
+        mock_connection.read_server_message.side_effect = read_server_message
+
+        result = clipboard_controller.wait_for_change(0, timeout=1.0)
+
+        assert result == "copied"
+        assert mock_connection.read_server_message.call_count == 2
+
+    def test_wait_for_change_negative_timeout(self, clipboard_controller):
+        """Test that a negative timeout raises an error."""
+        with pytest.raises(VNCInputError):
+            clipboard_controller.wait_for_change(0, timeout=-1.0)
+
+
+class TestClipboardWaitForChangeStream:
+    """Test wait_for_change() reading a real server byte stream."""
+
+    @pytest.fixture
+    def stream(self):
+        """Connection on one end of a socket pair; the test is the server."""
+        client, server = socket.socketpair()
+        client.settimeout(3.0)
+        conn = TCPVNCConnection("localhost")
+        conn._socket = client
+        conn._connected = True
+        yield conn, server
+        client.close()
+        server.close()
+
+    @staticmethod
+    def _cut_text(text: str) -> bytes:
+        data = text.encode("latin-1")
+        return struct.pack("!Bxxxi", 3, len(data)) + data
+
+    def test_update_before_cut_text(self, stream):
+        """Test that a framebuffer update is consumed, not mistaken for text."""
+        conn, server = stream
+        update = struct.pack("!BxH", 0, 1) + struct.pack("!HHHHi", 0, 0, 1, 1, 0)
+        bell = b"\x02"
+        server.sendall(update + b"\x01\x02\x03\x04" + bell + self._cut_text("hello"))
+        clipboard = ClipboardController(conn)
+
+        assert clipboard.wait_for_change(0, timeout=1.0) == "hello"
+
+        # The stream is still in sync for the next message
+        server.sendall(self._cut_text("again"))
+        assert clipboard.wait_for_change(1, timeout=1.0) == "again"
+
+    def test_timeout_honoured(self, stream):
+        """Test that the wait ends at timeout, not the socket timeout."""
+        conn, _ = stream
+        clipboard = ClipboardController(conn)
+
+        start = time.monotonic()
+        result = clipboard.wait_for_change(0, timeout=0.2)
+        elapsed = time.monotonic() - start
+
+        assert result is None
+        assert elapsed < 1.0
+        assert conn.is_connected
+        assert conn._socket.gettimeout() == 3.0
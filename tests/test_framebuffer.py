@@ -4,6 +4,7 @@ Unit tests for FramebufferManager.
 Tests framebuffer initialization, updates, and buffer operations.
 """
 
+import struct
 from unittest.mock import Mock
 import pytest
 import numpy as np
@@ -180,6 +181,26 @@ class TestFramebufferGetBuffer:
         # But with same data
         assert np.array_equal(buffer1, buffer2)
 
+    def test_get_buffer_without_copy(self) -> None:
+        """Test get_buffer(copy=False) returns a read-only view."""
+        mock_conn = Mock(spec=TCPVNCConnection)
+        config = FramebufferConfig(
+            width=800, height=600, pixel_format=b"RGBA", name="test"
+        )
+        fb = FramebufferManager(mock_conn, config)
+        fb.initialize_buffer()
+
+        view = fb.get_buffer(copy=False)
+
+        assert view.shape == (600, 800, 4)
+        assert not view.flags.writeable
+        with pytest.raises(ValueError):
+            view[0, 0, 0] = 1
+
+        # The view follows later framebuffer changes
+        fb._buffer[0, 0, 0] = 7
+        assert view[0, 0, 0] == 7
+
 
 class TestFramebufferGetRegion:
     """Tests for get_region method."""
@@ -317,6 +338,63 @@ class TestFramebufferUpdateRectangle:
         assert np.all(region2 == 200)
 
 
+class TestFramebufferPixelFormat:
+    """Tests for decoding the server's native pixel format."""
+
+    @staticmethod
+    def _pixel_format(big_endian: int, shifts: tuple) -> bytes:
+        """Build a 32bpp true colour PIXEL_FORMAT."""
+        return struct.pack(
+            "!BBBBHHHBBBxxx", 32, 24, big_endian, 1, 255, 255, 255, *shifts
+        )
+
+    def test_little_endian_bgrx_is_reordered(self) -> None:
+        """Test the common BGRX layout (red shift 16, little-endian)."""
+        config = FramebufferConfig(
+            width=4,
+            height=2,
+            pixel_format=self._pixel_format(0, (16, 8, 0)),
+            name="test",
+        )
+        fb = FramebufferManager(Mock(spec=TCPVNCConnection), config)
+        fb.initialize_buffer()
+
+        # Wire bytes are blue, green, red, padding
+        fb.update_rectangle(1, 0, 2, 2, bytes([10, 20, 30, 0]) * 4)
+
+        assert fb.get_region(1, 0, 2, 2).tolist() == [[[30, 20, 10, 255]] * 2] * 2
+        # Pixels not yet received are opaque black
+        assert fb.get_region(0, 0, 1, 1).tolist() == [[[0, 0, 0, 255]]]
+
+    def test_big_endian_xrgb_is_reordered(self) -> None:
+        """Test a big-endian layout (padding, red, green, blue)."""
+        config = FramebufferConfig(
+            width=1,
+            height=1,
+            pixel_format=self._pixel_format(1, (16, 8, 0)),
+            name="test",
+        )
+        fb = FramebufferManager(Mock(spec=TCPVNCConnection), config)
+        fb.initialize_buffer()
+
+        fb.update_rectangle(0, 0, 1, 1, bytes([0, 30, 20, 10]))
+
+        assert fb.get_buffer().tolist() == [[[30, 20, 10, 255]]]
+
+    def test_unsupported_format_is_used_unchanged(self) -> None:
+        """Test that 16bpp formats fall back to copying the bytes."""
+        pixel_format = struct.pack("!BBBBHHHBBBxxx", 16, 16, 0, 1, 31, 63, 31, 11, 5, 0)
+        config = FramebufferConfig(
+            width=1, height=1, pixel_format=pixel_format, name="test"
+        )
+        fb = FramebufferManager(Mock(spec=TCPVNCConnection), config)
+        fb.initialize_buffer()
+
+        fb.update_rectangle(0, 0, 1, 1, bytes([1, 2, 3, 4]))
+
+        assert fb.get_buffer().tolist() == [[[1, 2, 3, 4]]]
+
+
 class TestFramebufferReset:
     """Tests for reset method."""
 
@@ -4,6 +4,7 @@ Integration tests for VNCAgentBridge facade and controller interactions.
 Tests complete workflows and interactions between multiple components.
 """
 
+import threading
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
@@ -21,6 +22,8 @@ def setup_bridge_with_mock() -> VNCAgentBridge:
     bridge._connection.is_connected = True
     bridge._connection.send_pointer_event = Mock()
     bridge._connection.send_key_event = Mock()
+    bridge._connection.send_key_events = Mock()
+    bridge._connection.send_pointer_events = Mock()
     bridge._mouse = MouseController(bridge._connection)
     bridge._keyboard = KeyboardController(bridge._connection)
     bridge._scroll = ScrollController(bridge._connection)
@@ -168,6 +171,40 @@ class TestBridgeContextManager:
         assert bridge.is_connected is False
 
 
+class TestBridgeSharedConnection:
+    """Tests for VNCAgentBridge.shared() and nested context managers."""
+
+    def test_nested_with_connects_once(self) -> None:
+        """Test that only the outermost block connects and disconnects."""
+        bridge = VNCAgentBridge("localhost")
+        with patch.object(bridge, "connect") as connect, patch.object(
+            bridge, "disconnect"
+        ) as disconnect:
+            with bridge:
+                with bridge:
+                    pass
+                disconnect.assert_not_called()
+            connect.assert_called_once()
+            disconnect.assert_called_once()
+
+    def test_shared_returns_same_bridge_per_address(self) -> None:
+        """Test that shared() reuses one bridge per host and port."""
+        first = VNCAgentBridge.shared("shared-host", port=5900)
+        assert VNCAgentBridge.shared("shared-host", port=5900) is first
+        assert VNCAgentBridge.shared("shared-host", port=5901) is not first
+
+    def test_shared_is_per_thread(self) -> None:
+        """Test that other threads get their own shared bridge."""
+        main_bridge = VNCAgentBridge.shared("thread-host")
+        other: list = []
+        worker = threading.Thread(
+            target=lambda: other.append(VNCAgentBridge.shared("thread-host"))
+        )
+        worker.start()
+        worker.join()
+        assert other[0] is not main_bridge
+
+
 class TestBridgeWorkflows:
     """Tests for complete workflows using bridge."""
 
@@ -182,7 +219,7 @@ class TestBridgeWorkflows:
 
         # Verify calls were made
         assert bridge._connection.send_pointer_event.call_count >= 2
-        assert bridge._connection.send_key_event.call_count >= 5
+        bridge._connection.send_key_events.assert_called_once()
 
     def test_workflow_all_operations(self) -> None:
         """Test workflow using all controller types."""
@@ -201,7 +238,8 @@ class TestBridgeWorkflows:
 
         # Verify all operations were performed
         assert bridge._connection.send_pointer_event.call_count >= 2
-        assert bridge._connection.send_key_event.call_count >= 6
+        assert bridge._connection.send_key_event.call_count >= 2
+        bridge._connection.send_key_events.assert_called_once()
 
     def test_workflow_sequential_operations(self) -> None:
         """Test sequential operations in workflow."""
@@ -220,7 +258,8 @@ class TestBridgeWorkflows:
 
         # Verify all operations completed
         assert bridge._connection.send_pointer_event.call_count >= 5
-        assert bridge._connection.send_key_event.call_count >= 7
+        # hotkey and type_text each send one batch
+        assert bridge._connection.send_key_events.call_count == 2
 
 
 class TestBridgeStateManagement:
@@ -384,7 +423,7 @@ class TestBridgeV020Features:
 
         # Verify all components were used
         assert bridge._connection.send_pointer_event.called
-        assert bridge._connection.send_key_event.called
+        assert bridge._connection.send_key_events.called
         bridge._clipboard.send_text.assert_called_once_with("copied text")
         bridge._screenshot.capture.assert_called_once()
         bridge._video.record.assert_called_once_with(duration=1.0)
@@ -411,3 +450,42 @@ class TestBridgeV020Features:
         assert bridge.keyboard is not None
         assert bridge.scroll is not None
         assert bridge.clipboard is not None
+
+    def test_bridge_connect_defers_framebuffer(self) -> None:
+        """Test that connect() does not create framebuffer components."""
+        connection = Mock(spec=TCPVNCConnection)
+        connection.is_connected = True
+        bridge = VNCAgentBridge(connection=connection)
+
+        bridge.connect()
+
+        assert bridge._framebuffer is None
+        assert bridge._screenshot is None
+        assert bridge._video is None
+
+    def test_bridge_screenshot_created_on_first_access(self) -> None:
+        """Test that screenshot and video share lazily created components."""
+        connection = Mock(spec=TCPVNCConnection)
+        connection.is_connected = True
+        connection.pixel_format = b""
+        bridge = VNCAgentBridge(connection=connection)
+        bridge.connect()
+
+        screenshot = bridge.screenshot
+
+        assert screenshot is bridge.screenshot
+        assert bridge.video._screenshot is screenshot
+        assert bridge.framebuffer is screenshot.framebuffer
+        assert bridge.framebuffer.config.pixel_format == b""
+
+    def test_bridge_screenshot_not_created_when_disconnected(self) -> None:
+        """Test that components are not created without a connection."""
+        from vnc_agent_bridge.exceptions import VNCStateError
+
+        connection = Mock(spec=TCPVNCConnection)
+        connection.is_connected = False
+        bridge = VNCAgentBridge(connection=connection)
+
+        with pytest.raises(VNCStateError):
+            bridge.screenshot
+        assert bridge.framebuffer is None
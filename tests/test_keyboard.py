@@ -5,7 +5,7 @@ Tests keyboard operations including text input, key pressing,
 hotkeys, and key press/release sequences with mock VNC connections.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import pytest
 
 from vnc_agent_bridge.core.keyboard import KeyboardController
@@ -20,8 +20,12 @@ class TestKeyboardTypeText:
     ) -> None:
         """Test typing simple ASCII text."""
         keyboard_controller.type_text("hello")
-        # Should send key events for each character
-        assert mock_vnc_connection.send_key_event.call_count >= 5
+        # Should send a press and release for each character in one batch
+        mock_vnc_connection.send_key_events.assert_called_once()
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 10
+        assert events[0] == (ord("h"), True)
+        assert events[1] == (ord("h"), False)
 
     def test_type_empty_string(self, keyboard_controller: KeyboardController) -> None:
         """Test typing empty string raises error."""
@@ -33,28 +37,82 @@ class TestKeyboardTypeText:
     ) -> None:
         """Test typing numbers."""
         keyboard_controller.type_text("12345")
-        assert mock_vnc_connection.send_key_event.call_count >= 5
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 10
 
     def test_type_special_characters(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test typing special characters."""
         keyboard_controller.type_text("!@#$%")
-        assert mock_vnc_connection.send_key_event.call_count >= 5
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 10
 
     def test_type_with_delay(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test type_text with delay parameter."""
         keyboard_controller.type_text("test", delay=0.1)
-        assert mock_vnc_connection.send_key_event.call_count >= 4
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 8
 
     def test_type_spaces_and_punctuation(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test typing text with spaces and punctuation."""
         keyboard_controller.type_text("hello world!")
-        assert mock_vnc_connection.send_key_event.call_count >= 11
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 24
+
+    def test_type_with_interval(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test type_text with interval sends each character separately."""
+        keyboard_controller.type_text("abc", interval=0.01)
+        mock_vnc_connection.send_key_events.assert_not_called()
+        assert mock_vnc_connection.send_key_event.call_count == 6
+
+    def test_type_long_text_pastes_via_clipboard(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that text at the paste threshold goes through the clipboard."""
+        keyboard_controller.type_text("hello world", paste_threshold=5)
+        mock_vnc_connection.send_clipboard_text.assert_called_once_with("hello world")
+        mock_vnc_connection.send_key_events.assert_called_once_with(
+            [(0xFFE3, True), (ord("v"), True), (ord("v"), False), (0xFFE3, False)]
+        )
+
+    def test_type_short_text_below_paste_threshold(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that text shorter than the threshold is typed."""
+        keyboard_controller.type_text("hi", paste_threshold=5)
+        mock_vnc_connection.send_clipboard_text.assert_not_called()
+        assert len(mock_vnc_connection.send_key_events.call_args[0][0]) == 4
+
+    def test_type_non_latin1_text_is_typed(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that text the clipboard cannot carry is typed instead."""
+        keyboard_controller.type_text("привет мир", paste_threshold=1)
+        mock_vnc_connection.send_clipboard_text.assert_not_called()
+        assert len(mock_vnc_connection.send_key_events.call_args[0][0]) == 20
+
+    def test_type_with_interval_schedule(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test type_text with one pause per character."""
+        keyboard_controller.type_text("abc", interval=[0.01, 0, 0.02])
+        mock_vnc_connection.send_key_events.assert_not_called()
+        assert mock_vnc_connection.send_key_event.call_count == 6
+
+    def test_type_with_interval_schedule_length_mismatch(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a schedule of the wrong length raises before sending."""
+        with pytest.raises(VNCInputError):
+            keyboard_controller.type_text("abc", interval=[0.01, 0.01])
+        mock_vnc_connection.send_key_event.assert_not_called()
 
     def test_type_disconnected(self, mock_vnc_connection: Mock) -> None:
         """Test that type_text when disconnected raises VNCStateError."""
@@ -130,42 +188,78 @@ class TestKeyboardHotkey:
         """Test Ctrl+A hotkey."""
         keyboard_controller.hotkey("ctrl", "a")
         # Should send key events for ctrl down, a press, ctrl up
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 3
 
     def test_hotkey_ctrl_c(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test Ctrl+C hotkey."""
         keyboard_controller.hotkey("ctrl", "c")
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 3
 
     def test_hotkey_shift_tab(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test Shift+Tab hotkey."""
         keyboard_controller.hotkey("shift", "tab")
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 3
 
     def test_hotkey_multiple_modifiers(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test hotkey with multiple modifiers."""
         keyboard_controller.hotkey("ctrl", "shift", "delete")
-        assert mock_vnc_connection.send_key_event.call_count >= 4
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 4
 
     def test_hotkey_with_delay(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test hotkey with delay parameter."""
         keyboard_controller.hotkey("ctrl", "a", delay=0.1)
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 3
 
     def test_hotkey_alt_f4(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
     ) -> None:
         """Test Alt+F4 hotkey."""
         keyboard_controller.hotkey("alt", "f4")
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) >= 3
+
+    def test_hotkey_repeated_uses_cached_keysyms(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a repeated combination is resolved only once."""
+        with patch.object(
+            keyboard_controller, "_get_keycode", wraps=keyboard_controller._get_keycode
+        ) as get_keycode:
+            keyboard_controller.hotkey("ctrl", "c")
+            keyboard_controller.hotkey("ctrl", "c")
+        assert get_keycode.call_count == 2
+        assert mock_vnc_connection.send_key_events.call_count == 2
+
+    def test_hotkey_invalid_combo_not_cached(
+        self, keyboard_controller: KeyboardController
+    ) -> None:
+        """Test that invalid combinations keep raising."""
+        for _ in range(2):
+            with pytest.raises(VNCInputError):
+                keyboard_controller.hotkey("z", "undo")
+
+    def test_hotkey_single_write(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a hotkey is sent as one batch in press/release order."""
+        keyboard_controller.hotkey("ctrl", "v")
+        mock_vnc_connection.send_key_event.assert_not_called()
+        mock_vnc_connection.send_key_events.assert_called_once_with(
+            [(0xFFE3, True), (ord("v"), True), (ord("v"), False), (0xFFE3, False)]
+        )
 
     def test_hotkey_disconnected(self, mock_vnc_connection: Mock) -> None:
         """Test that hotkey when disconnected raises VNCStateError."""
@@ -175,6 +269,134 @@ class TestKeyboardHotkey:
             controller.hotkey("ctrl", "a")
 
 
+class TestKeyboardHotkeyBatch:
+    """Tests for KeyboardController.hotkey_batch() method."""
+
+    def test_hotkey_batch_single_write(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that all combinations are sent in one batch."""
+        keyboard_controller.hotkey_batch([("ctrl", "a"), ("ctrl", "c")])
+        mock_vnc_connection.send_key_events.assert_called_once()
+        mock_vnc_connection.send_key_event.assert_not_called()
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert events == [
+            (0xFFE3, True),
+            (ord("a"), True),
+            (ord("a"), False),
+            (0xFFE3, False),
+            (0xFFE3, True),
+            (ord("c"), True),
+            (ord("c"), False),
+            (0xFFE3, False),
+        ]
+
+    def test_hotkey_batch_releases_modifiers_in_reverse(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test modifier release order within a combination."""
+        keyboard_controller.hotkey_batch([("ctrl", "shift", "esc")])
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert events[-2:] == [(0xFFE1, False), (0xFFE3, False)]
+
+    def test_hotkey_batch_invalid_combo_sends_nothing(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that an invalid combination aborts the whole batch."""
+        with pytest.raises(VNCInputError):
+            keyboard_controller.hotkey_batch([("ctrl", "a"), ("z", "undo")])
+        mock_vnc_connection.send_key_events.assert_not_called()
+
+    def test_hotkey_batch_disconnected(self, mock_vnc_connection: Mock) -> None:
+        """Test that hotkey_batch when disconnected raises VNCStateError."""
+        mock_vnc_connection.is_connected = False
+        controller = KeyboardController(mock_vnc_connection)
+        with pytest.raises(VNCStateError):
+            controller.hotkey_batch([("ctrl", "a")])
+
+
+class TestKeyboardSequence:
+    """Tests for KeyboardController.sequence() context manager."""
+
+    def test_sequence_sends_one_batch(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that operations inside a sequence are sent in one write."""
+        with keyboard_controller.sequence():
+            keyboard_controller.hotkey("ctrl", "a")
+            keyboard_controller.press_key("return", delay=5)
+            keyboard_controller.type_text("hi", interval=5)
+            mock_vnc_connection.send_key_events.assert_not_called()
+
+        mock_vnc_connection.send_key_event.assert_not_called()
+        mock_vnc_connection.send_key_events.assert_called_once()
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert events == [
+            (0xFFE3, True),
+            (ord("a"), True),
+            (ord("a"), False),
+            (0xFFE3, False),
+            (0xFF0D, True),
+            (0xFF0D, False),
+            (ord("h"), True),
+            (ord("h"), False),
+            (ord("i"), True),
+            (ord("i"), False),
+        ]
+
+    def test_sequence_includes_keydown_keyup(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that held keys are queued in order."""
+        with keyboard_controller.sequence():
+            keyboard_controller.keydown("shift")
+            keyboard_controller.press_key("right")
+            keyboard_controller.keyup("shift")
+
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert events == [
+            (0xFFE1, True),
+            (0xFF53, True),
+            (0xFF53, False),
+            (0xFFE1, False),
+        ]
+
+    def test_nested_sequence_joins_outer(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a nested sequence is flushed with the outer one."""
+        with keyboard_controller.sequence():
+            with keyboard_controller.sequence():
+                keyboard_controller.press_key("a")
+            mock_vnc_connection.send_key_events.assert_not_called()
+            keyboard_controller.press_key("b")
+
+        mock_vnc_connection.send_key_events.assert_called_once()
+        assert len(mock_vnc_connection.send_key_events.call_args[0][0]) == 4
+
+    def test_sequence_discards_on_error(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that queued events are dropped if the block raises."""
+        with pytest.raises(VNCInputError):
+            with keyboard_controller.sequence():
+                keyboard_controller.press_key("a")
+                keyboard_controller.press_key("not_a_key")
+
+        mock_vnc_connection.send_key_events.assert_not_called()
+        # Controller is usable again afterwards
+        keyboard_controller.press_key("a")
+        assert mock_vnc_connection.send_key_event.call_count == 2
+
+    def test_empty_sequence_sends_nothing(
+        self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that an empty sequence performs no write."""
+        with keyboard_controller.sequence():
+            pass
+        mock_vnc_connection.send_key_events.assert_not_called()
+
+
 class TestKeyboardKeydownKeyup:
     """Tests for KeyboardController.keydown() and keyup() methods."""
 
@@ -266,7 +488,8 @@ class TestKeyboardEdgeCases:
         """Test typing very long text."""
         long_text = "a" * 100
         keyboard_controller.type_text(long_text)
-        assert mock_vnc_connection.send_key_event.call_count >= 100
+        events = mock_vnc_connection.send_key_events.call_args[0][0]
+        assert len(events) == 200
 
     def test_sequential_different_operations(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
@@ -284,7 +507,7 @@ class TestKeyboardEdgeCases:
         keyboard_controller.hotkey("ctrl", "a")
         mock_vnc_connection.reset_mock()
         keyboard_controller.hotkey("ctrl", "c")
-        assert mock_vnc_connection.send_key_event.call_count >= 3
+        mock_vnc_connection.send_key_events.assert_called_once()
 
     def test_keydown_multiple_modifiers(
         self, keyboard_controller: KeyboardController, mock_vnc_connection: Mock
@@ -217,6 +217,90 @@ class TestMouseDragTo:
         # Should still generate pointer events
         assert mock_vnc_connection.send_pointer_event.call_count >= 1
 
+    def test_drag_to_follows_interpolated_path(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that drag moves along the path and releases at the target."""
+        mouse_controller.drag_to(100, 50, duration=0.2)
+        calls = mock_vnc_connection.send_pointer_event.call_args_list
+        # Press, two-step path (start, midpoint, end), release
+        assert [c[0] for c in calls] == [
+            (0, 0, 1),
+            (0, 0, 1),
+            (50, 25, 1),
+            (100, 50, 1),
+            (100, 50, 0),
+        ]
+        assert mouse_controller.get_position() == (100, 50)
+
+
+class TestMouseSequence:
+    """Tests for MouseController.sequence() context manager."""
+
+    def test_sequence_sends_one_batch(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that operations inside a sequence are sent in one write."""
+        with mouse_controller.sequence():
+            mouse_controller.left_click(100, 150, delay=5)
+            mouse_controller.right_click(delay=5)
+            mouse_controller.move_to(10, 20)
+            mock_vnc_connection.send_pointer_events.assert_not_called()
+
+        mock_vnc_connection.send_pointer_event.assert_not_called()
+        mock_vnc_connection.send_pointer_events.assert_called_once()
+        events = mock_vnc_connection.send_pointer_events.call_args[0][0]
+        assert events == [
+            (100, 150, 0),
+            (100, 150, 1),
+            (100, 150, 0),
+            (100, 150, 4),
+            (100, 150, 0),
+            (10, 20, 0),
+        ]
+
+    def test_sequence_skips_drag_pauses(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a drag inside a sequence is queued without sleeping."""
+        with mouse_controller.sequence():
+            mouse_controller.drag_to(100, 50, duration=30.0)
+
+        events = mock_vnc_connection.send_pointer_events.call_args[0][0]
+        assert events[0] == (0, 0, 1)
+        assert events[-1] == (100, 50, 0)
+        assert mouse_controller.get_position() == (100, 50)
+
+    def test_nested_sequence_joins_outer(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a nested sequence is flushed with the outer one."""
+        with mouse_controller.sequence():
+            with mouse_controller.sequence():
+                mouse_controller.move_to(1, 1)
+            mock_vnc_connection.send_pointer_events.assert_not_called()
+            mouse_controller.move_to(2, 2)
+
+        mock_vnc_connection.send_pointer_events.assert_called_once_with(
+            [(1, 1, 0), (2, 2, 0)]
+        )
+
+    def test_sequence_discards_on_error(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that queued events are dropped if the block raises."""
+        with pytest.raises(VNCInputError):
+            with mouse_controller.sequence():
+                mouse_controller.move_to(1, 1)
+                mouse_controller.move_to(-1, 1)
+
+        mock_vnc_connection.send_pointer_events.assert_not_called()
+        mock_vnc_connection.send_pointer_event.assert_not_called()
+
+        # Operations after the failed sequence are sent directly again
+        mouse_controller.move_to(3, 3)
+        mock_vnc_connection.send_pointer_event.assert_called_once_with(3, 3, 0)
+
 
 class TestMouseGetPosition:
     """Tests for MouseController.get_position() method."""
@@ -252,6 +336,15 @@ class TestMouseGetPosition:
         assert x == 0
         assert y == 0
 
+    def test_get_position_does_not_query_server(
+        self, mouse_controller: MouseController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that get_position is answered from the tracked position."""
+        mouse_controller.move_to(10, 20)
+        mock_vnc_connection.reset_mock()
+        assert mouse_controller.get_position() == (10, 20)
+        assert mock_vnc_connection.method_calls == []
+
 
 class TestMouseEdgeCases:
     """Edge case tests for MouseController."""
@@ -284,6 +377,28 @@ class TestMouseEdgeCases:
         assert calls[1][0][2] == 1  # button down
         assert calls[2][0][2] == 0  # button up
 
+    @pytest.mark.parametrize(
+        "x, y, message",
+        [
+            (65536, 0, "<= 65535"),
+            (0, 70000, "<= 65535"),
+            (-1, 65536, "non-negative"),
+            (100, -65536, "non-negative"),
+        ],
+    )
+    def test_out_of_range_coordinates(
+        self,
+        mouse_controller: MouseController,
+        mock_vnc_connection: Mock,
+        x: int,
+        y: int,
+        message: str,
+    ) -> None:
+        """Test that coordinates outside 0-65535 are rejected with a reason."""
+        with pytest.raises(VNCInputError, match=message):
+            mouse_controller.move_to(x, y)
+        mock_vnc_connection.send_pointer_event.assert_not_called()
+
     def test_sequential_different_operations(
         self, mouse_controller: MouseController, mock_vnc_connection: Mock
     ) -> None:
@@ -12,10 +12,12 @@ Tests cover:
 import pytest
 import numpy as np
 import tempfile
+import threading
 import os
+from pathlib import Path
 from unittest.mock import Mock, patch
 
-from vnc_agent_bridge.core.screenshot import ScreenshotController
+from vnc_agent_bridge.core.screenshot import PNG_COMPRESS_LEVEL, ScreenshotController
 from vnc_agent_bridge.types.common import ImageFormat
 from vnc_agent_bridge.exceptions import VNCInputError
 
@@ -101,6 +103,25 @@ class TestScreenshotCapture:
 
         mock_sleep.assert_not_called()
 
+    def test_capture_copy_flag(
+        self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
+    ) -> None:
+        """Test that capture passes the copy flag to the framebuffer."""
+        screenshot_controller.capture()
+        mock_framebuffer.get_buffer.assert_called_with(copy=True)
+
+        screenshot_controller.capture(copy=False)
+        mock_framebuffer.get_buffer.assert_called_with(copy=False)
+
+    def test_save_does_not_copy(
+        self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
+    ) -> None:
+        """Test that save encodes a view of the framebuffer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            screenshot_controller.save(os.path.join(tmpdir, "test.png"))
+
+        mock_framebuffer.get_buffer.assert_called_once_with(copy=False)
+
 
 class TestCaptureRegion:
     """Test region capture methods."""
@@ -226,6 +247,16 @@ class TestSaveScreenshot:
 
             assert os.path.exists(filepath)
 
+    def test_save_accepts_path_object(
+        self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
+    ) -> None:
+        """Test that a pathlib.Path can be passed instead of a string."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "test.png"
+            screenshot_controller.save(filepath)
+
+            assert filepath.exists()
+
     def test_save_default_format_is_png(
         self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
     ) -> None:
@@ -320,6 +351,150 @@ class TestSaveRegion:
             mock_sleep.assert_called_once_with(1.5)
 
 
+class TestPipelinedRegions:
+    """Test pipelined capture_regions() and save_regions()."""
+
+    def test_capture_regions_requests_before_reading(
+        self,
+        screenshot_controller: ScreenshotController,
+        mock_connection: Mock,
+        mock_framebuffer: Mock,
+    ) -> None:
+        """Test that all requests are sent before the first reply is read."""
+        calls = []
+
+        def read_update() -> list:
+            calls.append("read")
+            return []
+
+        mock_framebuffer.request_update.side_effect = lambda **_: calls.append("req")
+        mock_connection.read_framebuffer_update.side_effect = read_update
+
+        screenshot_controller.capture_regions(
+            [(0, 0, 100, 50), (0, 50, 100, 50), (0, 100, 100, 50)]
+        )
+
+        assert calls == ["req"] * 3 + ["read"] * 3
+
+    def test_capture_regions_returns_each_region(
+        self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
+    ) -> None:
+        """Test that regions are returned in order."""
+        arrays = screenshot_controller.capture_regions(
+            [(0, 0, 400, 300), (10, 20, 400, 300)]
+        )
+
+        assert len(arrays) == 2
+        mock_framebuffer.get_region.assert_any_call(0, 0, 400, 300)
+        mock_framebuffer.get_region.assert_any_call(10, 20, 400, 300)
+
+    def test_capture_regions_stops_when_covered(
+        self,
+        screenshot_controller: ScreenshotController,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that a merged reply covering every region ends the reads."""
+        mock_connection.read_framebuffer_update.return_value = [(0, 0, 1920, 1080, b"")]
+
+        screenshot_controller.capture_regions([(0, 0, 10, 10), (100, 100, 10, 10)])
+
+        mock_connection.read_framebuffer_update.assert_called_once()
+
+    def test_capture_regions_invalid_region_sends_nothing(
+        self, screenshot_controller: ScreenshotController, mock_framebuffer: Mock
+    ) -> None:
+        """Test that validation happens before any request is sent."""
+        with pytest.raises(VNCInputError):
+            screenshot_controller.capture_regions(
+                [(0, 0, 100, 100), (1900, 0, 100, 100)]
+            )
+
+        mock_framebuffer.request_update.assert_not_called()
+
+    def test_save_regions(self, screenshot_controller: ScreenshotController) -> None:
+        """Test saving several regions to files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f"region_{i}.png") for i in range(2)]
+            screenshot_controller.save_regions(
+                {paths[0]: (0, 0, 400, 300), paths[1]: (400, 0, 400, 300)}
+            )
+
+            assert all(os.path.exists(path) for path in paths)
+
+    def test_save_regions_encodes_in_parallel(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that region images are encoded on several threads."""
+        started = threading.Barrier(2, timeout=5.0)
+        threads = set()
+
+        def save_array(array: np.ndarray, filepath: str, format: ImageFormat) -> None:
+            # Only returns once two encodes are running at the same time
+            started.wait()
+            threads.add(threading.get_ident())
+
+        with patch("vnc_agent_bridge.core.screenshot.MAX_ENCODER_THREADS", 2):
+            with patch.object(
+                screenshot_controller, "save_array", side_effect=save_array
+            ) as mock_save:
+                screenshot_controller.save_regions(
+                    {"a.png": (0, 0, 10, 10), "b.png": (10, 0, 10, 10)}
+                )
+
+        assert len(threads) == 2
+        assert {c.args[1] for c in mock_save.call_args_list} == {"a.png", "b.png"}
+
+    def test_save_regions_raises_encode_error(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that a failed write is raised after the other files are saved."""
+        with patch("vnc_agent_bridge.core.screenshot.MAX_ENCODER_THREADS", 2):
+            with patch.object(
+                screenshot_controller,
+                "save_array",
+                side_effect=[OSError("disk full"), None],
+            ) as mock_save:
+                with pytest.raises(OSError):
+                    screenshot_controller.save_regions(
+                        {"a.png": (0, 0, 10, 10), "b.png": (10, 0, 10, 10)}
+                    )
+
+        assert mock_save.call_count == 2
+
+
+class TestSaveArrays:
+    """Test parallel saving of several arrays."""
+
+    def test_save_arrays_writes_every_file(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that every array is written to its own file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            items = [
+                (Path(tmpdir) / f"frame_{i}.png", _create_test_array(8, 8))
+                for i in range(6)
+            ]
+            screenshot_controller.save_arrays(items, ImageFormat.PNG)
+
+            assert all(path.exists() for path, _ in items)
+
+    def test_save_arrays_single_item_inline(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that a single array is saved on the calling thread."""
+        threads = []
+        with patch.object(
+            screenshot_controller,
+            "save_array",
+            side_effect=lambda *args: threads.append(threading.get_ident()),
+        ):
+            screenshot_controller.save_arrays(
+                [("a.png", _create_test_array(8, 8))], ImageFormat.PNG
+            )
+
+        assert threads == [threading.get_ident()]
+
+
 class TestArrayConversion:
     """Test numpy array to PIL Image conversion."""
 
@@ -399,6 +574,25 @@ class TestBytesExport:
         # JPEG magic number
         assert result[:2] == b"\xff\xd8"
 
+    def test_to_bytes_jpeg_alpha(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that JPEG export handles opaque and translucent arrays alike."""
+        import io
+
+        from PIL import Image
+
+        opaque = np.zeros((32, 32, 4), dtype=np.uint8)
+        opaque[..., 3] = 255
+        translucent = np.zeros((32, 32, 4), dtype=np.uint8)
+
+        # Opaque black stays black; fully transparent black becomes white
+        for array, expected in ((opaque, 0), (translucent, 255)):
+            result = screenshot_controller.to_bytes(array, format=ImageFormat.JPEG)
+            decoded = np.asarray(Image.open(io.BytesIO(result)))
+            assert decoded.shape == (32, 32, 3)
+            assert np.all(np.abs(decoded.astype(int) - expected) <= 2)
+
     def test_to_bytes_bmp(self, screenshot_controller: ScreenshotController) -> None:
         """Test exporting array as BMP bytes."""
         array = _create_test_array(100, 100)
@@ -418,6 +612,23 @@ class TestBytesExport:
 
         assert result[:8] == b"\x89PNG\r\n\x1a\n"
 
+    def test_to_bytes_png_fast_compression(
+        self, screenshot_controller: ScreenshotController
+    ) -> None:
+        """Test that PNGs use the fast compression level and stay lossless."""
+        import io
+
+        from PIL import Image
+
+        array = _create_test_array(64, 48)
+        with patch.object(Image.Image, "save", autospec=True) as save:
+            screenshot_controller.to_bytes(array, format=ImageFormat.PNG)
+        assert save.call_args.kwargs["compress_level"] == PNG_COMPRESS_LEVEL
+
+        result = screenshot_controller.to_bytes(array, format=ImageFormat.PNG)
+        decoded = np.asarray(Image.open(io.BytesIO(result)).convert("RGBA"))
+        assert np.array_equal(decoded, array)
+
     def test_to_bytes_invalid_array(
         self, screenshot_controller: ScreenshotController
     ) -> None:
@@ -577,7 +788,7 @@ class TestEdgeCases:
 
 
 class TestSaveArrayHelper:
-    """Test _save_array helper method."""
+    """Test save_array() method."""
 
     def test_save_array_creates_file(
         self, screenshot_controller: ScreenshotController
@@ -587,7 +798,7 @@ class TestSaveArrayHelper:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             filepath = os.path.join(tmpdir, "test.png")
-            screenshot_controller._save_array(array, filepath, ImageFormat.PNG)
+            screenshot_controller.save_array(array, filepath, ImageFormat.PNG)
 
             assert os.path.exists(filepath)
             assert os.path.getsize(filepath) > 0
@@ -601,6 +812,6 @@ class TestSaveArrayHelper:
         with tempfile.TemporaryDirectory() as tmpdir:
             for format_type in [ImageFormat.PNG, ImageFormat.JPEG, ImageFormat.BMP]:
                 filepath = os.path.join(tmpdir, f"test.{format_type.value}")
-                screenshot_controller._save_array(array, filepath, format_type)
+                screenshot_controller.save_array(array, filepath, format_type)
 
                 assert os.path.exists(filepath)
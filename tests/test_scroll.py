@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 
 from vnc_agent_bridge.core.scroll import ScrollController
+from vnc_agent_bridge.types.common import ScrollDirection
 from vnc_agent_bridge.exceptions import VNCInputError, VNCStateError
 
 
@@ -186,6 +187,72 @@ class TestScrollTo:
             controller.scroll_to(100, 200)
 
 
+class TestScrollEvents:
+    """Tests for the pointer events generated by scrolling."""
+
+    def test_scroll_up_presses_and_releases_button_4(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that each scroll up tick is a button 4 press and release."""
+        scroll_controller.scroll_up(1)
+        calls = [c[0] for c in mock_vnc_connection.send_pointer_event.call_args_list]
+        assert calls == [(0, 0, 8), (0, 0, 0)]
+
+    def test_scroll_down_at_scroll_to_position(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that wheel events are sent at the last scroll_to position."""
+        scroll_controller.scroll_to(400, 300)
+        mock_vnc_connection.reset_mock()
+        scroll_controller.scroll_down(1)
+        calls = [c[0] for c in mock_vnc_connection.send_pointer_event.call_args_list]
+        assert calls == [(400, 300, 16), (400, 300, 0)]
+
+
+class TestScrollBatch:
+    """Tests for ScrollController.batch() method."""
+
+    def test_batch_single_write(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that all scroll steps are sent in one batch."""
+        scroll_controller.batch([("up", 2), (ScrollDirection.DOWN, 1)])
+        mock_vnc_connection.send_pointer_event.assert_not_called()
+        mock_vnc_connection.send_pointer_events.assert_called_once_with(
+            [(0, 0, 8), (0, 0, 0), (0, 0, 8), (0, 0, 0), (0, 0, 16), (0, 0, 0)]
+        )
+
+    def test_batch_invalid_direction_sends_nothing(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that an unknown direction aborts the whole batch."""
+        with pytest.raises(VNCInputError):
+            scroll_controller.batch([("up", 2), ("sideways", 1)])
+        mock_vnc_connection.send_pointer_events.assert_not_called()
+
+    def test_batch_negative_amount(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that a negative amount raises VNCInputError."""
+        with pytest.raises(VNCInputError):
+            scroll_controller.batch([("down", -1)])
+        mock_vnc_connection.send_pointer_events.assert_not_called()
+
+    def test_batch_empty(
+        self, scroll_controller: ScrollController, mock_vnc_connection: Mock
+    ) -> None:
+        """Test that an empty batch performs no write."""
+        scroll_controller.batch([("up", 0)])
+        mock_vnc_connection.send_pointer_events.assert_not_called()
+
+    def test_batch_disconnected(self, mock_vnc_connection: Mock) -> None:
+        """Test that batch when disconnected raises VNCStateError."""
+        mock_vnc_connection.is_connected = False
+        controller = ScrollController(mock_vnc_connection)
+        with pytest.raises(VNCStateError):
+            controller.batch([("up", 1)])
+
+
 class TestScrollEdgeCases:
     """Edge case tests for ScrollController."""
 
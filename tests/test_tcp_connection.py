@@ -5,7 +5,11 @@ Tests connection lifecycle, protocol handling, and error scenarios
 with mock socket connections.
 """
 
-from unittest.mock import Mock, patch, MagicMock
+import io
+import socket
+import struct
+import zlib
+from unittest.mock import Mock, patch, MagicMock, call
 import pytest
 
 from vnc_agent_bridge.core.connection_tcp import TCPVNCConnection
@@ -13,6 +17,7 @@ from vnc_agent_bridge.exceptions import (
     VNCConnectionError,
     VNCStateError,
     VNCProtocolError,
+    VNCTimeoutError,
 )
 
 
@@ -75,6 +80,56 @@ class TestConnectionConnect:
         with pytest.raises(VNCConnectionError):
             conn.connect()
 
+    @patch("socket.socket")
+    def test_connection_connect_disables_nagle(self, mock_socket_class: Mock) -> None:
+        """Test that TCP_NODELAY is set before connecting."""
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+        mock_socket.connect.side_effect = OSError("Connection refused")
+
+        conn = TCPVNCConnection("localhost")
+        with pytest.raises(VNCConnectionError):
+            conn.connect()
+
+        mock_socket.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    @patch("socket.socket")
+    def test_connection_connect_keeps_nagle_when_disabled(
+        self, mock_socket_class: Mock
+    ) -> None:
+        """Test that tcp_nodelay=False leaves the socket options alone."""
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+        mock_socket.connect.side_effect = OSError("Connection refused")
+
+        conn = TCPVNCConnection("localhost", tcp_nodelay=False)
+        with pytest.raises(VNCConnectionError):
+            conn.connect()
+
+        mock_socket.setsockopt.assert_not_called()
+
+    @patch("socket.socket")
+    def test_connection_connect_sets_receive_buffer(
+        self, mock_socket_class: Mock
+    ) -> None:
+        """Test that receive_buffer_size sets SO_RCVBUF before connecting."""
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+        mock_socket.connect.side_effect = OSError("Connection refused")
+
+        conn = TCPVNCConnection("localhost", receive_buffer_size=4 * 1024 * 1024)
+        with pytest.raises(VNCConnectionError):
+            conn.connect()
+
+        mock_socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024
+        )
+        assert mock_socket.method_calls.index(
+            call.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        ) < mock_socket.method_calls.index(call.connect(("localhost", 5900)))
+
     @patch("socket.socket")
     def test_connection_connect_already_connected(
         self, mock_socket_class: Mock
@@ -200,6 +255,253 @@ class TestConnectionSendKeyEvent:
         with pytest.raises(VNCStateError):
             conn.send_key_event(0xFF0D, True)
 
+    def test_send_key_events_single_write(self) -> None:
+        """Test that a batch of key events is packed into one write."""
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._connected = True
+
+        conn.send_key_events([(0x61, True), (0x61, False)])
+
+        key_down = b"\x04\x01\x00\x00\x00\x00\x00\x61"
+        key_up = b"\x04\x00\x00\x00\x00\x00\x00\x61"
+        conn._socket.sendall.assert_called_once_with(key_down + key_up)
+
+    def test_send_pointer_events_single_write(self) -> None:
+        """Test that a pointer event sequence is sent with one write."""
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._connected = True
+
+        conn.send_pointer_events([(1, 2, 8), (1, 2, 0)])
+
+        press = b"\x05\x08\x00\x01\x00\x02"
+        release = b"\x05\x00\x00\x01\x00\x02"
+        conn._socket.sendall.assert_called_once_with(press + release)
+
+    def test_send_key_events_not_connected(self) -> None:
+        """Test sending key events when not connected."""
+        conn = TCPVNCConnection("localhost")
+        with pytest.raises(VNCStateError):
+            conn.send_key_events([(0x61, True)])
+
+
+class TestConnectionContinuousUpdates:
+    """Tests for the ContinuousUpdates and Fence extensions."""
+
+    def _connected(self, incoming: bytes) -> TCPVNCConnection:
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._connected = True
+        stream = io.BytesIO(incoming)
+        conn._recv_exact = stream.read  # type: ignore[method-assign]
+        conn._recv_into_buffer = stream.read  # type: ignore[method-assign]
+        return conn
+
+    def test_enable_continuous_updates(self) -> None:
+        """Test EnableContinuousUpdates message format."""
+        conn = self._connected(b"")
+
+        conn.enable_continuous_updates(True, 0, 0, 640, 480)
+
+        conn._socket.sendall.assert_called_once_with(
+            b"\x96\x01\x00\x00\x00\x00\x02\x80\x01\xe0"
+        )
+
+    def test_disable_continuous_updates(self) -> None:
+        """Test that disabling clears the enable flag."""
+        conn = self._connected(b"")
+
+        conn.enable_continuous_updates(False, 0, 0, 640, 480)
+
+        sent = conn._socket.sendall.call_args[0][0]
+        assert sent[:2] == b"\x96\x00"
+
+    def test_enable_continuous_updates_not_connected(self) -> None:
+        """Test enabling continuous updates when not connected."""
+        conn = TCPVNCConnection("localhost")
+        with pytest.raises(VNCStateError):
+            conn.enable_continuous_updates(True)
+
+    def test_read_update_end_of_continuous_updates(self) -> None:
+        """Test that EndOfContinuousUpdates yields no rectangles."""
+        conn = self._connected(b"\x96")
+
+        assert conn.read_framebuffer_update() == []
+
+    def test_read_update_answers_fence_request(self) -> None:
+        """Test that a fence request is echoed before the update is read."""
+        fence = b"\xf8\x00\x00\x00\x80\x00\x00\x03\x02ok"
+        header = b"\x00\x00\x00\x01"
+        rect = b"\x00\x00\x00\x00\x00\x01\x00\x01" + b"\x00\x00\x00\x00"
+        conn = self._connected(fence + header + rect + b"\x01\x02\x03\x04")
+
+        rectangles = conn.read_framebuffer_update()
+
+        assert rectangles == [(0, 0, 1, 1, b"\x01\x02\x03\x04")]
+        conn._socket.sendall.assert_called_once_with(
+            b"\xf8\x00\x00\x00\x00\x00\x00\x03\x02ok"
+        )
+
+    def test_read_update_ignores_fence_response(self) -> None:
+        """Test that fences without the request bit are not answered."""
+        fence = b"\xf8\x00\x00\x00\x00\x00\x00\x01\x00"
+        conn = self._connected(fence + b"\x96")
+
+        assert conn.read_framebuffer_update() == []
+        conn._socket.sendall.assert_not_called()
+
+    def test_read_server_message_returns_after_each_message(self) -> None:
+        """Test that messages other than updates are handled one at a time."""
+        bell = b"\x02"
+        cut_text = b"\x03\x00\x00\x00\x00\x00\x00\x02hi"
+        conn = self._connected(bell + cut_text + b"\x96")
+        listener = Mock()
+        conn.on_clipboard_text = listener
+
+        assert conn.read_server_message() is None
+        assert conn.read_server_message() is None
+        listener.assert_called_once_with("hi")
+        assert conn.read_server_message() == []
+
+    def test_read_server_message_timeout_restored(self) -> None:
+        """Test that the wait is capped and the socket timeout restored."""
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._socket.gettimeout.return_value = 10.0
+        conn._socket.recv.side_effect = socket.timeout()
+        conn._connected = True
+
+        with pytest.raises(VNCTimeoutError):
+            conn.read_server_message(timeout=0.2)
+
+        assert conn._socket.settimeout.call_args_list == [call(0.2), call(10.0)]
+        assert conn.is_connected
+
+    def test_read_update_unknown_message(self) -> None:
+        """Test that an unknown message type is a protocol error."""
+        conn = self._connected(b"\x7f")
+
+        with pytest.raises(VNCProtocolError):
+            conn.read_framebuffer_update()
+
+
+class TestConnectionReceive:
+    """Tests for receiving pixel data."""
+
+    def test_recv_into_buffer_partial_reads(self) -> None:
+        """Test that partial reads are filled into one buffer."""
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        chunks = [b"\x01\x02", b"\x03\x04\x05"]
+
+        def recv_into(view: memoryview) -> int:
+            chunk = chunks.pop(0)
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        conn._socket.recv_into.side_effect = recv_into
+
+        assert conn._recv_into_buffer(5) == b"\x01\x02\x03\x04\x05"
+
+    def test_recv_into_buffer_connection_closed(self) -> None:
+        """Test that a closed connection raises an error."""
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._socket.recv_into.return_value = 0
+
+        with pytest.raises(VNCConnectionError):
+            conn._recv_into_buffer(4)
+
+
+class TestConnectionClipboard:
+    """Tests for plain and extended clipboard messages."""
+
+    def _connected(self, incoming: bytes = b"") -> TCPVNCConnection:
+        conn = TCPVNCConnection("localhost")
+        conn._socket = MagicMock()
+        conn._connected = True
+        conn._recv_exact = io.BytesIO(incoming).read  # type: ignore[method-assign]
+        return conn
+
+    def test_send_clipboard_text_header(self) -> None:
+        """Test ClientCutText has three padding bytes."""
+        conn = self._connected()
+
+        conn.send_clipboard_text("hi")
+
+        conn._socket.sendall.assert_called_once_with(
+            b"\x06\x00\x00\x00\x00\x00\x00\x02hi"
+        )
+
+    def test_send_extended_clipboard_text(self) -> None:
+        """Test the compressed Provide message layout."""
+        conn = self._connected()
+
+        conn.send_extended_clipboard_text("a\nb")
+
+        sent = conn._socket.sendall.call_args[0][0]
+        msg_type, length, flags = struct.unpack("!BxxxiI", sent[:12])
+        assert msg_type == 6
+        assert length == -(len(sent) - 8)
+        assert flags == (1 << 28) | 1
+        data = zlib.decompress(sent[12:])
+        assert data == b"\x00\x00\x00\x05a\r\nb\x00"
+
+    def test_receive_extended_caps(self) -> None:
+        """Test that server Caps enable the extended clipboard."""
+        payload = struct.pack("!II", (1 << 24) | (1 << 28) | 1, 1024)
+        header = struct.pack("!Bxxxi", 3, -len(payload))
+        conn = self._connected(header + payload)
+
+        assert conn.receive_clipboard_text() is None
+        assert conn.extended_clipboard is True
+        reply = conn._socket.sendall.call_args[0][0]
+        assert struct.unpack("!BxxxiI", reply[:12])[2] & (1 << 24)
+
+    def test_receive_extended_provide(self) -> None:
+        """Test that provided text is decompressed."""
+        conn = TCPVNCConnection("localhost")
+        message = conn._extended_clipboard_provide("héllo\nworld")
+        conn = self._connected(b"\x03" + message[1:])
+
+        assert conn.receive_clipboard_text() == "héllo\nworld"
+        assert conn.extended_clipboard is False
+
+    def test_read_update_dispatches_clipboard_text(self) -> None:
+        """Test that ServerCutText before an update goes to the listener."""
+        cut_text = b"\x03\x00\x00\x00\x00\x00\x00\x04test"
+        update = b"\x00\x00\x00\x00"
+        conn = self._connected(cut_text + update)
+        listener = Mock()
+        conn.on_clipboard_text = listener
+
+        assert conn.read_framebuffer_update() == []
+        listener.assert_called_once_with("test")
+
+    def test_is_reading_during_update(self) -> None:
+        """Test that is_reading is only set while an update is read."""
+        conn = self._connected(b"\x00\x00\x00\x00")
+        seen = []
+        read = conn._recv_exact
+
+        def recv(count: int) -> bytes:
+            seen.append(conn.is_reading)
+            return read(count)
+
+        conn._recv_exact = recv  # type: ignore[method-assign]
+
+        conn.read_framebuffer_update()
+
+        assert seen and all(seen)
+        assert conn.is_reading is False
+
+    def test_receive_plain_clipboard_text(self) -> None:
+        """Test ServerCutText with three padding bytes."""
+        conn = self._connected(b"\x03\x00\x00\x00\x00\x00\x00\x04test")
+
+        assert conn.receive_clipboard_text() == "test"
+
 
 class TestConnectionErrorHandling:
     """Tests for error handling in connection."""
@@ -0,0 +1,40 @@
+"""Tests for timing helpers.
+
+Tests precise_sleep accuracy and edge cases.
+"""
+
+import time
+from unittest.mock import patch
+
+from vnc_agent_bridge.core.timing import precise_sleep
+
+
+class TestPreciseSleep:
+    """Tests for precise_sleep() function."""
+
+    def test_sleeps_at_least_requested_duration(self) -> None:
+        """Test that precise_sleep never returns early."""
+        start = time.perf_counter()
+        precise_sleep(0.01)
+        assert time.perf_counter() - start >= 0.01
+
+    def test_short_delay_does_not_call_sleep(self) -> None:
+        """Test that delays within the spin threshold only busy-wait."""
+        with patch("time.sleep") as mock_sleep:
+            precise_sleep(0.001)
+        mock_sleep.assert_not_called()
+
+    def test_long_delay_sleeps_most_of_duration(self) -> None:
+        """Test that longer delays hand most of the wait to time.sleep."""
+        with patch("time.sleep") as mock_sleep, patch(
+            "time.perf_counter", side_effect=[0.0, 0.05]
+        ):
+            precise_sleep(0.05)
+        mock_sleep.assert_called_once_with(0.048)
+
+    def test_zero_and_negative_return_immediately(self) -> None:
+        """Test that non-positive durations do nothing."""
+        with patch("time.sleep") as mock_sleep:
+            precise_sleep(0)
+            precise_sleep(-1)
+        mock_sleep.assert_not_called()
@@ -5,13 +5,19 @@ from __future__ import annotations
 import tempfile
 import time
 from pathlib import Path
+from typing import List
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
-from vnc_agent_bridge.core.video import VideoRecorder
-from vnc_agent_bridge.exceptions import VNCInputError, VNCStateError
+from vnc_agent_bridge.core.video import STREAM_QUEUE_SIZE, VideoRecorder
+from vnc_agent_bridge.exceptions import (
+    VNCConnectionError,
+    VNCInputError,
+    VNCStateError,
+    VNCTimeoutError,
+)
 from vnc_agent_bridge.types.common import ImageFormat, VideoFrame
 
 
@@ -241,6 +247,21 @@ class TestVideoRecorderBackgroundRecording:
         assert len(frames) > 0
         assert not recorder.is_recording()
 
+    def test_recording_marks_background_reader(self) -> None:
+        """Test that the connection is marked as read by the recorder."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_conn.background_reader = False
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((480, 640, 4), dtype=np.uint8)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=10.0)
+        assert mock_conn.background_reader is True
+
+        recorder.stop_recording()
+        assert mock_conn.background_reader is False
+
     def test_start_recording_already_recording(self) -> None:
         """Test start_recording when already recording."""
         mock_conn = Mock()
@@ -334,6 +355,170 @@ class TestVideoRecorderBackgroundRecording:
         assert not recorder.is_recording()
 
 
+class TestVideoRecorderContinuousUpdates:
+    """Test start_recording(continuous=True)."""
+
+    def _streaming_connection(self) -> Mock:
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_conn.ENCODING_RAW = 0
+        mock_conn.ENCODING_CONTINUOUS_UPDATES = -313
+        mock_conn.ENCODING_FENCE = -312
+        mock_conn.extended_clipboard = False
+
+        def read_update() -> list:
+            time.sleep(0.005)
+            return [(0, 0, 1, 1, b"\x00" * 4)]
+
+        mock_conn.read_framebuffer_update.side_effect = read_update
+        # EndOfContinuousUpdates confirms the extension
+        mock_conn.read_server_message.return_value = []
+        return mock_conn
+
+    def test_continuous_recording_negotiates_stream(self) -> None:
+        """Test that the stream is enabled on start and disabled on stop."""
+        mock_conn = self._streaming_connection()
+        mock_framebuffer = Mock()
+        mock_framebuffer.is_initialized = True
+        mock_framebuffer.width = 640
+        mock_framebuffer.height = 480
+
+        recorder = VideoRecorder(mock_conn, mock_framebuffer, Mock())
+        recorder.start_recording(fps=30.0, continuous=True)
+
+        mock_conn.set_encodings.assert_called_once_with([0, -313, -312])
+        mock_framebuffer.request_update.assert_called_once_with(incremental=False)
+        mock_conn.enable_continuous_updates.assert_called_once_with(
+            True, 0, 0, 640, 480
+        )
+
+        time.sleep(0.05)
+        recorder.stop_recording()
+
+        mock_conn.enable_continuous_updates.assert_called_with(False, 0, 0, 640, 480)
+
+    def test_continuous_recording_skips_update_requests(self) -> None:
+        """Test that frames come from streamed updates, not captures."""
+        mock_conn = self._streaming_connection()
+        mock_framebuffer = Mock()
+        mock_framebuffer.get_buffer.return_value = np.zeros(
+            (480, 640, 4), dtype=np.uint8
+        )
+        mock_screenshot = Mock()
+
+        recorder = VideoRecorder(mock_conn, mock_framebuffer, mock_screenshot)
+        recorder.start_recording(fps=100.0, continuous=True)
+        time.sleep(0.05)
+        frames = recorder.stop_recording()
+
+        assert len(frames) > 0
+        assert mock_framebuffer.process_update.called
+        mock_screenshot.capture.assert_not_called()
+        # Only the initial full update is requested
+        mock_framebuffer.request_update.assert_called_once_with(incremental=False)
+
+    def test_continuous_recording_falls_back_without_confirmation(self) -> None:
+        """Test that servers without the extension get per-frame requests."""
+        mock_conn = self._streaming_connection()
+        mock_conn.read_server_message.side_effect = VNCTimeoutError("timed out")
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=100.0, continuous=True)
+        time.sleep(0.05)
+        frames = recorder.stop_recording()
+
+        assert len(frames) > 0
+        assert mock_screenshot.capture.called
+        mock_conn.enable_continuous_updates.assert_not_called()
+        mock_conn.read_framebuffer_update.assert_not_called()
+
+    def test_continuous_recording_handles_messages_before_confirmation(
+        self,
+    ) -> None:
+        """Test that a Fence or update before EndOfContinuousUpdates is handled."""
+        mock_conn = self._streaming_connection()
+        update = [(0, 0, 1, 1, b"\x00" * 4)]
+        mock_conn.read_server_message.side_effect = [None, update, []]
+        mock_framebuffer = Mock()
+
+        recorder = VideoRecorder(mock_conn, mock_framebuffer, Mock())
+        recorder.start_recording(fps=30.0, continuous=True)
+        recorder.stop_recording()
+
+        mock_framebuffer.process_update.assert_any_call(update)
+        assert mock_conn.enable_continuous_updates.call_args_list[0][0][0] is True
+
+    def test_continuous_recording_survives_idle_timeout(self) -> None:
+        """Test that a read timeout on an idle screen keeps recording."""
+        mock_conn = self._streaming_connection()
+        updates = [[(0, 0, 1, 1, b"\x00" * 4)]]
+
+        def read_update() -> list:
+            time.sleep(0.005)
+            if len(mock_conn.read_framebuffer_update.call_args_list) > 1 and updates:
+                return updates.pop()
+            raise VNCTimeoutError("timed out")
+
+        mock_conn.read_framebuffer_update.side_effect = read_update
+
+        recorder = VideoRecorder(mock_conn, Mock(), Mock())
+        recorder.start_recording(fps=30.0, continuous=True)
+        assert recorder.wait_for_frames(1, timeout=1.0)
+        assert recorder.is_recording()
+
+        frames = recorder.stop_recording()
+        assert len(frames) == 1
+
+    def test_continuous_recording_error_raised_on_stop(self) -> None:
+        """Test that a failed stream read is raised by stop_recording()."""
+        mock_conn = self._streaming_connection()
+        mock_conn.read_framebuffer_update.side_effect = VNCConnectionError(
+            "Connection closed by server"
+        )
+
+        recorder = VideoRecorder(mock_conn, Mock(), Mock())
+        recorder.start_recording(fps=30.0, continuous=True)
+        time.sleep(0.05)
+
+        with pytest.raises(VNCConnectionError):
+            recorder.stop_recording()
+        assert not recorder.is_recording()
+
+    def test_continuous_recording_limits_frame_rate(self) -> None:
+        """Test that updates arriving faster than fps are not all stored."""
+        mock_conn = self._streaming_connection()
+        mock_framebuffer = Mock()
+
+        recorder = VideoRecorder(mock_conn, mock_framebuffer, Mock())
+        recorder.start_recording(fps=10.0, continuous=True)
+        time.sleep(0.15)
+        frames = recorder.stop_recording()
+
+        assert mock_framebuffer.process_update.call_count > len(frames)
+        assert len(frames) <= 3
+
+    def test_record_continuous(self) -> None:
+        """Test that record(continuous=True) records from the stream."""
+        mock_conn = self._streaming_connection()
+        mock_framebuffer = Mock()
+        mock_framebuffer.width = 640
+        mock_framebuffer.height = 480
+        mock_framebuffer.get_buffer.return_value = np.zeros(
+            (480, 640, 4), dtype=np.uint8
+        )
+        mock_screenshot = Mock()
+
+        recorder = VideoRecorder(mock_conn, mock_framebuffer, mock_screenshot)
+        frames = recorder.record(duration=0.1, fps=50.0, continuous=True)
+
+        assert len(frames) > 0
+        assert not recorder.is_recording()
+        mock_screenshot.capture.assert_not_called()
+        mock_conn.enable_continuous_updates.assert_called_with(False, 0, 0, 640, 480)
+
+
 class TestVideoRecorderFrameStatistics:
     """Test get_frame_rate() and get_duration() methods."""
 
@@ -436,15 +621,21 @@ class TestVideoRecorderSaveFrames:
 
         mock_conn = Mock()
         mock_screenshot = Mock()
-        mock_screenshot.save = Mock()
 
         recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
 
         with tempfile.TemporaryDirectory() as tmpdir:
             recorder.save_frames(frames, tmpdir, prefix="test", format=ImageFormat.PNG)
 
-            # Verify save was called for each frame
-            assert mock_screenshot.save.call_count == 2
+            # Each frame's own pixel data is written, not a new capture
+            items, format = mock_screenshot.save_arrays.call_args.args
+            assert format == ImageFormat.PNG
+            assert [path for path, _ in items] == [
+                Path(tmpdir) / "test_000000.png",
+                Path(tmpdir) / "test_000001.png",
+            ]
+            assert items[0][1] is frames[0].data
+            mock_screenshot.save.assert_not_called()
 
     def test_save_frames_empty_list(self) -> None:
         """Test save_frames with empty frame list."""
@@ -455,6 +646,18 @@ class TestVideoRecorderSaveFrames:
             with pytest.raises(VNCInputError):
                 recorder.save_frames([], tmpdir)
 
+    def test_save_frames_without_pixel_data(self) -> None:
+        """Test save_frames with frames that were streamed to disk."""
+        frames = [VideoFrame(timestamp=0.0, data=None, frame_number=0)]
+        mock_screenshot = Mock()
+        recorder = VideoRecorder(Mock(), Mock(), mock_screenshot)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(VNCInputError):
+                recorder.save_frames(frames, tmpdir)
+
+        mock_screenshot.save_arrays.assert_not_called()
+
     def test_save_frames_creates_directory(self) -> None:
         """Test that save_frames creates directory if needed."""
         frames = [
@@ -499,6 +702,233 @@ class TestVideoRecorderSaveFrames:
                 recorder.save_frames(frames, tmpdir, format=fmt)
 
 
+class TestVideoRecorderArchive:
+    """Test save_archive() and load_archive() methods."""
+
+    def test_archive_round_trip(self) -> None:
+        """Test that frames are restored with pixels and timing."""
+        frames = [
+            VideoFrame(
+                timestamp=0.1 * i,
+                data=np.full((48, 64, 4), i, dtype=np.uint8),
+                frame_number=i,
+            )
+            for i in range(3)
+        ]
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "nested" / "recording.npz"
+            recorder.save_archive(frames, path)
+            assert path.exists()
+            loaded = recorder.load_archive(path)
+
+        assert len(loaded) == 3
+        for original, restored in zip(frames, loaded):
+            assert restored.timestamp == original.timestamp
+            assert restored.frame_number == original.frame_number
+            assert np.array_equal(restored.data, original.data)
+
+    def test_save_archive_empty_list(self) -> None:
+        """Test save_archive with empty frame list."""
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(VNCInputError):
+                recorder.save_archive([], Path(tmpdir) / "empty.npz")
+
+    def test_save_archive_without_pixel_data(self) -> None:
+        """Test save_archive with frames that were streamed to disk."""
+        frames = [VideoFrame(timestamp=0.0, data=None, frame_number=0)]
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(VNCInputError):
+                recorder.save_archive(frames, Path(tmpdir) / "frames.npz")
+
+    def test_save_archive_mixed_sizes(self) -> None:
+        """Test save_archive rejects frames of different sizes."""
+        frames = [
+            VideoFrame(0.0, np.zeros((48, 64, 4), dtype=np.uint8), 0),
+            VideoFrame(0.1, np.zeros((24, 32, 4), dtype=np.uint8), 1),
+        ]
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "frames.npz"
+            with pytest.raises(VNCInputError):
+                recorder.save_archive(frames, path)
+            assert not path.exists()
+
+
+class TestVideoRecorderStreamToDisk:
+    """Test start_recording() with an output directory."""
+
+    def test_streamed_frames_are_written_while_recording(self) -> None:
+        """Test that frames go to disk and only metadata is kept."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.side_effect = lambda incremental: np.zeros(
+            (4, 4, 4), dtype=np.uint8
+        )
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "stream"
+            recorder.start_recording(fps=50.0, output_dir=output_dir, prefix="clip")
+            time.sleep(0.1)
+            frames = recorder.stop_recording()
+
+            assert output_dir.is_dir()
+            assert len(frames) > 0
+            assert all(f.data is None for f in frames)
+
+            written = [
+                call.args[1] for call in mock_screenshot.save_array.call_args_list
+            ]
+            assert written == [
+                output_dir / f"clip_{f.frame_number:06d}.png" for f in frames
+            ]
+
+    def test_stream_queue_is_bounded(self) -> None:
+        """Test that capture waits for a slow encoder."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+        mock_screenshot.save_array.side_effect = lambda *args: time.sleep(0.05)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder.start_recording(fps=1000.0, output_dir=tmpdir)
+            time.sleep(0.2)
+
+            # Captured frames are at most the written ones plus a full queue
+            # and the frames held by the two threads
+            assert recorder._stream_queue is not None
+            assert recorder._stream_queue.qsize() <= STREAM_QUEUE_SIZE
+            pending = recorder.frame_count - mock_screenshot.save_array.call_count
+            assert pending <= STREAM_QUEUE_SIZE + 2
+
+            frames = recorder.stop_recording()
+
+        assert mock_screenshot.save_array.call_count == len(frames)
+        assert recorder._stream_queue is None
+
+    def test_stream_write_error_raised_on_stop(self) -> None:
+        """Test that a failed frame write is reported by stop_recording."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+        mock_screenshot.save_array.side_effect = OSError("disk full")
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder.start_recording(fps=50.0, output_dir=tmpdir)
+            time.sleep(0.1)
+
+            with pytest.raises(OSError):
+                recorder.stop_recording()
+
+        # The first error stops further writes and the recorder is reusable
+        assert mock_screenshot.save_array.call_count == 1
+        assert not recorder.is_recording()
+
+    def test_on_frame_receives_frames_while_recording(self) -> None:
+        """Test that on_frame gets each frame with its pixel data."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+        received: List[VideoFrame] = []
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=50.0, on_frame=received.append)
+        time.sleep(0.1)
+        frames = recorder.stop_recording()
+
+        assert len(frames) > 0
+        assert all(f.data is None for f in frames)
+        assert [f.frame_number for f in received] == [f.frame_number for f in frames]
+        assert all(f.data is not None for f in received)
+        mock_screenshot.save_array.assert_not_called()
+
+    def test_on_frame_error_raised_on_stop(self) -> None:
+        """Test that an on_frame exception is reported by stop_recording."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+        on_frame = Mock(side_effect=BrokenPipeError("encoder exited"))
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=50.0, on_frame=on_frame)
+        time.sleep(0.1)
+
+        with pytest.raises(BrokenPipeError):
+            recorder.stop_recording()
+        assert on_frame.call_count == 1
+
+    def test_output_dir_and_on_frame_rejected(self) -> None:
+        """Test that output_dir and on_frame cannot be combined."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        recorder = VideoRecorder(mock_conn, Mock(), Mock())
+
+        with pytest.raises(VNCInputError):
+            recorder.start_recording(output_dir="frames", on_frame=Mock())
+        assert not recorder.is_recording()
+
+    def test_record_streams_frames_to_disk(self) -> None:
+        """Test that record() with output_dir writes frames as it goes."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "timed"
+            frames = recorder.record(duration=0.1, fps=50.0, output_dir=output_dir)
+
+            assert output_dir.is_dir()
+
+        assert len(frames) > 0
+        assert all(f.data is None for f in frames)
+        written = [call.args[1] for call in mock_screenshot.save_array.call_args_list]
+        assert written == [
+            output_dir / f"frame_{f.frame_number:06d}.png" for f in frames
+        ]
+        assert recorder._stream_queue is None
+
+    def test_record_stream_error_raised(self) -> None:
+        """Test that a failed frame write is raised by record()."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((4, 4, 4), dtype=np.uint8)
+        mock_screenshot.save_array.side_effect = OSError("disk full")
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(OSError):
+                recorder.record(duration=0.1, fps=50.0, output_dir=tmpdir)
+
+        assert recorder._stream_queue is None
+
+    def test_record_output_dir_while_recording(self) -> None:
+        """Test that record(output_dir) is refused during background recording."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        recorder = VideoRecorder(mock_conn, Mock(), Mock())
+        recorder._is_recording = True
+
+        with pytest.raises(VNCStateError):
+            recorder.record(duration=0.1, output_dir="frames")
+
+
 class TestVideoRecorderFrameCount:
     """Test frame_count property."""
 
@@ -525,6 +955,51 @@ class TestVideoRecorderFrameCount:
 
         recorder.stop_recording()
 
+    def test_wait_for_frames(self) -> None:
+        """Test wait_for_frames returns once enough frames are stored."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((480, 640, 4), dtype=np.uint8)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=100.0)
+        try:
+            assert recorder.wait_for_frames(3, timeout=2.0) is True
+            assert recorder.frame_count >= 3
+        finally:
+            recorder.stop_recording()
+
+    def test_wait_for_frames_timeout(self) -> None:
+        """Test wait_for_frames returns False when frames do not arrive."""
+        mock_conn = Mock()
+        mock_conn.is_connected = True
+        mock_screenshot = Mock()
+        mock_screenshot.capture.return_value = np.zeros((480, 640, 4), dtype=np.uint8)
+
+        recorder = VideoRecorder(mock_conn, Mock(), mock_screenshot)
+        recorder.start_recording(fps=1.0)
+        try:
+            assert recorder.wait_for_frames(100, timeout=0.05) is False
+        finally:
+            recorder.stop_recording()
+
+    def test_wait_for_frames_not_recording(self) -> None:
+        """Test wait_for_frames returns immediately when not recording."""
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        start = time.time()
+        assert recorder.wait_for_frames(1, timeout=5.0) is False
+        assert time.time() - start < 1.0
+        assert recorder.wait_for_frames(0) is True
+
+    def test_wait_for_frames_negative_timeout(self) -> None:
+        """Test wait_for_frames rejects a negative timeout."""
+        recorder = VideoRecorder(Mock(), Mock(), Mock())
+
+        with pytest.raises(VNCInputError):
+            recorder.wait_for_frames(1, timeout=-1)
+
 
 class TestVideoRecorderEdgeCases:
     """Test edge cases and error handling."""
@@ -7,6 +7,7 @@ from vnc_agent_bridge.core.connection_websocket import WebSocketVNCConnection
 from vnc_agent_bridge.exceptions import (
     VNCConnectionError,
     VNCStateError,
+    VNCTimeoutError,
 )
 
 
@@ -299,10 +300,10 @@ class TestWebSocketVNCConnection:
         conn._connected = True
 
         # Mock clipboard message components
-        # Message format: [type=3][padding=0][length=4][data="test"]
+        # Message format: [type=3][padding x3][length=4][data="test"]
         mock_ws.recv.side_effect = [
             b"\x03",  # Message type (CLIPBOARD_TEXT_SERVER)
-            b"\x00",  # Padding
+            b"\x00\x00\x00",  # Padding
             b"\x00\x00\x00\x04",  # Text length (4 bytes)
             b"test",  # Text data
         ]
@@ -328,6 +329,47 @@ class TestWebSocketVNCConnection:
         result = conn.receive_clipboard_text()
         assert result is None
 
+    def test_recv_exact_keeps_remainder_of_message(self):
+        """Test that bytes beyond the requested count stay buffered."""
+        mock_ws = Mock()
+
+        conn = WebSocketVNCConnection(
+            url_template="wss://example.com/vnc",
+            host="example.com",
+            host_port=6900,
+        )
+        conn._websocket = mock_ws
+        conn._connected = True
+
+        # One WebSocket message carrying several RFB fields
+        mock_ws.recv.side_effect = [b"\x00\x00\x00\x01abcd"]
+
+        assert conn._recv_exact(2) == b"\x00\x00"
+        assert conn._recv_exact(2) == b"\x00\x01"
+        assert conn._recv_exact(4) == b"abcd"
+        assert mock_ws.recv.call_count == 1
+
+    def test_recv_exact_timeout_keeps_connection(self):
+        """Test that a receive timeout keeps the WebSocket and its buffer."""
+        mock_ws = Mock()
+
+        conn = WebSocketVNCConnection(
+            url_template="wss://example.com/vnc",
+            host="example.com",
+            host_port=6900,
+        )
+        conn._websocket = mock_ws
+        conn._connected = True
+
+        # Half an RFB field arrives, then the server goes quiet
+        mock_ws.recv.side_effect = [b"\x00", TimeoutError("timed out"), b"\x01"]
+
+        with pytest.raises(VNCTimeoutError):
+            conn._recv_exact(2)
+
+        assert conn.is_connected
+        assert conn._recv_exact(2) == b"\x00\x01"
+
     def test_ssl_context_creation(self):
         """Test SSL context creation with certificate."""
         conn = WebSocketVNCConnection(
@@ -15,6 +15,7 @@ Modules:
     - screenshot: ScreenshotController for screen capture
     - video: VideoRecorder for video recording
     - clipboard: ClipboardController for clipboard operations
+    - timing: precise_sleep() helper for accurate short delays
 
 Example:
     Basic usage with context manager (TCP connection):
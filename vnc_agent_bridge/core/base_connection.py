@@ -7,8 +7,12 @@ The abstract base class ensures that all connection implementations provide
 the same interface for sending VNC protocol messages and managing connections.
 """
 
+import struct
+import zlib
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
+
+from ..exceptions import VNCProtocolError
 
 
 class VNCConnectionBase(ABC):
@@ -31,6 +35,49 @@ class VNCConnectionBase(ABC):
     SET_PIXEL_FORMAT = 0
     CLIPBOARD_TEXT_CLIENT = 6
     CLIPBOARD_TEXT_SERVER = 3
+    BELL = 2
+    ENABLE_CONTINUOUS_UPDATES = 150
+    END_OF_CONTINUOUS_UPDATES = 150
+    FENCE = 248
+
+    # Pseudo-encodings advertised through SetEncodings
+    ENCODING_RAW = 0
+    ENCODING_CONTINUOUS_UPDATES = -313
+    ENCODING_FENCE = -312
+    ENCODING_EXTENDED_CLIPBOARD = -1063131698  # 0xC0A1E5CE
+
+    # Extended clipboard flags: formats in the low bits, actions in the high
+    CLIPBOARD_FORMAT_TEXT = 1 << 0
+    CLIPBOARD_ACTION_CAPS = 1 << 24
+    CLIPBOARD_ACTION_REQUEST = 1 << 25
+    CLIPBOARD_ACTION_NOTIFY = 1 << 27
+    CLIPBOARD_ACTION_PROVIDE = 1 << 28
+    # Largest text we accept from the server (advertised in our Caps)
+    CLIPBOARD_MAX_TEXT_SIZE = 20 * 1024 * 1024
+
+    # Fence flags: request bit and the flags a client may echo back
+    FENCE_REQUEST = 1 << 31
+    FENCE_SUPPORTED_FLAGS = 0x7
+
+    # Server's native PIXEL_FORMAT from ServerInit (empty until connected)
+    pixel_format = b""
+
+    # Set once the server has announced extended clipboard support
+    extended_clipboard = False
+
+    # Called with clipboard text that arrives while reading other messages
+    on_clipboard_text: Optional[Callable[[str], None]] = None
+
+    # Set by components that read server messages on a background thread
+    # (such as the video recorder) for as long as they own the connection
+    background_reader = False
+
+    # True while read_framebuffer_update() is waiting for server messages
+    _reading = False
+
+    # Precompiled layouts for the input messages sent most often
+    POINTER_EVENT_STRUCT = struct.Struct("!BBHH")
+    KEY_EVENT_STRUCT = struct.Struct("!BBHI")
 
     @abstractmethod
     def connect(self) -> None:
@@ -54,6 +101,17 @@ class VNCConnectionBase(ABC):
         """Check if connected to VNC server."""
         pass
 
+    @property
+    def is_reading(self) -> bool:
+        """Check if server messages are being read by another component.
+
+        True while a framebuffer update is being read or a background
+        reader owns the connection. Server messages are then consumed by
+        that reader; clipboard text is delivered through on_clipboard_text
+        instead of receive_clipboard_text().
+        """
+        return self._reading or self.background_reader
+
     @abstractmethod
     def send_pointer_event(self, x: int, y: int, button_mask: int) -> None:
         """Send mouse pointer event to server.
@@ -69,6 +127,22 @@ class VNCConnectionBase(ABC):
         """
         pass
 
+    def send_pointer_events(self, events: List[Tuple[int, int, int]]) -> None:
+        """Send a sequence of pointer events to server.
+
+        Implementations may coalesce the events into a single write; the
+        default sends them one at a time through send_pointer_event().
+
+        Args:
+            events: List of (x, y, button_mask) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        for x, y, button_mask in events:
+            self.send_pointer_event(x, y, button_mask)
+
     @abstractmethod
     def send_key_event(self, keycode: int, pressed: bool) -> None:
         """Send keyboard event to server.
@@ -83,6 +157,22 @@ class VNCConnectionBase(ABC):
         """
         pass
 
+    def send_key_events(self, events: List[Tuple[int, bool]]) -> None:
+        """Send a sequence of keyboard events to server.
+
+        Implementations may coalesce the events into a single write; the
+        default sends them one at a time through send_key_event().
+
+        Args:
+            events: List of (keycode, pressed) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        for keycode, pressed in events:
+            self.send_key_event(keycode, pressed)
+
     @abstractmethod
     def request_framebuffer_update(
         self,
@@ -111,6 +201,10 @@ class VNCConnectionBase(ABC):
     def read_framebuffer_update(self) -> List[Tuple[int, int, int, int, bytes]]:
         """Read framebuffer update response from server.
 
+        Fence requests received before the update are answered, clipboard
+        text is passed to on_clipboard_text, and an EndOfContinuousUpdates
+        message yields an empty list.
+
         Returns:
             List of rectangles: [(x, y, width, height, pixel_data), ...]
 
@@ -121,6 +215,66 @@ class VNCConnectionBase(ABC):
         """
         pass
 
+    def read_server_message(
+        self, timeout: Optional[float] = None
+    ) -> Optional[List[Tuple[int, int, int, int, bytes]]]:
+        """Read and handle one server message.
+
+        Unlike read_framebuffer_update(), this returns after any message:
+        Fence requests are answered, clipboard text is passed to
+        on_clipboard_text and Bell is ignored. The timeout only applies
+        until the message starts, so a message is never left half read.
+
+        Args:
+            timeout: Maximum wait in seconds for the message to start
+                (default None, the connection timeout)
+
+        Returns:
+            Rectangles of a framebuffer update, an empty list for
+            EndOfContinuousUpdates, or None for any other message
+
+        Raises:
+            NotImplementedError: If the connection type does not support it
+            VNCStateError: If not connected
+            VNCTimeoutError: If no message started within timeout
+            VNCConnectionError: If receive fails
+            VNCProtocolError: If message format is invalid
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support reading single messages"
+        )
+
+    def enable_continuous_updates(
+        self,
+        enable: bool,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        """Start or stop continuous framebuffer updates for a region.
+
+        While enabled, the server streams FramebufferUpdate messages for the
+        region without waiting for FramebufferUpdateRequests. Only send this
+        to servers that support the ContinuousUpdates extension (advertise
+        ENCODING_CONTINUOUS_UPDATES through set_encodings() first).
+
+        Args:
+            enable: True to start streaming, False to stop
+            x: X coordinate of update region
+            y: Y coordinate of update region
+            width: Width of update region (None for full width)
+            height: Height of update region (None for full height)
+
+        Raises:
+            NotImplementedError: If the connection type does not support it
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support continuous updates"
+        )
+
     @abstractmethod
     def set_encodings(self, encodings: List[int]) -> None:
         """Tell server which encodings we support.
@@ -147,10 +301,33 @@ class VNCConnectionBase(ABC):
         """
         pass
 
+    def send_extended_clipboard_text(self, text: str) -> None:
+        """Send clipboard text using the extended clipboard format.
+
+        The text is sent as UTF-8 in a zlib-compressed Provide message. Only
+        use this after the server has announced extended clipboard support
+        (see extended_clipboard).
+
+        Args:
+            text: Text to send to remote clipboard
+
+        Raises:
+            NotImplementedError: If the connection type does not support it
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support the extended clipboard"
+        )
+
     @abstractmethod
     def receive_clipboard_text(self) -> Optional[str]:
         """Receive clipboard text from server.
 
+        Extended clipboard messages are handled as well: a Caps message
+        sets extended_clipboard and yields None, and provided text is
+        decompressed.
+
         Returns:
             Clipboard text if available, None if no clipboard message pending
 
@@ -159,3 +336,82 @@ class VNCConnectionBase(ABC):
             VNCConnectionError: If receive fails
         """
         pass
+
+    def _client_cut_text_header(self, length: int) -> bytes:
+        """Build a ClientCutText header.
+
+        Args:
+            length: Text length, or the negated payload length for an
+                extended clipboard message
+
+        Returns:
+            Header bytes
+        """
+        # Format: [msg_type=6][padding x3][length] (big-endian, signed)
+        return struct.pack("!Bxxxi", self.CLIPBOARD_TEXT_CLIENT, length)
+
+    def _extended_clipboard_caps(self) -> bytes:
+        """Build the extended clipboard Caps message announcing our support.
+
+        Returns:
+            Complete ClientCutText message
+        """
+        flags = (
+            self.CLIPBOARD_ACTION_CAPS
+            | self.CLIPBOARD_ACTION_PROVIDE
+            | self.CLIPBOARD_FORMAT_TEXT
+        )
+        payload = struct.pack("!II", flags, self.CLIPBOARD_MAX_TEXT_SIZE)
+        return self._client_cut_text_header(-len(payload)) + payload
+
+    def _extended_clipboard_provide(self, text: str) -> bytes:
+        """Build an extended clipboard Provide message for text.
+
+        Args:
+            text: Clipboard text
+
+        Returns:
+            Complete ClientCutText message
+        """
+        # Text is NUL-terminated UTF-8 with CRLF line endings
+        data = text.replace("\r\n", "\n").replace("\n", "\r\n")
+        data_bytes = data.encode("utf-8") + b"\0"
+        stream = zlib.compress(struct.pack("!I", len(data_bytes)) + data_bytes, 6)
+
+        flags = self.CLIPBOARD_ACTION_PROVIDE | self.CLIPBOARD_FORMAT_TEXT
+        payload = struct.pack("!I", flags) + stream
+        return self._client_cut_text_header(-len(payload)) + payload
+
+    def _parse_extended_clipboard(self, payload: bytes) -> Tuple[int, Optional[str]]:
+        """Parse the payload of an extended ServerCutText message.
+
+        Args:
+            payload: Message bytes following the length field
+
+        Returns:
+            Tuple of (flags, text); text is None unless text was provided
+
+        Raises:
+            VNCProtocolError: If the payload is malformed
+        """
+        if len(payload) < 4:
+            raise VNCProtocolError("Extended clipboard message too short")
+        flags = struct.unpack("!I", payload[:4])[0]
+
+        # Caps lists supported actions, so only a bare Provide carries data
+        if flags & self.CLIPBOARD_ACTION_CAPS:
+            return flags, None
+        if not (flags & self.CLIPBOARD_ACTION_PROVIDE):
+            return flags, None
+        if not (flags & self.CLIPBOARD_FORMAT_TEXT):
+            return flags, None
+
+        try:
+            data = zlib.decompress(payload[4:])
+            size = struct.unpack("!I", data[:4])[0]
+        except (zlib.error, struct.error) as e:
+            raise VNCProtocolError(f"Invalid extended clipboard data: {e}")
+
+        # Text is the first format in the stream
+        text = data[4 : 4 + size].rstrip(b"\0").decode("utf-8", errors="replace")
+        return flags, text.replace("\r\n", "\n")
@@ -20,9 +20,17 @@ Example:
             vnc.mouse.left_click(100, 100)
         finally:
             vnc.disconnect()
+
+    Reusing one connection across several blocks:
+        with VNCAgentBridge.shared('localhost', port=5900):
+            with VNCAgentBridge.shared('localhost', port=5900) as vnc:
+                vnc.mouse.left_click(100, 100)
+            with VNCAgentBridge.shared('localhost', port=5900) as vnc:
+                vnc.keyboard.type_text("text")
 """
 
-from typing import TYPE_CHECKING, Any, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .base_connection import VNCConnectionBase
 from .connection_tcp import TCPVNCConnection
@@ -45,6 +53,9 @@ class VNCAgentBridge:
     with automatic connection management.
     """
 
+    # Per-thread bridges handed out by shared(), keyed by (host, port)
+    _shared_local = threading.local()
+
     def __init__(
         self,
         host: Optional[str] = None,
@@ -54,6 +65,8 @@ class VNCAgentBridge:
         timeout: float = 10.0,
         connection: Optional[VNCConnectionBase] = None,
         enable_framebuffer: bool = True,
+        tcp_nodelay: bool = True,
+        receive_buffer_size: Optional[int] = None,
     ) -> None:
         """Initialize VNC bridge.
 
@@ -70,6 +83,11 @@ class VNCAgentBridge:
                 (ignored if connection provided)
             connection: Custom connection implementation (VNCConnectionBase)
             enable_framebuffer: Enable framebuffer features (screenshot, video)
+            tcp_nodelay: Disable Nagle's algorithm on the TCP socket
+                (default True, ignored if connection provided)
+            receive_buffer_size: TCP socket receive buffer size in bytes
+                (default None for the OS default, ignored if connection
+                provided)
         """
         if connection is not None:
             self._connection = connection
@@ -78,7 +96,15 @@ class VNCAgentBridge:
                 raise ValueError(
                     "host must be provided when connection is not specified"
                 )
-            self._connection = TCPVNCConnection(host, port, username, password, timeout)
+            self._connection = TCPVNCConnection(
+                host,
+                port,
+                username,
+                password,
+                timeout,
+                tcp_nodelay,
+                receive_buffer_size,
+            )
 
         self._enable_framebuffer = enable_framebuffer
         self._mouse: Optional[MouseController] = None
@@ -88,6 +114,37 @@ class VNCAgentBridge:
         self._framebuffer: Optional["FramebufferManager"] = None
         self._screenshot: Optional["ScreenshotController"] = None
         self._video: Optional["VideoRecorder"] = None
+        # Number of active `with` blocks; only the outermost connects/disconnects
+        self._context_depth = 0
+
+    @classmethod
+    def shared(cls, host: str, port: int = 5900, **kwargs: Any) -> "VNCAgentBridge":
+        """Get a bridge shared by all callers in this thread for host:port.
+
+        Nested `with` blocks on the same bridge reuse its connection: only
+        the outermost block connects and disconnects. Keep an outer block open
+        to avoid a new RFB handshake for every inner block.
+
+        Args:
+            host: VNC server hostname or IP address
+            port: VNC server port (default 5900)
+            **kwargs: Other VNCAgentBridge arguments, used only when the
+                shared bridge is first created
+
+        Returns:
+            The VNCAgentBridge instance for host:port in the current thread
+        """
+        bridges: Optional[Dict[Tuple[str, int], VNCAgentBridge]] = getattr(
+            cls._shared_local, "bridges", None
+        )
+        if bridges is None:
+            bridges = {}
+            cls._shared_local.bridges = bridges
+        bridge = bridges.get((host, port))
+        if bridge is None:
+            bridge = cls(host, port, **kwargs)
+            bridges[(host, port)] = bridge
+        return bridge
 
     def connect(self) -> None:
         """Connect to VNC server and initialize controllers."""
@@ -99,39 +156,7 @@ class VNCAgentBridge:
         self._scroll = ScrollController(self._connection)
         self._clipboard = ClipboardController(self._connection)
 
-        # Initialize framebuffer components if enabled and available
-        if self._enable_framebuffer:
-            try:
-                from .framebuffer import FramebufferManager
-                from .screenshot import ScreenshotController
-                from .video import VideoRecorder
-                from ..types.common import FramebufferConfig
-
-                # Create framebuffer config from connection
-                config = FramebufferConfig(
-                    width=1920,  # Default, will be updated by VNC server
-                    height=1080,  # Default, will be updated by VNC server
-                    pixel_format=b"",
-                    name="VNC Screen",
-                )
-
-                # Create framebuffer manager
-                self._framebuffer = FramebufferManager(self._connection, config)
-
-                # Create screenshot controller
-                self._screenshot = ScreenshotController(
-                    self._connection, self._framebuffer
-                )
-
-                # Create video recorder
-                self._video = VideoRecorder(
-                    self._connection, self._framebuffer, self._screenshot
-                )
-
-            except (ImportError, TypeError, AttributeError):
-                # Optional dependencies not available or framebuffer not supported
-                # Video features will be unavailable but basic input control works
-                pass
+        # Framebuffer components (numpy, Pillow) are created on first use
 
     def disconnect(self) -> None:
         """Disconnect from VNC server."""
@@ -218,6 +243,7 @@ class VNCAgentBridge:
             VNCStateError: If screenshot feature unavailable (disabled or missing deps)
             RuntimeError: If not connected
         """
+        self._init_framebuffer()
         if self._screenshot is None:
             if not self._enable_framebuffer:
                 raise VNCStateError(
@@ -242,6 +268,7 @@ class VNCAgentBridge:
             VNCStateError: If video feature unavailable (disabled or missing deps)
             RuntimeError: If not connected
         """
+        self._init_framebuffer()
         if self._video is None:
             if not self._enable_framebuffer:
                 raise VNCStateError(
@@ -262,11 +289,61 @@ class VNCAgentBridge:
         Returns:
             FramebufferManager instance or None if not available
         """
+        self._init_framebuffer()
         return self._framebuffer
 
+    def _init_framebuffer(self) -> None:
+        """Create the framebuffer, screenshot and video components.
+
+        Deferred until one of them is first accessed so that sessions that
+        only send input never import numpy or Pillow.
+        """
+        if (
+            not self._enable_framebuffer
+            or self._framebuffer is not None
+            or not self._connection.is_connected
+        ):
+            return
+
+        try:
+            from .framebuffer import FramebufferManager
+            from .screenshot import ScreenshotController
+            from .video import VideoRecorder
+            from ..types.common import FramebufferConfig
+
+            # Create framebuffer config from connection
+            config = FramebufferConfig(
+                width=1920,  # Default, will be updated by VNC server
+                height=1080,  # Default, will be updated by VNC server
+                pixel_format=self._connection.pixel_format,
+                name="VNC Screen",
+            )
+
+            # Create framebuffer manager
+            self._framebuffer = FramebufferManager(self._connection, config)
+
+            # Create screenshot controller
+            self._screenshot = ScreenshotController(self._connection, self._framebuffer)
+
+            # Create video recorder
+            self._video = VideoRecorder(
+                self._connection, self._framebuffer, self._screenshot
+            )
+
+        except (ImportError, TypeError, AttributeError):
+            # Optional dependencies not available or framebuffer not supported
+            # Video features will be unavailable but basic input control works
+            pass
+
     def __enter__(self) -> "VNCAgentBridge":
-        """Context manager entry - connect automatically."""
-        self.connect()
+        """Context manager entry - connect automatically.
+
+        Re-entering a bridge that is already inside a `with` block reuses
+        the existing connection.
+        """
+        if self._context_depth == 0:
+            self.connect()
+        self._context_depth += 1
         return self
 
     def __exit__(
@@ -275,5 +352,7 @@ class VNCAgentBridge:
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
     ) -> None:
-        """Context manager exit - disconnect automatically."""
-        self.disconnect()
+        """Context manager exit - disconnect when the outermost block exits."""
+        self._context_depth -= 1
+        if self._context_depth == 0:
+            self.disconnect()
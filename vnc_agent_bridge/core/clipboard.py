@@ -7,7 +7,9 @@ content.
 
 The implementation uses VNC's ClientCutText (type 6) and ServerCutText (type 3)
 messages for clipboard communication. Text encoding follows the RFB protocol
-specification using latin-1 encoding.
+specification using latin-1 encoding. When the server supports the extended
+clipboard pseudo-encoding (see enable_extended()), large text is sent as
+zlib-compressed UTF-8 instead.
 
 All methods support an optional delay parameter for timing control, enabling
 realistic human-like interaction patterns.
@@ -24,12 +26,17 @@ Example:
         clipboard.clear(delay=1.0)
 """
 
+import threading
 import time
 from typing import Optional
 
-from ..exceptions import VNCInputError
+from ..exceptions import VNCInputError, VNCTimeoutError
 from .base_connection import VNCConnectionBase
 
+# Encoded size above which text is compressed when the extended clipboard
+# is available; smaller payloads are not worth the deflate overhead
+COMPRESS_THRESHOLD = 256
+
 
 class ClipboardController:
     """Manages clipboard operations on remote VNC server."""
@@ -43,9 +50,21 @@ class ClipboardController:
         self._connection = connection
         self._cached_content: Optional[str] = None
 
+        # Clipboard text from the server; _cut_serial counts arrivals and
+        # _taken_serial is the last arrival returned by get_text()
+        self._received: Optional[str] = None
+        self._cut_serial = 0
+        self._taken_serial = 0
+        self._cut_condition = threading.Condition()
+        connection.on_clipboard_text = self._on_server_cut_text
+
     def send_text(self, text: str, delay: float = 0) -> None:
         """Send text to remote clipboard.
 
+        If the server supports the extended clipboard, text larger than
+        COMPRESS_THRESHOLD bytes of UTF-8 is sent compressed (and is not
+        limited to latin-1).
+
         Args:
             text: Text to send to remote clipboard
             delay: Wait time before sending (seconds)
@@ -57,6 +76,12 @@ class ClipboardController:
         if not text:
             raise VNCInputError("Text cannot be empty")
 
+        if self._should_compress(text):
+            self._apply_delay(delay)
+            self._connection.send_extended_clipboard_text(text)
+            self._cached_content = text
+            return
+
         try:
             # Validate encoding (latin-1 as per RFB spec)
             text.encode("latin-1")
@@ -69,9 +94,37 @@ class ClipboardController:
         # Update cached content
         self._cached_content = text
 
-    def get_text(self, timeout: float = 5.0) -> Optional[str]:
+    def enable_extended(self) -> bool:
+        """Ask the server to use the extended clipboard format.
+
+        Advertises the extended clipboard pseudo-encoding and reads the
+        server's capability announcement. Note that SetEncodings replaces
+        the previously advertised encodings.
+
+        Returns:
+            True if the server supports the extended clipboard
+
+        Raises:
+            VNCStateError: If not connected
+        """
+        self._connection.set_encodings(
+            [
+                VNCConnectionBase.ENCODING_RAW,
+                VNCConnectionBase.ENCODING_EXTENDED_CLIPBOARD,
+            ]
+        )
+        self._connection.receive_clipboard_text()
+        return self._connection.extended_clipboard
+
+    def get_text(self, timeout: float = 1.0) -> Optional[str]:
         """Get text from remote clipboard.
 
+        Text that already arrived while another thread was reading server
+        messages (for example during background video recording) is
+        returned immediately. If such a reader is active, this waits up to
+        timeout for it to deliver clipboard text; otherwise the next server
+        message is read directly.
+
         Args:
             timeout: Maximum wait time for clipboard data (seconds)
 
@@ -85,15 +138,79 @@ class ClipboardController:
         if timeout < 0:
             raise VNCInputError("Timeout cannot be negative")
 
-        # Try to get clipboard text
-        text = self._connection.receive_clipboard_text()
+        if self._connection.is_reading:
+            # The active reader dispatches ServerCutText to us
+            with self._cut_condition:
+                self._cut_condition.wait_for(self._has_unread, timeout)
+        elif not self._has_unread():
+            text = self._connection.receive_clipboard_text()
+            if text is not None:
+                self._on_server_cut_text(text)
 
-        # Update cache if we got content
-        if text is not None:
-            self._cached_content = text
+        return self._take_received()
+
+    def wait_for_change(self, previous: int, timeout: float = 1.0) -> Optional[str]:
+        """Wait until the server sends clipboard text after a known point.
+
+        Take serial before triggering a copy, then pass it here. Returns as
+        soon as the text arrives instead of after a fixed sleep. Without
+        an active reader, server messages are read here until then; other
+        messages (such as framebuffer updates) are consumed and dropped.
+
+            prev = clipboard.serial
+            keyboard.hotkey("ctrl", "c")
+            text = clipboard.wait_for_change(prev, timeout=2.0)
+
+        Args:
+            previous: Value of serial taken before the copy was triggered
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            The new clipboard text, or None if none arrived within timeout
+
+        Raises:
+            VNCInputError: If timeout is negative
+            VNCStateError: If not connected
+        """
+        if timeout < 0:
+            raise VNCInputError("Timeout cannot be negative")
+
+        def changed() -> bool:
+            return self._cut_serial > previous
+
+        if self._connection.is_reading:
+            with self._cut_condition:
+                self._cut_condition.wait_for(changed, timeout)
+        else:
+            # ServerCutText reaches _on_server_cut_text through the listener
+            deadline = time.monotonic() + timeout
+            while not changed():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._connection.read_server_message(timeout=remaining)
+                except VNCTimeoutError:
+                    break
+
+        with self._cut_condition:
+            if not changed():
+                return None
+            text = self._received
+            self._taken_serial = self._cut_serial
 
+        self._cached_content = text
         return text
 
+    @property
+    def serial(self) -> int:
+        """Number of clipboard texts received from the server so far.
+
+        Returns:
+            Monotonically increasing arrival counter
+        """
+        return self._cut_serial
+
     def clear(self, delay: float = 0) -> None:
         """Clear remote clipboard.
 
@@ -133,6 +250,49 @@ class ClipboardController:
         """
         return self._cached_content or ""
 
+    def _should_compress(self, text: str) -> bool:
+        """Check whether text goes through the compressed extended format.
+
+        Args:
+            text: Text to send
+
+        Returns:
+            True if the extended clipboard is available and text is large
+        """
+        if not self._connection.extended_clipboard:
+            return False
+        return len(text.encode("utf-8")) > COMPRESS_THRESHOLD
+
+    def _on_server_cut_text(self, text: str) -> None:
+        """Store clipboard text received from the server.
+
+        Args:
+            text: Clipboard text
+        """
+        with self._cut_condition:
+            self._received = text
+            self._cut_serial += 1
+            self._cut_condition.notify_all()
+
+    def _has_unread(self) -> bool:
+        """Check for clipboard text not yet returned to the caller."""
+        return self._cut_serial > self._taken_serial
+
+    def _take_received(self) -> Optional[str]:
+        """Return the latest received clipboard text and update the cache.
+
+        Returns:
+            Received text, or None if nothing new arrived
+        """
+        with self._cut_condition:
+            if not self._has_unread():
+                return None
+            text = self._received
+            self._taken_serial = self._cut_serial
+
+        self._cached_content = text
+        return text
+
     def _apply_delay(self, delay: float) -> None:
         """Apply delay in seconds.
 
@@ -31,6 +31,8 @@ class TCPVNCConnection(VNCConnectionBase):
         username: Optional[str] = None,
         password: Optional[str] = None,
         timeout: float = 10.0,
+        tcp_nodelay: bool = True,
+        receive_buffer_size: Optional[int] = None,
     ) -> None:
         """Initialize TCP VNC connection parameters.
 
@@ -40,12 +42,19 @@ class TCPVNCConnection(VNCConnectionBase):
             username: Optional username for authentication
             password: Optional password for authentication
             timeout: Connection timeout in seconds
+            tcp_nodelay: Disable Nagle's algorithm so small input messages
+                are sent immediately (default True)
+            receive_buffer_size: Socket receive buffer (SO_RCVBUF) in bytes,
+                for large framebuffer reads over high-latency links (default
+                None, keep the OS default and its automatic tuning)
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.timeout = timeout
+        self.tcp_nodelay = tcp_nodelay
+        self.receive_buffer_size = receive_buffer_size
 
         # Connection state
         self._socket: Optional[socket.socket] = None
@@ -66,6 +75,14 @@ class TCPVNCConnection(VNCConnectionBase):
             # Create TCP socket
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.settimeout(self.timeout)
+            # Disable Nagle so small input events are sent immediately
+            if self.tcp_nodelay:
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Must be set before connecting to take part in window scaling
+            if self.receive_buffer_size is not None:
+                self._socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+                )
 
             # Connect to server
             self._socket.connect((self.host, self.port))
@@ -96,6 +113,7 @@ class TCPVNCConnection(VNCConnectionBase):
                 pass  # Ignore errors during cleanup
             self._socket = None
         self._connected = False
+        self.extended_clipboard = False
 
     @property
     def is_connected(self) -> bool:
@@ -117,9 +135,33 @@ class TCPVNCConnection(VNCConnectionBase):
         self._validate_connection()
 
         # Format: [msg_type=5][button_mask][x][y] (big-endian)
-        data = struct.pack("!BBHH", self.POINTER_EVENT, button_mask, x, y)
+        data = self.POINTER_EVENT_STRUCT.pack(self.POINTER_EVENT, button_mask, x, y)
         self._send_raw(data)
 
+    def send_pointer_events(self, events: List[Tuple[int, int, int]]) -> None:
+        """Send a sequence of pointer events in a single write.
+
+        Args:
+            events: List of (x, y, button_mask) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if not events:
+            return
+
+        # Pack all 6-byte PointerEvent messages back to back into one buffer
+        layout = self.POINTER_EVENT_STRUCT
+        data = bytearray(layout.size * len(events))
+        for index, (x, y, button_mask) in enumerate(events):
+            layout.pack_into(
+                data, index * layout.size, self.POINTER_EVENT, button_mask, x, y
+            )
+        self._send_raw(bytes(data))
+
     def send_key_event(self, keycode: int, pressed: bool) -> None:
         """Send keyboard event to server.
 
@@ -135,9 +177,34 @@ class TCPVNCConnection(VNCConnectionBase):
 
         # Format: [msg_type=4][down_flag][padding][keycode] (big-endian)
         down_flag = 1 if pressed else 0
-        data = struct.pack("!BBHI", self.KEY_EVENT, down_flag, 0, keycode)
+        data = self.KEY_EVENT_STRUCT.pack(self.KEY_EVENT, down_flag, 0, keycode)
         self._send_raw(data)
 
+    def send_key_events(self, events: List[Tuple[int, bool]]) -> None:
+        """Send a sequence of keyboard events in a single write.
+
+        Args:
+            events: List of (keycode, pressed) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if not events:
+            return
+
+        # Pack all 8-byte KeyEvent messages back to back into one buffer
+        layout = self.KEY_EVENT_STRUCT
+        data = bytearray(layout.size * len(events))
+        for index, (keycode, pressed) in enumerate(events):
+            down_flag = 1 if pressed else 0
+            layout.pack_into(
+                data, index * layout.size, self.KEY_EVENT, down_flag, 0, keycode
+            )
+        self._send_raw(bytes(data))
+
     def request_framebuffer_update(
         self,
         incremental: bool = True,
@@ -185,6 +252,10 @@ class TCPVNCConnection(VNCConnectionBase):
     def read_framebuffer_update(self) -> List[Tuple[int, int, int, int, bytes]]:
         """Read framebuffer update response from server.
 
+        Fence requests received before the update are answered, clipboard
+        text is passed to on_clipboard_text, and an EndOfContinuousUpdates
+        message yields an empty list.
+
         Returns:
             List of rectangles: [(x, y, width, height, pixel_data), ...]
 
@@ -195,10 +266,106 @@ class TCPVNCConnection(VNCConnectionBase):
         """
         self._validate_connection()
 
-        # Read message type
-        msg_type = struct.unpack("!B", self._recv_exact(1))[0]
+        self._reading = True
+        try:
+            return self._read_update_message()
+        finally:
+            self._reading = False
+
+    def read_server_message(
+        self, timeout: Optional[float] = None
+    ) -> Optional[List[Tuple[int, int, int, int, bytes]]]:
+        """Read and handle one server message.
+
+        Args:
+            timeout: Maximum wait in seconds for the message to start
+                (default None, the connection timeout)
+
+        Returns:
+            Rectangles of a framebuffer update, an empty list for
+            EndOfContinuousUpdates, or None for any other message
+
+        Raises:
+            VNCStateError: If not connected
+            VNCTimeoutError: If no message started within timeout
+            VNCConnectionError: If receive fails
+            VNCProtocolError: If message format is invalid
+        """
+        self._validate_connection()
+
+        self._reading = True
+        try:
+            return self._handle_server_message(self._recv_message_type(timeout))
+        finally:
+            self._reading = False
+
+    def _read_update_message(self) -> List[Tuple[int, int, int, int, bytes]]:
+        """Read server messages up to and including a framebuffer update.
+
+        Returns:
+            List of rectangles: [(x, y, width, height, pixel_data), ...]
+        """
+        while True:
+            msg_type = struct.unpack("!B", self._recv_exact(1))[0]
+            rectangles = self._handle_server_message(msg_type)
+            if rectangles is not None:
+                return rectangles
+
+    def _recv_message_type(self, timeout: Optional[float]) -> int:
+        """Receive the type byte of the next server message.
+
+        Only the type byte is read with the given timeout; the rest of the
+        message is read with the connection timeout, so a short wait never
+        leaves a message half read.
+
+        Args:
+            timeout: Maximum wait in seconds (None for the connection timeout)
+
+        Returns:
+            Message type
+        """
+        if timeout is None or self._socket is None:
+            return int(struct.unpack("!B", self._recv_exact(1))[0])
+
+        previous = self._socket.gettimeout()
+        self._socket.settimeout(timeout)
+        try:
+            return int(struct.unpack("!B", self._recv_exact(1))[0])
+        finally:
+            # A failed receive closes the connection
+            if self._socket is not None:
+                self._socket.settimeout(previous)
+
+    def _handle_server_message(
+        self, msg_type: int
+    ) -> Optional[List[Tuple[int, int, int, int, bytes]]]:
+        """Read the body of a server message and handle it.
+
+        Fence requests are answered, clipboard text is passed to
+        on_clipboard_text and Bell is ignored.
+
+        Args:
+            msg_type: Message type byte, already received
+
+        Returns:
+            Rectangles of a framebuffer update, an empty list for
+            EndOfContinuousUpdates, or None for any other message
+
+        Raises:
+            VNCProtocolError: If the message is unknown or malformed
+        """
+        if msg_type == self.END_OF_CONTINUOUS_UPDATES:
+            return []
+        if msg_type == self.FENCE:
+            self._answer_fence()
+            return None
+        if msg_type == self.CLIPBOARD_TEXT_SERVER:
+            self._dispatch_server_cut_text()
+            return None
+        if msg_type == self.BELL:
+            return None
         if msg_type != self.FRAMEBUFFER_UPDATE:
-            raise VNCProtocolError(f"Expected framebuffer update (0), got {msg_type}")
+            raise VNCProtocolError(f"Unexpected server message type: {msg_type}")
 
         # Skip padding byte
         self._recv_exact(1)
@@ -218,12 +385,52 @@ class TCPVNCConnection(VNCConnectionBase):
 
             # Calculate pixel data size (assuming 32-bit RGBA)
             pixel_data_size = width * height * 4
-            pixel_data = self._recv_exact(pixel_data_size)
+            pixel_data = self._recv_into_buffer(pixel_data_size)
 
             rectangles.append((x, y, width, height, pixel_data))
 
         return rectangles
 
+    def enable_continuous_updates(
+        self,
+        enable: bool,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        """Start or stop continuous framebuffer updates for a region.
+
+        Args:
+            enable: True to start streaming, False to stop
+            x: X coordinate of update region
+            y: Y coordinate of update region
+            width: Width of update region (None for full width)
+            height: Height of update region (None for full height)
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if width is None:
+            width = 1920  # Default width
+        if height is None:
+            height = 1080  # Default height
+
+        # Format: [msg_type=150][enable][x][y][width][height] (big-endian)
+        data = struct.pack(
+            "!BBHHHH",
+            self.ENABLE_CONTINUOUS_UPDATES,
+            1 if enable else 0,
+            x,
+            y,
+            width,
+            height,
+        )
+        self._send_raw(data)
+
     def set_encodings(self, encodings: List[int]) -> None:
         """Tell server which encodings we support.
 
@@ -262,12 +469,24 @@ class TCPVNCConnection(VNCConnectionBase):
         text_bytes = text.encode("latin-1")
         text_length = len(text_bytes)
 
-        # Format: [msg_type=6][padding][length][text_bytes] (big-endian)
-        data = struct.pack("!BBI", self.CLIPBOARD_TEXT_CLIENT, 0, text_length)
-        data += text_bytes
+        # Format: [msg_type=6][padding x3][length][text_bytes] (big-endian)
+        data = self._client_cut_text_header(text_length) + text_bytes
 
         self._send_raw(data)
 
+    def send_extended_clipboard_text(self, text: str) -> None:
+        """Send clipboard text using the extended clipboard format.
+
+        Args:
+            text: Text to send to remote clipboard
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+        self._send_raw(self._extended_clipboard_provide(text))
+
     def receive_clipboard_text(self) -> Optional[str]:
         """Receive clipboard text from server.
 
@@ -294,22 +513,56 @@ class TCPVNCConnection(VNCConnectionBase):
                 # For now, return None if it's not clipboard data
                 return None
 
-            # Skip padding byte
-            self._recv_exact(1)
-
-            # Read text length
-            text_length = struct.unpack("!I", self._recv_exact(4))[0]
-
-            # Read text data
-            text_bytes = self._recv_exact(text_length)
-
-            # Decode as latin-1 (per RFB spec)
-            return text_bytes.decode("latin-1")
+            return self._read_server_cut_text()
 
         except (VNCConnectionError, VNCTimeoutError):
             # No clipboard data available
             return None
 
+    def _read_server_cut_text(self) -> Optional[str]:
+        """Read the body of a ServerCutText message.
+
+        Returns:
+            Clipboard text, or None for extended messages without text
+        """
+        # Skip padding bytes
+        self._recv_exact(3)
+
+        # Read text length (negative for extended clipboard messages)
+        text_length = struct.unpack("!i", self._recv_exact(4))[0]
+        if text_length < 0:
+            return self._receive_extended_clipboard(-text_length)
+
+        # Read text data
+        text_bytes = self._recv_exact(text_length)
+
+        # Decode as latin-1 (per RFB spec)
+        return text_bytes.decode("latin-1")
+
+    def _dispatch_server_cut_text(self) -> None:
+        """Read a ServerCutText message and pass its text to the listener."""
+        text = self._read_server_cut_text()
+        if text is not None and self.on_clipboard_text is not None:
+            self.on_clipboard_text(text)
+
+    def _receive_extended_clipboard(self, length: int) -> Optional[str]:
+        """Read an extended ServerCutText payload.
+
+        A Caps message enables the extended clipboard and is answered with
+        our own Caps.
+
+        Args:
+            length: Payload length in bytes
+
+        Returns:
+            Provided clipboard text, or None for other actions
+        """
+        flags, text = self._parse_extended_clipboard(self._recv_exact(length))
+        if flags & self.CLIPBOARD_ACTION_CAPS:
+            self.extended_clipboard = True
+            self._send_raw(self._extended_clipboard_caps())
+        return text
+
     def _validate_connection(self) -> None:
         """Verify connection is active.
 
@@ -409,8 +662,8 @@ class TCPVNCConnection(VNCConnectionBase):
         server_init_header = self._recv_exact(4)
         width, height = struct.unpack("!HH", server_init_header)
 
-        # Skip pixel format (16 bytes) and name length (4 bytes)
-        pixel_format = self._recv_exact(16)
+        # Keep pixel format (16 bytes) for decoding, skip name length (4 bytes)
+        self.pixel_format = self._recv_exact(16)
         name_length = struct.unpack("!I", self._recv_exact(4))[0]
 
         # Skip name string
@@ -517,6 +770,27 @@ class TCPVNCConnection(VNCConnectionBase):
             "VNC authentication (Type 2) requires proper DES-ECB encryption."
         )
 
+    def _answer_fence(self) -> None:
+        """Read a ServerFence message and answer it if requested.
+
+        Messages are handled in order, so echoing the supported flags right
+        away satisfies the BlockBefore, BlockAfter and SyncNext semantics.
+        """
+        # Format: [padding x3][flags][length][payload] (big-endian)
+        self._recv_exact(3)
+        flags = struct.unpack("!I", self._recv_exact(4))[0]
+        length = struct.unpack("!B", self._recv_exact(1))[0]
+        payload = self._recv_exact(length) if length else b""
+
+        if flags & self.FENCE_REQUEST:
+            data = struct.pack(
+                "!BxxxIB",
+                self.FENCE,
+                flags & self.FENCE_SUPPORTED_FLAGS,
+                length,
+            )
+            self._send_raw(data + payload)
+
     def _send_raw(self, data: bytes) -> None:
         """Send raw bytes to server.
 
@@ -565,6 +839,43 @@ class TCPVNCConnection(VNCConnectionBase):
             self._cleanup_socket()
             raise VNCConnectionError(f"Failed to receive data: {e}")
 
+    def _recv_into_buffer(self, count: int) -> bytes:
+        """Receive exactly count bytes into a pre-sized buffer.
+
+        Used for pixel data: reading straight into one buffer avoids the
+        repeated concatenation of _recv_exact() for large rectangles.
+
+        Args:
+            count: Number of bytes to receive
+
+        Returns:
+            Received bytes
+
+        Raises:
+            VNCConnectionError: If receive fails
+            VNCTimeoutError: If receive times out
+        """
+        if not self._socket:
+            raise VNCConnectionError("No socket available")
+
+        buffer = bytearray(count)
+        view = memoryview(buffer)
+        try:
+            received = 0
+            while received < count:
+                size = self._socket.recv_into(view[received:])
+                if not size:
+                    raise VNCConnectionError("Connection closed by server")
+                received += size
+            return bytes(buffer)
+        except socket.timeout:
+            raise VNCTimeoutError("Receive operation timed out")
+        except Exception as e:
+            self._cleanup_socket()
+            raise VNCConnectionError(f"Failed to receive data: {e}")
+        finally:
+            view.release()
+
     def _cleanup_socket(self) -> None:
         """Clean up socket resources."""
         if self._socket:
@@ -8,6 +8,7 @@ The implementation uses the websocket-client library to establish WebSocket
 connections and wraps RFB 3.8 protocol messages in WebSocket frames.
 """
 
+import socket
 import ssl
 import struct
 import urllib.parse
@@ -85,7 +86,8 @@ class WebSocketVNCConnection(VNCConnectionBase):
         # Connection state
         self._websocket = None
         self._connected = False
-        self._recv_buffer = b""  # Buffer for handling fragmented WebSocket messages
+        # Buffer for handling fragmented WebSocket messages
+        self._recv_buffer = bytearray()
 
         # Validate required parameters
         if not url_template:
@@ -177,9 +179,33 @@ class WebSocketVNCConnection(VNCConnectionBase):
         self._validate_connection()
 
         # Format: [msg_type=5][button_mask][x][y] (big-endian)
-        data = struct.pack("!BBHH", self.POINTER_EVENT, button_mask, x, y)
+        data = self.POINTER_EVENT_STRUCT.pack(self.POINTER_EVENT, button_mask, x, y)
         self._send_raw(data)
 
+    def send_pointer_events(self, events: List[Tuple[int, int, int]]) -> None:
+        """Send a sequence of pointer events in a single write.
+
+        Args:
+            events: List of (x, y, button_mask) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if not events:
+            return
+
+        # Pack all 6-byte PointerEvent messages back to back into one buffer
+        layout = self.POINTER_EVENT_STRUCT
+        data = bytearray(layout.size * len(events))
+        for index, (x, y, button_mask) in enumerate(events):
+            layout.pack_into(
+                data, index * layout.size, self.POINTER_EVENT, button_mask, x, y
+            )
+        self._send_raw(bytes(data))
+
     def send_key_event(self, keycode: int, pressed: bool) -> None:
         """Send keyboard event to server.
 
@@ -195,9 +221,34 @@ class WebSocketVNCConnection(VNCConnectionBase):
 
         # Format: [msg_type=4][down_flag][padding][keycode] (big-endian)
         down_flag = 1 if pressed else 0
-        data = struct.pack("!BBHI", self.KEY_EVENT, down_flag, 0, keycode)
+        data = self.KEY_EVENT_STRUCT.pack(self.KEY_EVENT, down_flag, 0, keycode)
         self._send_raw(data)
 
+    def send_key_events(self, events: List[Tuple[int, bool]]) -> None:
+        """Send a sequence of keyboard events in a single write.
+
+        Args:
+            events: List of (keycode, pressed) tuples, sent in order
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if not events:
+            return
+
+        # Pack all 8-byte KeyEvent messages back to back into one buffer
+        layout = self.KEY_EVENT_STRUCT
+        data = bytearray(layout.size * len(events))
+        for index, (keycode, pressed) in enumerate(events):
+            down_flag = 1 if pressed else 0
+            layout.pack_into(
+                data, index * layout.size, self.KEY_EVENT, down_flag, 0, keycode
+            )
+        self._send_raw(bytes(data))
+
     def request_framebuffer_update(
         self,
         incremental: bool = True,
@@ -243,6 +294,10 @@ class WebSocketVNCConnection(VNCConnectionBase):
     def read_framebuffer_update(self) -> List[Tuple[int, int, int, int, bytes]]:
         """Read framebuffer update response from server.
 
+        Fence requests received before the update are answered, clipboard
+        text is passed to on_clipboard_text, and an EndOfContinuousUpdates
+        message yields an empty list.
+
         Returns:
             List of rectangles: [(x, y, width, height, pixel_data), ...]
 
@@ -253,10 +308,106 @@ class WebSocketVNCConnection(VNCConnectionBase):
         """
         self._validate_connection()
 
-        # Read message type
-        msg_type = struct.unpack("!B", self._recv_exact(1))[0]
+        self._reading = True
+        try:
+            return self._read_update_message()
+        finally:
+            self._reading = False
+
+    def read_server_message(
+        self, timeout: Optional[float] = None
+    ) -> Optional[List[Tuple[int, int, int, int, bytes]]]:
+        """Read and handle one server message.
+
+        Args:
+            timeout: Maximum wait in seconds for the message to start
+                (default None, the connection timeout)
+
+        Returns:
+            Rectangles of a framebuffer update, an empty list for
+            EndOfContinuousUpdates, or None for any other message
+
+        Raises:
+            VNCStateError: If not connected
+            VNCTimeoutError: If no message started within timeout
+            VNCConnectionError: If receive fails
+            VNCProtocolError: If message format is invalid
+        """
+        self._validate_connection()
+
+        self._reading = True
+        try:
+            return self._handle_server_message(self._recv_message_type(timeout))
+        finally:
+            self._reading = False
+
+    def _read_update_message(self) -> List[Tuple[int, int, int, int, bytes]]:
+        """Read server messages up to and including a framebuffer update.
+
+        Returns:
+            List of rectangles: [(x, y, width, height, pixel_data), ...]
+        """
+        while True:
+            msg_type = struct.unpack("!B", self._recv_exact(1))[0]
+            rectangles = self._handle_server_message(msg_type)
+            if rectangles is not None:
+                return rectangles
+
+    def _recv_message_type(self, timeout: Optional[float]) -> int:
+        """Receive the type byte of the next server message.
+
+        Only the type byte is read with the given timeout; the rest of the
+        message is read with the connection timeout, so a short wait never
+        leaves a message half read.
+
+        Args:
+            timeout: Maximum wait in seconds (None for the connection timeout)
+
+        Returns:
+            Message type
+        """
+        if timeout is None or self._websocket is None:
+            return int(struct.unpack("!B", self._recv_exact(1))[0])
+
+        previous = self._websocket.gettimeout()  # type: ignore[unreachable]
+        self._websocket.settimeout(timeout)
+        try:
+            return int(struct.unpack("!B", self._recv_exact(1))[0])
+        finally:
+            # A failed receive closes the connection
+            if self._websocket is not None:
+                self._websocket.settimeout(previous)
+
+    def _handle_server_message(
+        self, msg_type: int
+    ) -> Optional[List[Tuple[int, int, int, int, bytes]]]:
+        """Read the body of a server message and handle it.
+
+        Fence requests are answered, clipboard text is passed to
+        on_clipboard_text and Bell is ignored.
+
+        Args:
+            msg_type: Message type byte, already received
+
+        Returns:
+            Rectangles of a framebuffer update, an empty list for
+            EndOfContinuousUpdates, or None for any other message
+
+        Raises:
+            VNCProtocolError: If the message is unknown or malformed
+        """
+        if msg_type == self.END_OF_CONTINUOUS_UPDATES:
+            return []
+        if msg_type == self.FENCE:
+            self._answer_fence()
+            return None
+        if msg_type == self.CLIPBOARD_TEXT_SERVER:
+            self._dispatch_server_cut_text()
+            return None
+        if msg_type == self.BELL:
+            return None
         if msg_type != self.FRAMEBUFFER_UPDATE:
-            raise VNCProtocolError(f"Expected framebuffer update (0), got {msg_type}")
+            raise VNCProtocolError(f"Unexpected server message type: {msg_type}")
 
         # Skip padding byte
         self._recv_exact(1)
@@ -282,6 +433,46 @@ class WebSocketVNCConnection(VNCConnectionBase):
 
         return rectangles
 
+    def enable_continuous_updates(
+        self,
+        enable: bool,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        """Start or stop continuous framebuffer updates for a region.
+
+        Args:
+            enable: True to start streaming, False to stop
+            x: X coordinate of update region
+            y: Y coordinate of update region
+            width: Width of update region (None for full width)
+            height: Height of update region (None for full height)
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+
+        if width is None:
+            width = 1920  # Default width
+        if height is None:
+            height = 1080  # Default height
+
+        # Format: [msg_type=150][enable][x][y][width][height] (big-endian)
+        data = struct.pack(
+            "!BBHHHH",
+            self.ENABLE_CONTINUOUS_UPDATES,
+            1 if enable else 0,
+            x,
+            y,
+            width,
+            height,
+        )
+        self._send_raw(data)
+
     def set_encodings(self, encodings: List[int]) -> None:
         """Tell server which encodings we support.
 
@@ -320,12 +511,24 @@ class WebSocketVNCConnection(VNCConnectionBase):
         text_bytes = text.encode("latin-1")
         text_length = len(text_bytes)
 
-        # Format: [msg_type=6][padding][length][text_bytes] (big-endian)
-        data = struct.pack("!BBI", self.CLIPBOARD_TEXT_CLIENT, 0, text_length)
-        data += text_bytes
+        # Format: [msg_type=6][padding x3][length][text_bytes] (big-endian)
+        data = self._client_cut_text_header(text_length) + text_bytes
 
         self._send_raw(data)
 
+    def send_extended_clipboard_text(self, text: str) -> None:
+        """Send clipboard text using the extended clipboard format.
+
+        Args:
+            text: Text to send to remote clipboard
+
+        Raises:
+            VNCStateError: If not connected
+            VNCConnectionError: If send fails
+        """
+        self._validate_connection()
+        self._send_raw(self._extended_clipboard_provide(text))
+
     def receive_clipboard_text(self) -> Optional[str]:
         """Receive clipboard text from server.
 
@@ -345,22 +548,56 @@ class WebSocketVNCConnection(VNCConnectionBase):
             if msg_type != self.CLIPBOARD_TEXT_SERVER:
                 return None
 
-            # Skip padding byte
-            self._recv_exact(1)
-
-            # Read text length
-            text_length = struct.unpack("!I", self._recv_exact(4))[0]
-
-            # Read text data
-            text_bytes = self._recv_exact(text_length)
-
-            # Decode as latin-1 (per RFB spec)
-            return text_bytes.decode("latin-1")
+            return self._read_server_cut_text()
 
         except (VNCConnectionError, VNCTimeoutError):
             # No clipboard data available
             return None
 
+    def _read_server_cut_text(self) -> Optional[str]:
+        """Read the body of a ServerCutText message.
+
+        Returns:
+            Clipboard text, or None for extended messages without text
+        """
+        # Skip padding bytes
+        self._recv_exact(3)
+
+        # Read text length (negative for extended clipboard messages)
+        text_length = struct.unpack("!i", self._recv_exact(4))[0]
+        if text_length < 0:
+            return self._receive_extended_clipboard(-text_length)
+
+        # Read text data
+        text_bytes = self._recv_exact(text_length)
+
+        # Decode as latin-1 (per RFB spec)
+        return text_bytes.decode("latin-1")
+
+    def _dispatch_server_cut_text(self) -> None:
+        """Read a ServerCutText message and pass its text to the listener."""
+        text = self._read_server_cut_text()
+        if text is not None and self.on_clipboard_text is not None:
+            self.on_clipboard_text(text)
+
+    def _receive_extended_clipboard(self, length: int) -> Optional[str]:
+        """Read an extended ServerCutText payload.
+
+        A Caps message enables the extended clipboard and is answered with
+        our own Caps.
+
+        Args:
+            length: Payload length in bytes
+
+        Returns:
+            Provided clipboard text, or None for other actions
+        """
+        flags, text = self._parse_extended_clipboard(self._recv_exact(length))
+        if flags & self.CLIPBOARD_ACTION_CAPS:
+            self.extended_clipboard = True
+            self._send_raw(self._extended_clipboard_caps())
+        return text
+
     def _validate_connection(self) -> None:
         """Verify connection is active.
 
@@ -533,14 +770,35 @@ class WebSocketVNCConnection(VNCConnectionBase):
         server_init_header = self._recv_exact(4)
         width, height = struct.unpack("!HH", server_init_header)
 
-        # Skip pixel format (16 bytes) and name length (4 bytes)
-        pixel_format = self._recv_exact(16)
+        # Keep pixel format (16 bytes) for decoding, skip name length (4 bytes)
+        self.pixel_format = self._recv_exact(16)
         name_length = struct.unpack("!I", self._recv_exact(4))[0]
 
         # Skip name string
         if name_length > 0:
             self._recv_exact(name_length)
 
+    def _answer_fence(self) -> None:
+        """Read a ServerFence message and answer it if requested.
+
+        Messages are handled in order, so echoing the supported flags right
+        away satisfies the BlockBefore, BlockAfter and SyncNext semantics.
+        """
+        # Format: [padding x3][flags][length][payload] (big-endian)
+        self._recv_exact(3)
+        flags = struct.unpack("!I", self._recv_exact(4))[0]
+        length = struct.unpack("!B", self._recv_exact(1))[0]
+        payload = self._recv_exact(length) if length else b""
+
+        if flags & self.FENCE_REQUEST:
+            data = struct.pack(
+                "!BxxxIB",
+                self.FENCE,
+                flags & self.FENCE_SUPPORTED_FLAGS,
+                length,
+            )
+            self._send_raw(data + payload)
+
     def _send_raw(self, data: bytes) -> None:
         """Send raw bytes to server via WebSocket.
 
@@ -590,12 +848,17 @@ class WebSocketVNCConnection(VNCConnectionBase):
                     raise VNCConnectionError("Connection closed by server")
                 self._recv_buffer += chunk
 
-            # Extract exactly count bytes from buffer
-            result = self._recv_buffer[:count]
-            self._recv_buffer = self._recv_buffer[count:]
+            # Extract exactly count bytes; deleting the consumed prefix of a
+            # bytearray does not copy the rest of the buffer
+            result = bytes(self._recv_buffer[:count])
+            del self._recv_buffer[:count]
             return result
 
         except Exception as e:
+            if isinstance(e, socket.timeout) or "Timeout" in type(e).__name__:
+                # Nothing arrived; the connection stays usable and any
+                # partial message remains in the receive buffer
+                raise VNCTimeoutError("Receive operation timed out")
             self._cleanup_websocket()
             if "timeout" in str(e).lower():
                 raise VNCTimeoutError("Receive operation timed out")
@@ -609,8 +872,9 @@ class WebSocketVNCConnection(VNCConnectionBase):
             except Exception:
                 pass
         self._websocket = None
-        self._recv_buffer = b""
+        self._recv_buffer.clear()
         self._connected = False
+        self.extended_clipboard = False
 
     def _vnc_auth_response(self, challenge: bytes, password: str) -> bytes:
         """Generate VNC authentication response.
@@ -23,6 +23,8 @@ Example:
         screen = fb.get_buffer()
 """
 
+import struct
+
 import numpy as np
 from typing import Optional, List, Tuple, Any
 
@@ -44,6 +46,7 @@ class FramebufferManager:
         self.config = config
         self._buffer: Optional[Any] = None
         self._is_dirty = False
+        self._channels = self._channel_order(config.pixel_format)
 
     def initialize_buffer(self) -> None:
         """Create initial framebuffer array."""
@@ -51,6 +54,9 @@ class FramebufferManager:
         self._buffer = np.zeros(
             (self.config.height, self.config.width, 4), dtype=np.uint8
         )
+        if self._channels is not None:
+            # Server pixels carry no alpha; the screen is opaque
+            self._buffer[..., 3] = 255
         self._is_dirty = False
 
     def request_update(
@@ -105,7 +111,8 @@ class FramebufferManager:
             y: Y coordinate of rectangle
             width: Rectangle width
             height: Rectangle height
-            pixel_data: Raw pixel data (RGBA format)
+            pixel_data: Raw pixel data (32 bits per pixel, in the server's
+                pixel format, or RGBA if the format is unknown)
         """
         if self._buffer is None:
             raise RuntimeError("Framebuffer not initialized")
@@ -122,18 +129,76 @@ class FramebufferManager:
         # Reshape pixel data to (height, width, 4)
         pixels = np.frombuffer(pixel_data, dtype=np.uint8).reshape((height, width, 4))
 
-        # Update the buffer region
-        self._buffer[y : y + height, x : x + width] = pixels
+        # Update the buffer region, reordering the color bytes to RGB if the
+        # server uses another byte order. One strided copy per channel avoids
+        # the temporary array that fancy indexing (pixels[..., order]) builds
+        region = self._buffer[y : y + height, x : x + width]
+        if self._channels is None:
+            region[...] = pixels
+        else:
+            for target, source in enumerate(self._channels):
+                region[..., target] = pixels[..., source]
+
+    @staticmethod
+    def _channel_order(pixel_format: bytes) -> Optional[List[int]]:
+        """Find the byte offsets of red, green and blue in a server pixel.
 
-    def get_buffer(self) -> Any:
+        Args:
+            pixel_format: 16-byte RFB PIXEL_FORMAT from ServerInit
+
+        Returns:
+            Byte offsets [red, green, blue] within each 4-byte pixel, or
+            None if the format is not 32-bit true colour with byte-aligned
+            8-bit channels (pixel data is then used as RGBA unchanged)
+        """
+        if len(pixel_format) != 16:
+            return None
+
+        (
+            bits_per_pixel,
+            _depth,
+            big_endian,
+            true_colour,
+            red_max,
+            green_max,
+            blue_max,
+            red_shift,
+            green_shift,
+            blue_shift,
+        ) = struct.unpack("!BBBBHHHBBBxxx", pixel_format)
+
+        shifts = [red_shift, green_shift, blue_shift]
+        if (
+            bits_per_pixel != 32
+            or not true_colour
+            or (red_max, green_max, blue_max) != (255, 255, 255)
+            or any(shift % 8 for shift in shifts)
+        ):
+            return None
+
+        if big_endian:
+            return [3 - shift // 8 for shift in shifts]
+        return [shift // 8 for shift in shifts]
+
+    def get_buffer(self, copy: bool = True) -> Any:
         """Get current framebuffer as numpy array.
 
+        Args:
+            copy: Return an independent copy (default). With False, return a
+                read-only view of the framebuffer itself, which avoids
+                copying the whole screen but changes with the next update
+
         Returns:
             RGBA numpy array with shape (height, width, 4)
         """
         if self._buffer is None:
             raise RuntimeError("Framebuffer not initialized")
-        return self._buffer.copy()
+        if copy:
+            return self._buffer.copy()
+
+        view = self._buffer.view()
+        view.flags.writeable = False
+        return view
 
     def get_region(self, x: int, y: int, width: int, height: int) -> Any:
         """Get specific region of framebuffer.
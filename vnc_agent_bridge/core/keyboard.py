@@ -32,11 +32,12 @@ Example:
         keyboard.keyup("shift")
 """
 
-import time
-from typing import Union
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from ..exceptions import VNCInputError
 from .base_connection import VNCConnectionBase
+from .timing import precise_sleep
 
 
 class KeyboardController:
@@ -110,6 +111,9 @@ class KeyboardController:
         "windows",
     }
 
+    # Maximum number of distinct hotkey combinations kept resolved
+    HOTKEY_CACHE_SIZE = 128
+
     def __init__(self, connection: VNCConnectionBase) -> None:
         """Initialize with VNC connection.
 
@@ -117,17 +121,49 @@ class KeyboardController:
             connection: VNCConnectionBase instance for protocol communication
         """
         self._connection = connection
-
-    def type_text(self, text: str, delay: float = 0) -> None:
+        # Key events collected inside sequence(), None when not buffering
+        self._buffer: Optional[List[Tuple[int, bool]]] = None
+        # Resolved hotkey combinations, keyed by the keys as passed in
+        self._hotkey_cache: Dict[
+            Tuple[Union[str, int], ...], Tuple[Tuple[int, ...], int]
+        ] = {}
+
+    def type_text(
+        self,
+        text: str,
+        delay: float = 0,
+        interval: Union[float, Sequence[float]] = 0,
+        paste_threshold: Optional[int] = None,
+    ) -> None:
         """Type text character by character.
 
+        By default the key presses and releases for the whole string are sent
+        to the server as a single batch. Pass ``interval`` to pace characters
+        individually instead, e.g. for human-like typing.
+
+        With ``paste_threshold`` set, text of at least that many characters is
+        put on the remote clipboard and pasted with Ctrl+V instead, which is a
+        single message regardless of length. This replaces the remote clipboard
+        contents and requires the focused application to accept Ctrl+V, so it
+        is opt-in. Text that cannot be sent as clipboard data (non Latin-1) is
+        always typed.
+
         Args:
             text: Text string to type
             delay: Delay in seconds after operation
+            interval: Pause in seconds after each character (0 sends all at
+                once), or a sequence with one pause per character
+            paste_threshold: Minimum length at which text is pasted through
+                the clipboard (None always types; ignored with interval or
+                inside sequence())
 
         Raises:
-            VNCInputError: If text contains unsupported characters
+            VNCInputError: If text contains unsupported characters or the
+                interval sequence does not match the text length
             VNCStateError: If not connected
+
+        Example:
+            type_text("hello", interval=[0.1, 0.08, 0.12, 0.09, 0.1])
         """
         from ..exceptions import VNCStateError
 
@@ -137,18 +173,32 @@ class KeyboardController:
         if not text:
             raise VNCInputError("Text cannot be empty")
 
-        for char in text:
-            keycode = self._get_keycode(char)
-            if keycode is None:
-                raise VNCInputError(f"Unsupported character: '{char}'")
-
-            # Press and release each key
-            self._connection.send_key_event(keycode, True)  # Key down
-            time.sleep(0.01)  # Small delay between press/release
-            self._connection.send_key_event(keycode, False)  # Key up
-
-            # Small delay between characters for realistic typing
-            time.sleep(0.02)
+        # Resolve every character up front so nothing is sent for invalid text
+        keycodes = self._resolve_text(text)
+        pauses = self._resolve_intervals(interval, len(keycodes))
+
+        if (
+            paste_threshold is not None
+            and len(text) >= paste_threshold
+            and pauses is None
+            and self._buffer is None
+            and self._is_pasteable(text)
+        ):
+            self._connection.send_clipboard_text(text)
+            paste_codes = self._resolve_hotkey(("ctrl", "v"))
+            self._connection.send_key_events(self._hotkey_events(*paste_codes))
+        elif pauses is not None and self._buffer is None:
+            for keycode, pause in zip(keycodes, pauses):
+                self._connection.send_key_event(keycode, True)  # Key down
+                self._connection.send_key_event(keycode, False)  # Key up
+                if pause > 0:
+                    precise_sleep(pause)
+        else:
+            events = []
+            for keycode in keycodes:
+                events.append((keycode, True))
+                events.append((keycode, False))
+            self._send_events(events)
 
         self._apply_delay(delay)
 
@@ -172,9 +222,13 @@ class KeyboardController:
         if keycode is None:
             raise VNCInputError(f"Unknown key: {key}")
 
+        if self._buffer is not None:
+            self._buffer.extend([(keycode, True), (keycode, False)])
+            return
+
         # Press and release
         self._connection.send_key_event(keycode, True)  # Key down
-        time.sleep(0.01)  # Small delay
+        precise_sleep(0.01)  # Small delay
         self._connection.send_key_event(keycode, False)  # Key up
 
         self._apply_delay(delay)
@@ -182,6 +236,9 @@ class KeyboardController:
     def hotkey(self, *keys: Union[str, int], delay: float = 0) -> None:
         """Press multiple keys simultaneously (modifier + main key).
 
+        The modifier downs, main key press/release and modifier ups are sent
+        to the server as a single batch.
+
         Args:
             *keys: Variable number of key names/codes. Modifiers first, then main key.
             delay: Delay in seconds after operation
@@ -199,57 +256,84 @@ class KeyboardController:
         if not self._connection.is_connected:
             raise VNCStateError("Not connected to VNC server")
 
-        if len(keys) < 2:
-            raise VNCInputError("Hotkey requires at least 2 keys (modifier + main)")
+        modifier_codes, main_code = self._resolve_hotkey(keys)
 
-        # Separate modifiers from main key
-        modifier_names = []
-        main_key = None
+        # Modifier downs, key press/release and modifier ups in one write
+        self._send_events(self._hotkey_events(modifier_codes, main_code))
 
-        for key in keys[:-1]:  # All but last are modifiers
-            key_name = key.lower() if isinstance(key, str) else str(key)
-            modifier_names.append(key_name)
+        self._apply_delay(delay)
 
-        main_key = keys[-1]  # Last key is main key
+    def hotkey_batch(
+        self, combos: Sequence[Sequence[Union[str, int]]], delay: float = 0
+    ) -> None:
+        """Press several hotkey combinations back to back in a single batch.
 
-        # Validate modifiers
-        for mod_name in modifier_names:
-            if mod_name not in self.MODIFIER_KEYS:
-                raise VNCInputError(f"Invalid modifier key: {mod_name}")
+        Every combination is validated before anything is sent. The key events
+        for all combinations are then written to the server at once.
 
-        # Get key codes
-        modifier_codes = []
-        for mod_name in modifier_names:
-            code = self._get_keycode(mod_name)
-            if code is None:
-                raise VNCInputError(f"Unknown modifier key: {mod_name}")
-            modifier_codes.append(code)
+        Args:
+            combos: Sequence of key combinations, each in hotkey() order
+                (modifiers first, then main key)
+            delay: Delay in seconds after operation
 
-        main_code = self._get_keycode(main_key)
-        if main_code is None:
-            raise VNCInputError(f"Unknown main key: {main_key}")
+        Raises:
+            VNCInputError: If any combination is invalid
+            VNCStateError: If not connected
 
-        # Press all modifiers first
-        for code in modifier_codes:
-            self._connection.send_key_event(code, True)
+        Example:
+            hotkey_batch([('ctrl', 'a'), ('ctrl', 'c')])  # Select all, copy
+        """
+        from ..exceptions import VNCStateError
 
-        # Small delay
-        time.sleep(0.01)
+        if not self._connection.is_connected:
+            raise VNCStateError("Not connected to VNC server")
 
-        # Press main key
-        self._connection.send_key_event(main_code, True)
-        time.sleep(0.01)
+        resolved = [self._resolve_hotkey(combo) for combo in combos]
 
-        # Release main key
-        self._connection.send_key_event(main_code, False)
-        time.sleep(0.01)
+        events: List[Tuple[int, bool]] = []
+        for modifier_codes, main_code in resolved:
+            events.extend(self._hotkey_events(modifier_codes, main_code))
 
-        # Release modifiers (in reverse order)
-        for code in reversed(modifier_codes):
-            self._connection.send_key_event(code, False)
+        if events:
+            self._send_events(events)
 
         self._apply_delay(delay)
 
+    @contextmanager
+    def sequence(self) -> Iterator["KeyboardController"]:
+        """Collect key operations and send them to the server in one batch.
+
+        Inside the block, type_text(), press_key(), hotkey(), hotkey_batch(),
+        keydown() and keyup() queue their key events instead of sending them,
+        and their delays and pauses are skipped. The queued events are sent
+        with a single write when the block exits normally; if the block raises,
+        they are discarded. Nested sequences join the outermost one.
+
+        Yields:
+            This controller
+
+        Raises:
+            VNCStateError: If not connected when the batch is sent
+
+        Example:
+            with keyboard.sequence():
+                keyboard.hotkey('ctrl', 'a')
+                keyboard.hotkey('ctrl', 'c')
+        """
+        if self._buffer is not None:
+            yield self
+            return
+
+        self._buffer = []
+        try:
+            yield self
+            events = self._buffer
+        finally:
+            self._buffer = None
+
+        if events:
+            self._connection.send_key_events(events)
+
     def keydown(self, key: Union[str, int], delay: float = 0) -> None:
         """Press and hold key down.
 
@@ -270,7 +354,7 @@ class KeyboardController:
         if keycode is None:
             raise VNCInputError(f"Unknown key: {key}")
 
-        self._connection.send_key_event(keycode, True)  # Key down only
+        self._send_events([(keycode, True)])  # Key down only
         self._apply_delay(delay)
 
     def keyup(self, key: Union[str, int], delay: float = 0) -> None:
@@ -288,7 +372,7 @@ class KeyboardController:
         if keycode is None:
             raise VNCInputError(f"Unknown key: {key}")
 
-        self._connection.send_key_event(keycode, False)  # Key up only
+        self._send_events([(keycode, False)])  # Key up only
         self._apply_delay(delay)
 
     def _get_keycode(self, key: Union[str, int]) -> Union[int, None]:
@@ -314,11 +398,159 @@ class KeyboardController:
         # This should never happen due to type hints, but mypy requires it
         raise ValueError(f"Invalid key type: {type(key)}")
 
+    def _send_events(self, events: List[Tuple[int, bool]]) -> None:
+        """Send key events, or queue them while inside sequence().
+
+        Args:
+            events: List of (keycode, pressed) tuples
+        """
+        if self._buffer is not None:
+            self._buffer.extend(events)
+        elif len(events) == 1:
+            self._connection.send_key_event(*events[0])
+        else:
+            self._connection.send_key_events(events)
+
+    def _hotkey_events(
+        self, modifier_codes: Sequence[int], main_code: int
+    ) -> List[Tuple[int, bool]]:
+        """Build the key events for one hotkey combination.
+
+        Args:
+            modifier_codes: Modifier KEYSYMs in press order
+            main_code: Main key KEYSYM
+
+        Returns:
+            Modifier downs, main key down/up, then modifier ups in reverse
+        """
+        events = [(code, True) for code in modifier_codes]
+        events.append((main_code, True))
+        events.append((main_code, False))
+        events.extend((code, False) for code in reversed(modifier_codes))
+        return events
+
+    def _resolve_hotkey(
+        self, keys: Sequence[Union[str, int]]
+    ) -> Tuple[Tuple[int, ...], int]:
+        """Validate a hotkey combination and convert it to X11 KEYSYMs.
+
+        Results are cached per combination, so repeated shortcuts skip the
+        name lookups and validation.
+
+        Args:
+            keys: Key names/codes, modifiers first, then main key
+
+        Returns:
+            Tuple of (modifier KEYSYMs, main key KEYSYM)
+
+        Raises:
+            VNCInputError: If keys are invalid or no main key provided
+        """
+        cache_key = tuple(keys)
+        cached = self._hotkey_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if len(keys) < 2:
+            raise VNCInputError("Hotkey requires at least 2 keys (modifier + main)")
+
+        # Separate modifiers from main key
+        modifier_names = []
+        for key in keys[:-1]:  # All but last are modifiers
+            key_name = key.lower() if isinstance(key, str) else str(key)
+            modifier_names.append(key_name)
+
+        main_key = keys[-1]  # Last key is main key
+
+        # Validate modifiers
+        for mod_name in modifier_names:
+            if mod_name not in self.MODIFIER_KEYS:
+                raise VNCInputError(f"Invalid modifier key: {mod_name}")
+
+        # Get key codes
+        modifier_codes = []
+        for mod_name in modifier_names:
+            code = self._get_keycode(mod_name)
+            if code is None:
+                raise VNCInputError(f"Unknown modifier key: {mod_name}")
+            modifier_codes.append(code)
+
+        main_code = self._get_keycode(main_key)
+        if main_code is None:
+            raise VNCInputError(f"Unknown main key: {main_key}")
+
+        resolved = (tuple(modifier_codes), main_code)
+        if len(self._hotkey_cache) < self.HOTKEY_CACHE_SIZE:
+            self._hotkey_cache[cache_key] = resolved
+        return resolved
+
+    def _resolve_text(self, text: str) -> List[int]:
+        """Convert each character of text to its X11 KEYSYM.
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            List of KEYSYM values, one per character
+
+        Raises:
+            VNCInputError: If text contains unsupported characters
+        """
+        keycodes = []
+        for char in text:
+            keycode = self._get_keycode(char)
+            if keycode is None:
+                raise VNCInputError(f"Unsupported character: '{char}'")
+            keycodes.append(keycode)
+        return keycodes
+
+    def _is_pasteable(self, text: str) -> bool:
+        """Check whether text can be sent as RFB clipboard data.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            True if text is Latin-1 encodable, as ClientCutText requires
+        """
+        try:
+            text.encode("latin-1")
+        except UnicodeEncodeError:
+            return False
+        return True
+
+    def _resolve_intervals(
+        self, interval: Union[float, Sequence[float]], count: int
+    ) -> Optional[List[float]]:
+        """Expand an interval argument into one pause per character.
+
+        Args:
+            interval: Single pause or sequence of pauses in seconds
+            count: Number of characters being typed
+
+        Returns:
+            List of pauses, or None if characters should be sent as one batch
+
+        Raises:
+            VNCInputError: If the sequence length does not match count
+        """
+        if isinstance(interval, (int, float)):
+            if interval <= 0:
+                return None
+            return [float(interval)] * count
+
+        pauses = [float(pause) for pause in interval]
+        if len(pauses) != count:
+            raise VNCInputError(
+                f"Expected {count} intervals (one per character), got {len(pauses)}"
+            )
+        return pauses
+
     def _apply_delay(self, delay: float) -> None:
         """Apply delay in seconds.
 
         Args:
             delay: Delay duration
         """
-        if delay > 0:
-            time.sleep(delay)
+        if delay > 0 and self._buffer is None:
+            precise_sleep(delay)
@@ -23,14 +23,20 @@ Example:
     With timing control:
         mouse.left_click(100, 100, delay=0.5)  # 500ms delay
         position = mouse.get_position()
+
+    Several operations in one write:
+        with mouse.sequence():
+            mouse.left_click(100, 100)
+            mouse.right_click(200, 200)
 """
 
-import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
 
 from ..types.common import Position, MouseButton
 from ..exceptions import VNCInputError
 from .base_connection import VNCConnectionBase
+from .timing import precise_sleep
 
 
 class MouseController:
@@ -45,6 +51,8 @@ class MouseController:
         self._connection = connection
         self._current_position: Position = (0, 0)
         self._button_mask = 0
+        # Pointer events collected inside sequence(), None when not buffering
+        self._buffer: Optional[List[Tuple[int, int, int]]] = None
 
     def left_click(
         self, x: Optional[int] = None, y: Optional[int] = None, delay: float = 0
@@ -113,7 +121,7 @@ class MouseController:
         self._validate_coordinates(x, y)
 
         # Send pointer event with no button press (button_mask=0)
-        self._connection.send_pointer_event(x, y, 0)
+        self._send(x, y, 0)
 
         # Update current position
         self._current_position = (x, y)
@@ -138,38 +146,97 @@ class MouseController:
         start_x, start_y = self._current_position
 
         # Press left button down at current position
-        self._connection.send_pointer_event(
-            start_x, start_y, 1 << MouseButton.LEFT.value
-        )
+        self._send(start_x, start_y, 1 << MouseButton.LEFT.value)
         self._button_mask |= 1 << MouseButton.LEFT.value
 
-        # Calculate drag path (simple linear interpolation)
+        # Calculate the whole drag path up front so the send loop only sleeps
         steps = max(1, int(duration * 10))  # 10 steps per second
-        for i in range(steps + 1):
-            t = i / steps
-            current_x = int(start_x + (x - start_x) * t)
-            current_y = int(start_y + (y - start_y) * t)
+        path = self._interpolate_path((start_x, start_y), (x, y), steps)
+        step_delay = duration / steps
+        send = self._send
+        button_mask = self._button_mask
 
-            self._connection.send_pointer_event(current_x, current_y, self._button_mask)
+        for i, (current_x, current_y) in enumerate(path):
+            send(current_x, current_y, button_mask)
 
             if i < steps:  # Don't sleep on last step
-                time.sleep(duration / steps)
+                self._apply_delay(step_delay)
 
         # Release button at final position
-        self._connection.send_pointer_event(x, y, 0)
+        self._send(x, y, 0)
         self._button_mask = 0
         self._current_position = (x, y)
 
         self._apply_delay(delay)
 
+    @contextmanager
+    def sequence(self) -> Iterator["MouseController"]:
+        """Collect mouse operations and send them to the server in one batch.
+
+        Inside the block, left_click(), right_click(), double_click(),
+        move_to() and drag_to() queue their pointer events instead of sending
+        them, and their delays and pauses are skipped (a drag jumps through
+        its path at once). The queued events are sent with a single write
+        when the block exits normally; if the block raises, they are
+        discarded. Nested sequences join the outermost one.
+
+        Yields:
+            This controller
+
+        Raises:
+            VNCStateError: If not connected when the batch is sent
+
+        Example:
+            with mouse.sequence():
+                mouse.left_click(100, 100)
+                mouse.double_click(150, 150)
+        """
+        if self._buffer is not None:
+            yield self
+            return
+
+        self._buffer = []
+        try:
+            yield self
+            events = self._buffer
+        finally:
+            self._buffer = None
+
+        if events:
+            self._connection.send_pointer_events(events)
+
     def get_position(self) -> Position:
         """Get current mouse position.
 
+        The position is the last one sent by this controller, so no request
+        is made to the server.
+
         Returns:
             Tuple of (x, y) coordinates
         """
         return self._current_position
 
+    def _interpolate_path(
+        self, start: Position, end: Position, steps: int
+    ) -> List[Position]:
+        """Linearly interpolate pointer positions between two points.
+
+        Args:
+            start: Starting (x, y) position
+            end: Final (x, y) position
+            steps: Number of segments in the path
+
+        Returns:
+            List of steps + 1 positions, from start to end inclusive
+        """
+        start_x, start_y = start
+        dx = end[0] - start_x
+        dy = end[1] - start_y
+        return [
+            (int(start_x + dx * i / steps), int(start_y + dy * i / steps))
+            for i in range(steps + 1)
+        ]
+
     def _click(
         self, button: MouseButton, x: Optional[int], y: Optional[int], delay: float
     ) -> None:
@@ -194,19 +261,19 @@ class MouseController:
 
         # Move to position if different from current
         if (click_x, click_y) != self._current_position:
-            self._connection.send_pointer_event(click_x, click_y, 0)
+            self._send(click_x, click_y, 0)
             self._current_position = (click_x, click_y)
 
         # Press button down
         button_mask = 1 << button.value
-        self._connection.send_pointer_event(click_x, click_y, button_mask)
+        self._send(click_x, click_y, button_mask)
         self._button_mask |= button_mask
 
         # Small delay for realistic click
-        time.sleep(0.01)
+        self._apply_delay(0.01)
 
         # Release button
-        self._connection.send_pointer_event(click_x, click_y, 0)
+        self._send(click_x, click_y, 0)
         self._button_mask = 0
 
         self._apply_delay(delay)
@@ -221,18 +288,32 @@ class MouseController:
         Raises:
             VNCInputError: If coordinates are invalid
         """
-        if x < 0 or y < 0:
-            raise VNCInputError(f"Coordinates must be non-negative: ({x}, {y})")
-
-        # VNC coordinates are 16-bit unsigned (0-65535)
-        if x > 65535 or y > 65535:
+        # VNC coordinates are 16-bit unsigned (0-65535). Negative values and
+        # values above 65535 both have bits set above the low 16, so valid
+        # coordinates pass with a single test.
+        if (x | y) & ~0xFFFF:
+            if x < 0 or y < 0:
+                raise VNCInputError(f"Coordinates must be non-negative: ({x}, {y})")
             raise VNCInputError(f"Coordinates must be <= 65535: ({x}, {y})")
 
+    def _send(self, x: int, y: int, button_mask: int) -> None:
+        """Send a pointer event, or queue it while inside sequence().
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            button_mask: Button state mask
+        """
+        if self._buffer is not None:
+            self._buffer.append((x, y, button_mask))
+        else:
+            self._connection.send_pointer_event(x, y, button_mask)
+
     def _apply_delay(self, delay: float) -> None:
         """Apply delay in seconds.
 
         Args:
             delay: Delay duration
         """
-        if delay > 0:
-            time.sleep(delay)
+        if delay > 0 and self._buffer is None:
+            precise_sleep(delay)
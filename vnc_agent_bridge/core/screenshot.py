@@ -33,20 +33,36 @@ Example:
             )
 """
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from typing import Any
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 try:
     from PIL import Image
 except ImportError:
     Image = None  # type: ignore
 
-from ..types.common import ImageFormat
+from ..types.common import ImageFormat, PathType
 from .framebuffer import FramebufferManager
 from .base_connection import VNCConnectionBase
 from ..exceptions import VNCInputError
 
+# (x, y, width, height) of a screen region
+Region = Tuple[int, int, int, int]
+# (x, y, width, height, pixel_data) as returned by read_framebuffer_update()
+Rectangle = Tuple[int, int, int, int, bytes]
+
+# zlib level for PNG files: screen content compresses well even at the
+# fastest level, which encodes several times faster than Pillow's default 6
+PNG_COMPRESS_LEVEL = 1
+
+# Threads used to encode several images at once (Pillow's encoders release
+# the GIL, so the encodes run in parallel)
+MAX_ENCODER_THREADS = min(4, os.cpu_count() or 1)
+
 
 class ScreenshotController:
     """Handles screenshot capture operations."""
@@ -63,12 +79,20 @@ class ScreenshotController:
         self.connection = connection
         self.framebuffer = framebuffer
 
-    def capture(self, incremental: bool = False, delay: float = 0) -> Any:
+    def capture(
+        self, incremental: bool = False, delay: float = 0, copy: bool = True
+    ) -> Any:
         """Capture current screen as numpy array.
 
+        With copy=False the result is a read-only view of the framebuffer
+        instead of a copy of the whole screen. It is only valid until the
+        next capture, so use it for data that is consumed right away (for
+        example encoded to a file).
+
         Args:
             incremental: Use incremental update (faster) or full refresh
             delay: Wait time before capture in seconds
+            copy: Return an independent copy of the screen (default True)
 
         Returns:
             RGBA numpy array with shape (height, width, 4)
@@ -80,21 +104,11 @@ class ScreenshotController:
         if delay > 0:
             time.sleep(delay)
 
-        # Initialize framebuffer if not already done
-        if not self.framebuffer.is_initialized:
-            self.framebuffer.initialize_buffer()
+        # Request framebuffer update, then read and apply the reply
+        self._issue_request(incremental=incremental)
+        self._read_and_decode()
 
-        # Request framebuffer update
-        self.framebuffer.request_update(incremental=incremental)
-
-        # Read update from server
-        rectangles = self.connection.read_framebuffer_update()
-
-        # Process the update
-        self.framebuffer.process_update(rectangles)
-
-        # Return copy of framebuffer
-        return self.framebuffer.get_buffer()
+        return self.framebuffer.get_buffer(copy=copy)
 
     def capture_region(
         self, x: int, y: int, width: int, height: int, delay: float = 0
@@ -115,44 +129,63 @@ class ScreenshotController:
             VNCInputError: If coordinates are invalid
             ValueError: If region extends beyond framebuffer bounds
         """
-        # Validate coordinates
-        if x < 0 or y < 0 or width <= 0 or height <= 0:
-            raise VNCInputError(
-                f"Invalid region coordinates: x={x}, y={y}, "
-                f"width={width}, height={height}"
-            )
-
-        if x + width > self.framebuffer.width or y + height > self.framebuffer.height:
-            raise VNCInputError(
-                f"Region extends beyond framebuffer bounds: "
-                f"({x}, {y}, {width}, {height}) "
-                f"exceeds ({self.framebuffer.width}, {self.framebuffer.height})"
-            )
+        self._validate_region(x, y, width, height)
 
         if delay > 0:
             time.sleep(delay)
 
-        # Initialize framebuffer if not already done
-        if not self.framebuffer.is_initialized:
-            self.framebuffer.initialize_buffer()
+        # Request update for specific region, then read and apply the reply
+        self._issue_request(incremental=False, x=x, y=y, width=width, height=height)
+        self._read_and_decode()
 
-        # Request update for specific region
-        self.framebuffer.request_update(
-            incremental=False, x=x, y=y, width=width, height=height
-        )
+        # Return region from framebuffer
+        return self.framebuffer.get_region(x, y, width, height)
 
-        # Read update from server
-        rectangles = self.connection.read_framebuffer_update()
+    def capture_regions(self, regions: Sequence[Region], delay: float = 0) -> List[Any]:
+        """Capture several screen regions with pipelined update requests.
 
-        # Process the update
-        self.framebuffer.process_update(rectangles)
+        All update requests are sent before the first reply is read, so the
+        regions cost one network round trip in total instead of one each.
 
-        # Return region from framebuffer
-        return self.framebuffer.get_region(x, y, width, height)
+        Args:
+            regions: Sequence of (x, y, width, height) tuples
+            delay: Wait time before capture in seconds
+
+        Returns:
+            List of RGBA numpy arrays, one per region, in the given order
+
+        Raises:
+            VNCInputError: If any region is invalid (nothing is requested)
+        """
+        for x, y, width, height in regions:
+            self._validate_region(x, y, width, height)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        for x, y, width, height in regions:
+            self._issue_request(incremental=False, x=x, y=y, width=width, height=height)
+
+        # The server may answer several requests with one update, so stop
+        # reading once every region has been received
+        pending = [
+            (region, np.zeros((region[3], region[2]), dtype=bool)) for region in regions
+        ]
+        for _ in regions:
+            rectangles = self._read_and_decode()
+            pending = [
+                (region, mask)
+                for region, mask in pending
+                if not self._mark_covered(region, mask, rectangles)
+            ]
+            if not pending:
+                break
+
+        return [self.framebuffer.get_region(*region) for region in regions]
 
     def save(
         self,
-        filepath: str,
+        filepath: PathType,
         format: ImageFormat = ImageFormat.PNG,
         incremental: bool = False,
         delay: float = 0,
@@ -160,7 +193,7 @@ class ScreenshotController:
         """Capture and save screenshot to file.
 
         Args:
-            filepath: Output file path
+            filepath: Output file path (str or pathlib.Path)
             format: Image format (PNG, JPEG, BMP)
             incremental: Use incremental update for faster capture
             delay: Wait time before capture in seconds
@@ -170,15 +203,15 @@ class ScreenshotController:
             OSError: If file cannot be written
             Exception: If image conversion fails
         """
-        # Capture screenshot
-        array = self.capture(incremental=incremental, delay=delay)
+        # Capture screenshot (encoded right away, so no copy is needed)
+        array = self.capture(incremental=incremental, delay=delay, copy=False)
 
         # Convert and save
-        self._save_array(array, filepath, format)
+        self.save_array(array, filepath, format)
 
     def save_region(
         self,
-        filepath: str,
+        filepath: PathType,
         x: int,
         y: int,
         width: int,
@@ -189,7 +222,7 @@ class ScreenshotController:
         """Capture and save screen region to file.
 
         Args:
-            filepath: Output file path
+            filepath: Output file path (str or pathlib.Path)
             x: Top-left X coordinate
             y: Top-left Y coordinate
             width: Region width in pixels
@@ -206,7 +239,88 @@ class ScreenshotController:
         array = self.capture_region(x, y, width, height, delay=delay)
 
         # Convert and save
-        self._save_array(array, filepath, format)
+        self.save_array(array, filepath, format)
+
+    def save_regions(
+        self,
+        regions: Mapping[PathType, Region],
+        format: ImageFormat = ImageFormat.PNG,
+        delay: float = 0,
+    ) -> None:
+        """Capture several screen regions and save each to a file.
+
+        The regions are captured with capture_regions(), so all update
+        requests are pipelined, and the images are encoded in parallel on up
+        to MAX_ENCODER_THREADS threads. Returns once every file is written.
+
+        Args:
+            regions: Mapping of output file path to (x, y, width, height)
+            format: Image format (PNG, JPEG, BMP)
+            delay: Wait time before capture in seconds
+
+        Raises:
+            VNCInputError: If any region is invalid (nothing is captured)
+            OSError: If a file cannot be written
+        """
+        arrays = self.capture_regions(list(regions.values()), delay=delay)
+        self.save_arrays(list(zip(regions, arrays)), format)
+
+    def save_array(
+        self, array: Any, filepath: PathType, format: ImageFormat = ImageFormat.PNG
+    ) -> None:
+        """Save a numpy array to a file on the calling thread.
+
+        Uses the same encoder options as save() (PNG_COMPRESS_LEVEL, JPEG
+        without alpha). Use save_arrays() to encode several arrays at once.
+
+        Args:
+            array: RGBA numpy array
+            filepath: Output file path (str or pathlib.Path)
+            format: Image format
+
+        Raises:
+            ImportError: If PIL/Pillow not installed
+            OSError: If file cannot be written
+        """
+        pil_image = self._to_encoder_image(array, format)
+        format_str = self._get_format_string(format)
+
+        # Save to file
+        pil_image.save(filepath, format=format_str, **self._save_options(format))
+
+    def save_arrays(
+        self,
+        items: Sequence[Tuple[PathType, Any]],
+        format: ImageFormat = ImageFormat.PNG,
+    ) -> None:
+        """Save several numpy arrays to files, encoding them in parallel.
+
+        Uses up to MAX_ENCODER_THREADS threads and returns once every file
+        is written. A single array is saved on the calling thread.
+
+        Args:
+            items: (filepath, RGBA numpy array) pairs
+            format: Image format
+
+        Raises:
+            ImportError: If PIL/Pillow not installed
+            OSError: If a file cannot be written (raised after the other
+                files are written)
+        """
+        workers = min(len(items), MAX_ENCODER_THREADS)
+        if workers <= 1:
+            for filepath, array in items:
+                self.save_array(array, filepath, format)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self.save_array, array, filepath, format)
+                for filepath, array in items
+            ]
+            # Raise the first failure after all encodes have finished
+            for future in futures:
+                future.result()
 
     def to_pil_image(self, array: Any) -> Any:
         """Convert numpy array to PIL Image.
@@ -257,57 +371,131 @@ class ScreenshotController:
             ImportError: If PIL/Pillow not installed
             ValueError: If array has invalid shape or dtype
         """
-        # Convert to PIL Image
-        pil_image = self.to_pil_image(array)
-
-        # Get format string
+        pil_image = self._to_encoder_image(array, format)
         format_str = self._get_format_string(format)
 
-        # JPEG doesn't support RGBA, convert to RGB
-        if format == ImageFormat.JPEG and pil_image.mode == "RGBA":
-            # Create white background
-            if Image is None:
-                raise ImportError("Pillow is required for image conversion")
-            background = Image.new("RGB", pil_image.size, (255, 255, 255))
-            background.paste(pil_image, mask=pil_image.split()[3])  # Use alpha channel
-            pil_image = background
-
         # Save to bytes buffer
         import io
 
         buffer = io.BytesIO()
-        pil_image.save(buffer, format=format_str)
+        pil_image.save(buffer, format=format_str, **self._save_options(format))
         return buffer.getvalue()
 
-    def _save_array(self, array: Any, filepath: str, format: ImageFormat) -> None:
-        """Save numpy array to file.
+    def _validate_region(self, x: int, y: int, width: int, height: int) -> None:
+        """Check that a region is non-empty and inside the framebuffer.
+
+        The region must fit within framebuffer.width by framebuffer.height
+        pixels.
+
+        Args:
+            x: Top-left X coordinate
+            y: Top-left Y coordinate
+            width: Region width in pixels
+            height: Region height in pixels
+
+        Raises:
+            VNCInputError: If x or y is negative, width or height is not
+                positive, or the region extends beyond the framebuffer
+        """
+        if x < 0 or y < 0 or width <= 0 or height <= 0:
+            raise VNCInputError(
+                f"Invalid region coordinates: x={x}, y={y}, "
+                f"width={width}, height={height}"
+            )
+
+        if x + width > self.framebuffer.width or y + height > self.framebuffer.height:
+            raise VNCInputError(
+                f"Region extends beyond framebuffer bounds: "
+                f"({x}, {y}, {width}, {height}) "
+                f"exceeds ({self.framebuffer.width}, {self.framebuffer.height})"
+            )
+
+    def _issue_request(self, incremental: bool, **region: int) -> None:
+        """Send a framebuffer update request without waiting for the reply.
+
+        Args:
+            incremental: Use incremental update or full refresh
+            **region: Optional x, y, width and height of the update region
+        """
+        # Initialize framebuffer if not already done
+        if not self.framebuffer.is_initialized:
+            self.framebuffer.initialize_buffer()
+
+        self.framebuffer.request_update(incremental=incremental, **region)
+
+    def _read_and_decode(self) -> List[Rectangle]:
+        """Read one framebuffer update and apply it to the framebuffer.
+
+        Returns:
+            The rectangles received
+        """
+        rectangles = self.connection.read_framebuffer_update()
+        self.framebuffer.process_update(rectangles)
+        return rectangles
+
+    @staticmethod
+    def _mark_covered(region: Region, mask: Any, rectangles: List[Rectangle]) -> bool:
+        """Mark the parts of a region covered by received rectangles.
+
+        Args:
+            region: (x, y, width, height) of the requested region
+            mask: Boolean array of the region's pixels received so far
+            rectangles: Rectangles of the latest update
+
+        Returns:
+            True once the whole region has been received
+        """
+        x, y, width, height = region
+        for rx, ry, rw, rh, _ in rectangles:
+            left, top = max(rx, x), max(ry, y)
+            right, bottom = min(rx + rw, x + width), min(ry + rh, y + height)
+            if left < right and top < bottom:
+                mask[top - y : bottom - y, left - x : right - x] = True
+        return bool(mask.all())
+
+    def _to_encoder_image(self, array: Any, format: ImageFormat) -> Any:
+        """Convert numpy array to a PIL Image the format's encoder accepts.
+
+        JPEG has no alpha channel. Opaque images (every framebuffer capture)
+        simply drop it; others are composited onto a white background.
 
         Args:
             array: RGBA numpy array
-            filepath: Output file path
             format: Image format
 
+        Returns:
+            PIL Image object
+
         Raises:
             ImportError: If PIL/Pillow not installed
-            OSError: If file cannot be written
+            ValueError: If array has invalid shape or dtype
         """
-        # Convert to PIL Image
         pil_image = self.to_pil_image(array)
+        if format != ImageFormat.JPEG or pil_image.mode != "RGBA":
+            return pil_image
 
-        # Get format string
-        format_str = self._get_format_string(format)
+        # Dropping the channel is a plain copy, far cheaper than a masked paste
+        if np.all(array[..., 3] == 255):
+            return pil_image.convert("RGB")
 
-        # JPEG doesn't support RGBA, convert to RGB
-        if format == ImageFormat.JPEG and pil_image.mode == "RGBA":
-            # Create white background
-            if Image is None:
-                raise ImportError("Pillow is required for image conversion")
-            background = Image.new("RGB", pil_image.size, (255, 255, 255))
-            background.paste(pil_image, mask=pil_image.split()[3])  # Use alpha channel
-            pil_image = background
+        if Image is None:
+            raise ImportError("Pillow is required for image conversion")
+        background = Image.new("RGB", pil_image.size, (255, 255, 255))
+        background.paste(pil_image, mask=pil_image.split()[3])  # Use alpha channel
+        return background
 
-        # Save to file
-        pil_image.save(filepath, format=format_str)
+    def _save_options(self, format: ImageFormat) -> Dict[str, Any]:
+        """Get PIL encoder options for an image format.
+
+        Args:
+            format: ImageFormat enum value
+
+        Returns:
+            Keyword arguments for PIL Image.save()
+        """
+        if format == ImageFormat.PNG:
+            return {"compress_level": PNG_COMPRESS_LEVEL}
+        return {}
 
     def _get_format_string(self, format: ImageFormat) -> str:
         """Get PIL format string from ImageFormat enum.
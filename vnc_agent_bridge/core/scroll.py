@@ -4,8 +4,8 @@ This module provides the ScrollController class for controlling mouse wheel
 scrolling operations on a remote VNC server. It supports scrolling up, down,
 and at specific screen positions.
 
-The scroll operations are implemented using VNC button events (buttons 3 and 4
-are typically mapped to scroll down and scroll up respectively in VNC).
+The scroll operations are implemented using VNC button events: each wheel tick
+is a press and release of button 4 (scroll up) or button 5 (scroll down).
 
 All methods support an optional delay parameter for timing control.
 
@@ -20,18 +20,28 @@ Example:
 
     With timing control:
         scroll.scroll_down(amount=3, delay=0.5)
+
+    Several scrolls in one write:
+        scroll.batch([("up", 2), ("down", 2)])
 """
 
-import time
+from typing import List, Sequence, Tuple, Union
 
-from ..types.common import ScrollDirection
+from ..types.common import Position, ScrollDirection
 from ..exceptions import VNCInputError
 from .base_connection import VNCConnectionBase
+from .timing import precise_sleep
 
 
 class ScrollController:
     """Control mouse wheel scrolling operations."""
 
+    # Pointer button masks for the wheel (RFB buttons 4 and 5)
+    WHEEL_MASKS = {
+        ScrollDirection.UP: 1 << 3,
+        ScrollDirection.DOWN: 1 << 4,
+    }
+
     def __init__(self, connection: VNCConnectionBase) -> None:
         """Initialize with VNC connection.
 
@@ -39,6 +49,8 @@ class ScrollController:
             connection: VNCConnectionBase instance for protocol communication
         """
         self._connection = connection
+        # Pointer position scroll events are sent at (set by scroll_to)
+        self._position: Position = (0, 0)
 
     def scroll_up(self, amount: int = 3, delay: float = 0) -> None:
         """Scroll up using mouse wheel.
@@ -62,7 +74,7 @@ class ScrollController:
         # Send scroll up events (button 4 in VNC protocol)
         for _ in range(amount):
             self._send_scroll_event(ScrollDirection.UP)
-            time.sleep(0.01)  # Small delay between scroll events
+            precise_sleep(0.01)  # Small delay between scroll events
 
         self._apply_delay(delay)
 
@@ -85,10 +97,10 @@ class ScrollController:
         if amount < 0:
             raise VNCInputError(f"Scroll amount must be non-negative: {amount}")
 
-        # Send scroll down events (button 3 in VNC protocol)
+        # Send scroll down events (button 5 in VNC protocol)
         for _ in range(amount):
             self._send_scroll_event(ScrollDirection.DOWN)
-            time.sleep(0.01)  # Small delay between scroll events
+            precise_sleep(0.01)  # Small delay between scroll events
 
         self._apply_delay(delay)
 
@@ -113,19 +125,95 @@ class ScrollController:
 
         # Move to position first
         self._connection.send_pointer_event(x, y, 0)
+        self._position = (x, y)
 
         # Perform scroll down at position (default 3 steps)
         self.scroll_down(3, delay)
 
+    def batch(
+        self,
+        ops: Sequence[Tuple[Union[ScrollDirection, str], int]],
+        delay: float = 0,
+    ) -> None:
+        """Perform several scroll operations in a single write.
+
+        All operations are validated before anything is sent. The wheel
+        events are then sent back to back, without the short pause
+        scroll_up() and scroll_down() insert between steps.
+
+        Args:
+            ops: Sequence of (direction, amount) pairs, where direction is a
+                ScrollDirection or "up"/"down"
+            delay: Delay in seconds after operation
+
+        Raises:
+            VNCInputError: If a direction is unknown or an amount is negative
+            VNCStateError: If not connected
+
+        Example:
+            batch([("up", 2), ("down", 2)])
+        """
+        from ..exceptions import VNCStateError
+
+        if not self._connection.is_connected:
+            raise VNCStateError("Not connected to VNC server")
+
+        steps: List[ScrollDirection] = []
+        for direction, amount in ops:
+            if amount < 0:
+                raise VNCInputError(f"Scroll amount must be non-negative: {amount}")
+            steps.extend([self._resolve_direction(direction)] * amount)
+
+        events: List[Tuple[int, int, int]] = []
+        for direction in steps:
+            events.extend(self._scroll_events(direction))
+
+        if events:
+            self._connection.send_pointer_events(events)
+
+        self._apply_delay(delay)
+
     def _send_scroll_event(self, direction: ScrollDirection) -> None:
-        """Send scroll button event.
+        """Send one wheel tick (button press and release).
 
         Args:
             direction: Scroll direction (UP or DOWN)
         """
-        # VNC scroll buttons: 3=down, 4=up
-        button = direction.value  # ScrollDirection.UP=4, ScrollDirection.DOWN=3
-        self._connection.send_pointer_event(0, 0, button)
+        for x, y, button_mask in self._scroll_events(direction):
+            self._connection.send_pointer_event(x, y, button_mask)
+
+    def _scroll_events(self, direction: ScrollDirection) -> List[Tuple[int, int, int]]:
+        """Build the pointer events for one wheel tick.
+
+        Args:
+            direction: Scroll direction (UP or DOWN)
+
+        Returns:
+            Press and release events at the current scroll position
+        """
+        x, y = self._position
+        return [(x, y, self.WHEEL_MASKS[direction]), (x, y, 0)]
+
+    def _resolve_direction(
+        self, direction: Union[ScrollDirection, str]
+    ) -> ScrollDirection:
+        """Convert a direction name to ScrollDirection.
+
+        Args:
+            direction: ScrollDirection or "up"/"down"
+
+        Returns:
+            ScrollDirection value
+
+        Raises:
+            VNCInputError: If the direction is unknown
+        """
+        if isinstance(direction, ScrollDirection):
+            return direction
+        try:
+            return ScrollDirection[direction.upper()]
+        except (AttributeError, KeyError):
+            raise VNCInputError(f"Unknown scroll direction: {direction}")
 
     def _validate_coordinates(self, x: int, y: int) -> None:
         """Validate coordinates.
@@ -137,11 +225,12 @@ class ScrollController:
         Raises:
             VNCInputError: If coordinates are invalid
         """
-        if x < 0 or y < 0:
-            raise VNCInputError(f"Coordinates must be non-negative: ({x}, {y})")
-
-        # VNC coordinates are 16-bit unsigned (0-65535)
-        if x > 65535 or y > 65535:
+        # VNC coordinates are 16-bit unsigned (0-65535). Negative values and
+        # values above 65535 both have bits set above the low 16, so valid
+        # coordinates pass with a single test.
+        if (x | y) & ~0xFFFF:
+            if x < 0 or y < 0:
+                raise VNCInputError(f"Coordinates must be non-negative: ({x}, {y})")
             raise VNCInputError(f"Coordinates must be <= 65535: ({x}, {y})")
 
     def _apply_delay(self, delay: float) -> None:
@@ -151,4 +240,4 @@ class ScrollController:
             delay: Delay duration
         """
         if delay > 0:
-            time.sleep(delay)
+            precise_sleep(delay)
@@ -0,0 +1,34 @@
+"""Timing helpers for input controllers.
+
+time.sleep() typically wakes up late by up to a few milliseconds, which
+adds up over short inter-event delays. precise_sleep() sleeps for most of
+the requested duration and spins on the high-resolution clock for the
+remainder.
+
+Example:
+    Pause for 10 milliseconds between key events:
+        precise_sleep(0.01)
+"""
+
+import time
+
+# Final stretch of a delay that is busy-waited instead of slept
+SPIN_THRESHOLD = 0.002
+
+
+def precise_sleep(seconds: float) -> None:
+    """Block for the given duration with sub-millisecond accuracy.
+
+    Args:
+        seconds: Duration in seconds (values <= 0 return immediately)
+    """
+    if seconds <= 0:
+        return
+
+    deadline = time.perf_counter() + seconds
+    coarse = seconds - SPIN_THRESHOLD
+    if coarse > 0:
+        time.sleep(coarse)
+
+    while time.perf_counter() < deadline:
+        pass
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import queue
 import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, List, Optional
 
+import numpy as np
+
 from vnc_agent_bridge.exceptions import (
     VNCInputError,
     VNCStateError,
+    VNCTimeoutError,
 )
 from vnc_agent_bridge.types.common import (
     ImageFormat,
+    PathType,
     VideoFrame,
 )
 
@@ -21,6 +26,12 @@ if TYPE_CHECKING:
     from vnc_agent_bridge.core.framebuffer import FramebufferManager
     from vnc_agent_bridge.core.screenshot import ScreenshotController
 
+# Frames waiting to be written when recording straight to disk
+STREAM_QUEUE_SIZE = 4
+
+# Seconds to wait for the server to confirm the ContinuousUpdates extension
+CONTINUOUS_UPDATES_TIMEOUT = 1.0
+
 
 class VideoRecorder:
     """Records screen sessions as video frames."""
@@ -50,26 +61,53 @@ class VideoRecorder:
         self._recording_thread: Optional[threading.Thread] = None
         self._should_stop_recording = False
         self._frame_count = 0
+        self._continuous = False
+        # Notified whenever a frame is stored or recording stops
+        self._frame_condition = threading.Condition()
+
+        # Streaming to disk: capture thread -> bounded queue -> encoder thread
+        self._stream_queue: Optional[queue.Queue[Optional[VideoFrame]]] = None
+        self._encoder_thread: Optional[threading.Thread] = None
+        self._stream_error: Optional[Exception] = None
 
     def record(
         self,
         duration: float,
         fps: float = 30.0,
         delay: float = 0,
+        output_dir: Optional[PathType] = None,
+        prefix: str = "frame",
+        format: ImageFormat = ImageFormat.PNG,
+        continuous: bool = False,
     ) -> List[VideoFrame]:
         """Record screen for specified duration.
 
+        With output_dir set, frames are written to disk by an encoder thread
+        while recording, as with start_recording(), and the returned frames
+        carry only their timestamp and frame number (data is None).
+
+        With continuous=True the frames come from server-streamed updates,
+        as with start_recording(continuous=True), so no frame waits for a
+        FramebufferUpdateRequest round trip.
+
         Args:
             duration: Recording duration in seconds
             fps: Target frames per second (default 30.0)
             delay: Wait time before starting (default 0)
+            output_dir: Write frames to this directory instead of keeping
+                them in memory (default None)
+            prefix: Filename prefix for streamed frames (default "frame")
+            format: Image format for streamed frames (default PNG)
+            continuous: Use server-streamed updates (default False)
 
         Returns:
             List of VideoFrame objects
 
         Raises:
             VNCInputError: If parameters invalid (duration <= 0, fps <= 0)
-            VNCStateError: If not connected to VNC server
+            VNCStateError: If not connected to VNC server, or output_dir is
+                given during background recording
+            OSError: If output_dir cannot be created or a frame not written
         """
         if delay > 0:
             time.sleep(delay)
@@ -82,38 +120,58 @@ class VideoRecorder:
         if not self._connection.is_connected:
             raise VNCStateError("Not connected to VNC server")
 
+        if continuous:
+            # The stream is read on the background recording thread
+            self.start_recording(
+                fps=fps,
+                continuous=True,
+                output_dir=output_dir,
+                prefix=prefix,
+                format=format,
+            )
+            time.sleep(duration)
+            return self.stop_recording()
+
+        if output_dir is not None:
+            if self._is_recording:
+                raise VNCStateError("Already recording")
+            self._start_writer(Path(output_dir), prefix, format)
+
         # Record frames for specified duration
         frames: List[VideoFrame] = []
         start_time = time.time()
         frame_num = 0
         interval = 1.0 / fps
 
-        while time.time() - start_time < duration:
-            frame_start = time.time()
-            timestamp = frame_start - start_time
+        try:
+            while time.time() - start_time < duration:
+                frame_start = time.time()
+                timestamp = frame_start - start_time
 
-            try:
-                # Capture frame
-                frame_data = self._screenshot.capture(incremental=True)
+                try:
+                    # Capture frame
+                    frame_data = self._screenshot.capture(incremental=True)
 
-                # Create VideoFrame object
-                frame = VideoFrame(
-                    timestamp=timestamp,
-                    data=frame_data,
-                    frame_number=frame_num,
-                )
-                frames.append(frame)
-                frame_num += 1
+                    # Create VideoFrame object
+                    frame = VideoFrame(
+                        timestamp=timestamp,
+                        data=frame_data,
+                        frame_number=frame_num,
+                    )
+                    frames.append(self._stream_frame(frame))
+                    frame_num += 1
 
-                # Maintain FPS by sleeping appropriate time
-                elapsed = time.time() - frame_start
-                sleep_time = max(0, interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    # Maintain FPS by sleeping appropriate time
+                    elapsed = time.time() - frame_start
+                    sleep_time = max(0, interval - elapsed)
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
 
-            except Exception:
-                # Continue recording on capture error
-                continue
+                except Exception:
+                    # Continue recording on capture error
+                    continue
+        finally:
+            self._stop_encoder()
 
         return frames
 
@@ -196,22 +254,53 @@ class VideoRecorder:
         self,
         fps: float = 30.0,
         delay: float = 0,
+        continuous: bool = False,
+        output_dir: Optional[PathType] = None,
+        prefix: str = "frame",
+        format: ImageFormat = ImageFormat.PNG,
+        on_frame: Optional[Callable[[VideoFrame], None]] = None,
     ) -> None:
         """Start recording in background thread.
 
+        With continuous=True the server is asked to stream framebuffer
+        updates (RFB ContinuousUpdates and Fence extensions) instead of
+        answering one FramebufferUpdateRequest per frame, which removes a
+        network round trip from every frame. The stream is only enabled once
+        the server confirms the extension with EndOfContinuousUpdates
+        (within CONTINUOUS_UPDATES_TIMEOUT); otherwise frames are requested
+        one at a time as with continuous=False.
+
+        With output_dir set, frames are written to disk by an encoder thread
+        while recording (named as by save_frames()) instead of being kept in
+        memory. With on_frame set, each frame is passed to that callable on
+        the encoder thread instead (for example to feed a video encoder). In
+        both cases at most STREAM_QUEUE_SIZE frames are held at a time;
+        capture waits for the encoder when it falls behind.
+
         Args:
             fps: Target frames per second (default 30.0)
             delay: Wait time before starting (default 0)
+            continuous: Use server-streamed updates (default False)
+            output_dir: Directory to stream frames to (default None, keep
+                frames in memory)
+            prefix: Filename prefix for streamed frames (default "frame")
+            format: Image format for streamed frames (default PNG)
+            on_frame: Called with each captured frame on the encoder thread
+                (default None, keep frames in memory)
 
         Raises:
-            VNCInputError: If parameters invalid
+            VNCInputError: If parameters invalid or both output_dir and
+                on_frame are given
             VNCStateError: If already recording or not connected
+            OSError: If output_dir cannot be created
         """
         if self._is_recording:
             raise VNCStateError("Already recording")
 
         if fps <= 0:
             raise VNCInputError(f"FPS must be positive: {fps}")
+        if output_dir is not None and on_frame is not None:
+            raise VNCInputError("Pass either output_dir or on_frame, not both")
 
         if not self._connection.is_connected:
             raise VNCStateError("Not connected to VNC server")
@@ -219,11 +308,25 @@ class VideoRecorder:
         self._frames = []
         self._frame_count = 0
         self._should_stop_recording = False
+        self._continuous = continuous
+        self._stream_error = None
+
+        if output_dir is not None:
+            self._start_writer(Path(output_dir), prefix, format)
+        elif on_frame is not None:
+            self._start_encoder(on_frame)
+
+        if continuous:
+            self._continuous = self._start_continuous_updates()
+
         self._is_recording = True
+        self._connection.background_reader = True
 
         # Start recording thread
         self._recording_thread = threading.Thread(
-            target=self._recording_worker,
+            target=(
+                self._continuous_worker if self._continuous else self._recording_worker
+            ),
             args=(fps, delay),
             daemon=False,
         )
@@ -232,22 +335,43 @@ class VideoRecorder:
     def stop_recording(self) -> List[VideoFrame]:
         """Stop background recording and return frames.
 
+        When recording to an output directory or on_frame callable, this
+        waits until every frame is handled; the returned frames then carry
+        only their timestamp and frame number (data is None).
+
         Returns:
             List of VideoFrame objects captured
 
         Raises:
             VNCStateError: If not currently recording
+            OSError: If a streamed frame could not be written
+            VNCConnectionError: If reading the update stream failed
+            Exception: The first exception raised by on_frame
         """
         if not self._is_recording:
             raise VNCStateError("Not currently recording")
 
         self._should_stop_recording = True
 
+        if self._continuous and self._connection.is_connected:
+            # Stopping the stream also wakes the worker blocked on a read
+            self._connection.enable_continuous_updates(
+                False, 0, 0, self._framebuffer.width, self._framebuffer.height
+            )
+
         # Wait for recording thread to finish
         if self._recording_thread is not None:
             self._recording_thread.join(timeout=10.0)
 
-        self._is_recording = False
+        with self._frame_condition:
+            self._is_recording = False
+            self._frame_condition.notify_all()
+        self._connection.background_reader = False
+
+        self._stop_encoder()
+        if self._stream_error is not None:
+            error, self._stream_error = self._stream_error, None
+            raise error
         return self._frames.copy()
 
     def is_recording(self) -> bool:
@@ -261,7 +385,7 @@ class VideoRecorder:
     def save_frames(
         self,
         frames: List[VideoFrame],
-        directory: str,
+        directory: PathType,
         prefix: str = "frame",
         format: ImageFormat = ImageFormat.PNG,
     ) -> None:
@@ -274,26 +398,81 @@ class VideoRecorder:
             format: Image format (default PNG)
 
         Raises:
-            VNCInputError: If parameters invalid
+            VNCInputError: If frames is empty or a frame has no pixel data
+                (it was recorded to an output directory)
             OSError: If directory creation or file write fails
         """
-        if not frames:
-            raise VNCInputError("No frames to save")
+        self._check_frame_data(frames)
 
         # Create directory if needed
         output_dir = Path(directory)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save each frame
-        for frame in frames:
-            filename = f"{prefix}_{frame.frame_number:06d}.{format.value}"
-            filepath = output_dir / filename
+        # Encode the frames in parallel
+        self._screenshot.save_arrays(
+            [
+                (self._frame_path(output_dir, prefix, frame, format), frame.data)
+                for frame in frames
+            ],
+            format,
+        )
 
-            # Use screenshot's helper to convert and save
-            self._screenshot.save(
-                str(filepath),
-                format=format,
+    def save_archive(self, frames: List[VideoFrame], path: PathType) -> None:
+        """Save frames to a single compressed NumPy archive (.npz).
+
+        One file holds the pixels, timestamps and frame numbers of every
+        frame, so a recording costs one file instead of one per frame and
+        loses nothing. Read it back with load_archive(). NumPy appends
+        ".npz" to paths without that suffix.
+
+        Args:
+            frames: List of VideoFrame objects of the same size
+            path: Output file path
+
+        Raises:
+            VNCInputError: If frames is empty, a frame has no pixel data or
+                the frames differ in size
+            OSError: If directory creation or file write fails
+        """
+        self._check_frame_data(frames)
+        if len({frame.data.shape for frame in frames}) > 1:
+            raise VNCInputError("Frames differ in size and cannot be archived")
+
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            output,
+            data=np.stack([frame.data for frame in frames]),
+            timestamps=np.array([frame.timestamp for frame in frames]),
+            frame_numbers=np.array([frame.frame_number for frame in frames]),
+        )
+
+    def load_archive(self, path: PathType) -> List[VideoFrame]:
+        """Load frames saved by save_archive().
+
+        Args:
+            path: Archive file path
+
+        Returns:
+            List of VideoFrame objects in recorded order
+
+        Raises:
+            OSError: If the file cannot be read
+            KeyError: If the file is not a frame archive
+        """
+        with np.load(Path(path)) as archive:
+            data = archive["data"]
+            timestamps = archive["timestamps"]
+            frame_numbers = archive["frame_numbers"]
+
+        return [
+            VideoFrame(
+                timestamp=float(timestamp),
+                data=pixels,
+                frame_number=int(frame_number),
             )
+            for pixels, timestamp, frame_number in zip(data, timestamps, frame_numbers)
+        ]
 
     def get_frame_rate(self, frames: List[VideoFrame]) -> float:
         """Calculate actual frame rate from recorded frames.
@@ -346,6 +525,54 @@ class VideoRecorder:
         """
         return self._frame_count
 
+    def wait_for_frames(self, count: int, timeout: float = 1.0) -> bool:
+        """Wait until background recording has stored a number of frames.
+
+        Returns as soon as the frames are captured instead of after a fixed
+        sleep. To wait for frames after an action, add to frame_count:
+
+            keyboard.type_text("hello")
+            video.wait_for_frames(video.frame_count + 5, timeout=2.0)
+
+        Args:
+            count: Total number of frames (as counted by frame_count)
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if frame_count reached count, False on timeout or if
+            recording stopped first
+
+        Raises:
+            VNCInputError: If timeout is negative
+        """
+        if timeout < 0:
+            raise VNCInputError("Timeout cannot be negative")
+
+        with self._frame_condition:
+            self._frame_condition.wait_for(
+                lambda: self._frame_count >= count or not self._is_recording,
+                timeout,
+            )
+            return self._frame_count >= count
+
+    def _check_frame_data(self, frames: List[VideoFrame]) -> None:
+        """Check that there are frames to save and all carry pixel data.
+
+        Args:
+            frames: List of VideoFrame objects
+
+        Raises:
+            VNCInputError: If frames is empty or a frame has no pixel data
+                (it was recorded to an output directory)
+        """
+        if not frames:
+            raise VNCInputError("No frames to save")
+        for frame in frames:
+            if frame.data is None:
+                raise VNCInputError(
+                    f"Frame {frame.frame_number} has no pixel data to save"
+                )
+
     def _recording_worker(self, fps: float, delay: float) -> None:
         """Background thread worker for continuous recording.
 
@@ -375,8 +602,7 @@ class VideoRecorder:
                         data=frame_data,
                         frame_number=frame_num,
                     )
-                    self._frames.append(frame)
-                    self._frame_count += 1
+                    self._store_frame(frame)
                     frame_num += 1
 
                 except Exception:
@@ -392,3 +618,253 @@ class VideoRecorder:
         except Exception:
             # Silently fail in background thread
             pass
+
+    def _store_frame(self, frame: VideoFrame) -> None:
+        """Keep a frame captured by the background recording thread.
+
+        Args:
+            frame: Captured frame
+        """
+        kept = self._stream_frame(frame)
+        with self._frame_condition:
+            self._frames.append(kept)
+            self._frame_count += 1
+            self._frame_condition.notify_all()
+
+    def _stream_frame(self, frame: VideoFrame) -> VideoFrame:
+        """Hand a frame to the encoder thread if one is running.
+
+        Args:
+            frame: Captured frame
+
+        Returns:
+            The frame to keep: the frame itself, or a copy without pixel
+            data once the encoder thread has taken it
+        """
+        if self._stream_queue is None:
+            return frame
+
+        # The encoder thread gets the pixels; only the timing is kept
+        self._stream_queue.put(frame)
+        return VideoFrame(
+            timestamp=frame.timestamp,
+            data=None,
+            frame_number=frame.frame_number,
+        )
+
+    def _start_writer(self, directory: Path, prefix: str, format: ImageFormat) -> None:
+        """Start an encoder thread that writes frames to a directory.
+
+        Args:
+            directory: Output directory (created if needed)
+            prefix: Filename prefix
+            format: Image format
+
+        Raises:
+            OSError: If directory creation fails
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self._start_encoder(
+            lambda frame: self._write_frame(frame, directory, prefix, format)
+        )
+
+    def _start_encoder(self, handler: Callable[[VideoFrame], None]) -> None:
+        """Start the thread that hands streamed frames to a handler.
+
+        Args:
+            handler: Called with each frame on the encoder thread
+        """
+        self._stream_queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self._encoder_thread = threading.Thread(
+            target=self._encode_worker,
+            args=(self._stream_queue, handler),
+            daemon=False,
+        )
+        self._encoder_thread.start()
+
+    def _stop_encoder(self) -> None:
+        """Wait for the encoder thread to handle all queued frames.
+
+        Does nothing if no encoder thread is running.
+
+        Raises:
+            Exception: The first error raised while handling a frame
+        """
+        if self._stream_queue is None:
+            return
+
+        # Let the encoder drain the queue, then stop at the sentinel
+        self._stream_queue.put(None)
+        if self._encoder_thread is not None:
+            self._encoder_thread.join()
+        self._stream_queue = None
+        self._encoder_thread = None
+
+        if self._stream_error is not None:
+            error, self._stream_error = self._stream_error, None
+            raise error
+
+    def _encode_worker(
+        self,
+        stream_queue: queue.Queue[Optional[VideoFrame]],
+        handler: Callable[[VideoFrame], None],
+    ) -> None:
+        """Background thread worker that hands queued frames to a handler.
+
+        Runs until it receives None. After a handler error the remaining
+        frames are still taken from the queue (so capture never blocks) but
+        dropped; the error is raised by stop_recording().
+
+        Args:
+            stream_queue: Queue of frames to handle
+            handler: Called with each frame
+        """
+        while True:
+            frame = stream_queue.get()
+            if frame is None:
+                break
+            if self._stream_error is not None:
+                continue
+
+            try:
+                handler(frame)
+            except Exception as e:
+                self._stream_error = e
+
+    def _write_frame(
+        self, frame: VideoFrame, directory: Path, prefix: str, format: ImageFormat
+    ) -> None:
+        """Write one streamed frame to disk.
+
+        Args:
+            frame: Frame to write
+            directory: Output directory
+            prefix: Filename prefix
+            format: Image format
+        """
+        filepath = self._frame_path(directory, prefix, frame, format)
+        self._screenshot.save_array(frame.data, filepath, format)
+
+    @staticmethod
+    def _frame_path(
+        directory: Path, prefix: str, frame: VideoFrame, format: ImageFormat
+    ) -> Path:
+        """Get the file path of a saved frame.
+
+        Args:
+            directory: Output directory
+            prefix: Filename prefix
+            frame: Frame to save
+            format: Image format
+
+        Returns:
+            Path like directory/prefix_000042.png
+        """
+        return directory / f"{prefix}_{frame.frame_number:06d}.{format.value}"
+
+    def _start_continuous_updates(self) -> bool:
+        """Advertise the streaming extensions and enable continuous updates.
+
+        A server that supports ContinuousUpdates confirms it by sending
+        EndOfContinuousUpdates in reply to SetEncodings. Only then is a full
+        framebuffer update requested (so the first frame is complete, not
+        just the regions that change later) and the stream enabled.
+
+        Returns:
+            True if continuous updates were enabled, False if the server did
+            not confirm the extension
+        """
+        if not self._framebuffer.is_initialized:
+            self._framebuffer.initialize_buffer()
+
+        encodings = [
+            self._connection.ENCODING_RAW,
+            self._connection.ENCODING_CONTINUOUS_UPDATES,
+            self._connection.ENCODING_FENCE,
+        ]
+        if self._connection.extended_clipboard:
+            # SetEncodings replaces the list; keep the clipboard extension
+            encodings.append(self._connection.ENCODING_EXTENDED_CLIPBOARD)
+        self._connection.set_encodings(encodings)
+        if not self._wait_for_continuous_updates():
+            return False
+
+        self._framebuffer.request_update(incremental=False)
+        self._connection.enable_continuous_updates(
+            True, 0, 0, self._framebuffer.width, self._framebuffer.height
+        )
+        return True
+
+    def _wait_for_continuous_updates(self) -> bool:
+        """Wait for the server to confirm the ContinuousUpdates extension.
+
+        Messages that arrive first (such as the server's Fence request) are
+        handled as they are read.
+
+        Returns:
+            True if EndOfContinuousUpdates arrived within
+            CONTINUOUS_UPDATES_TIMEOUT
+        """
+        deadline = time.monotonic() + CONTINUOUS_UPDATES_TIMEOUT
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                rectangles = self._connection.read_server_message(timeout=remaining)
+            except VNCTimeoutError:
+                return False
+            if rectangles is None:
+                continue
+            if not rectangles:
+                return True
+            self._framebuffer.process_update(rectangles)
+
+    def _continuous_worker(self, fps: float, delay: float) -> None:
+        """Background thread worker for server-streamed recording.
+
+        Every update is applied to the framebuffer, but a frame is only
+        stored once per interval so the recording keeps the target FPS.
+
+        Args:
+            fps: Target frames per second
+            delay: Initial delay before starting
+        """
+        try:
+            if delay > 0:
+                time.sleep(delay)
+
+            interval = 1.0 / fps
+            frame_num = 0
+            start_time = time.time()
+            next_frame_time = start_time
+
+            while not self._should_stop_recording:
+                try:
+                    rectangles = self._connection.read_framebuffer_update()
+                except VNCTimeoutError:
+                    # An idle screen sends no updates
+                    continue
+                if not rectangles:
+                    # EndOfContinuousUpdates or an empty update
+                    continue
+
+                self._framebuffer.process_update(rectangles)
+
+                now = time.time()
+                if now < next_frame_time:
+                    continue
+
+                frame = VideoFrame(
+                    timestamp=now - start_time,
+                    data=self._framebuffer.get_buffer(),
+                    frame_number=frame_num,
+                )
+                self._store_frame(frame)
+                frame_num += 1
+                next_frame_time = now + interval
+
+        except Exception as e:
+            # Raised by stop_recording(), unless a frame handler failed first
+            if self._stream_error is None:
+                self._stream_error = e
@@ -23,6 +23,7 @@ Example:
         button = MouseButton.LEFT
 """
 
+import os
 from enum import IntEnum, Enum
 from typing import Tuple, Union, TYPE_CHECKING, Any
 from dataclasses import dataclass
@@ -73,6 +74,9 @@ KeyType = Union[str, int]
 # Button type for mouse operations
 ButtonType = Union[str, int, MouseButton]
 
+# Path type for file output (str or pathlib.Path)
+PathType = Union[str, "os.PathLike[str]"]
+
 
 # Image formats for screenshot export
 class ImageFormat(str, Enum):
@@ -119,6 +123,7 @@ __all__ = [
     "DelayType",
     "KeyType",
     "ButtonType",
+    "PathType",
     "ImageFormat",
     "FrameData",
     "ImageType",